@@ -0,0 +1,6 @@
+# benchmarks/__init__.py
+
+"""
+noon_noon 성능 측정 스크립트 모음.
+사용법: python -m benchmarks.<모듈 이름>
+"""
@@ -0,0 +1,61 @@
+# benchmarks/bench_boot.py
+"""
+부팅 시간을 단계별로 측정합니다. 매번 새 파이썬 프로세스에서 실행하여 모듈 캐시의 영향을 없애고, 중앙값을 출력합니다.
+- import core: Pygame 없이 순수 로직 모듈(model, engine, transition, presets, effects)만 임포트
+- import Noon: from noon import Noon (컨트롤러와 Pygame 렌더링 백엔드)
+- Noon(): 창 생성(dummy 드라이버)까지 포함한 컨트롤러 생성, first frame: 첫 step()
+- pygame.init() / pygame.display.init(): 모든 서브시스템 초기화와 비디오만 초기화하는 경우의 비교
+사용법: python -m benchmarks.bench_boot [반복 횟수]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BOOT_SCRIPT = """
+import json, sys, time
+t0 = time.perf_counter()
+import noon.model, noon.engine, noon.transition, noon.presets, noon.effects
+t1 = time.perf_counter()
+core_has_pygame = "pygame" in sys.modules
+from noon import Noon
+t2 = time.perf_counter()
+eyes = Noon(width=800, height=400)
+t3 = time.perf_counter()
+eyes.step()
+t4 = time.perf_counter()
+print(json.dumps({"import core": t1 - t0, "import Noon": t2 - t1, "Noon()": t3 - t2, "first frame": t4 - t3,
+                  "total": t4 - t0, "core_has_pygame": core_has_pygame}))
+"""
+
+INIT_SCRIPT = """
+import json, time
+import pygame
+t0 = time.perf_counter()
+{call}
+print(json.dumps({{"{call}": time.perf_counter() - t0}}))
+"""
+
+def run_script(source: str) -> dict:
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    output = subprocess.run([sys.executable, "-c", source], env=env, capture_output=True, text=True, check=True)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+def collect(source: str, repeat: int) -> dict:
+    runs = [run_script(source) for _ in range(repeat)]
+    return {key: [run[key] for run in runs] for key in runs[0]}
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    boot = collect(BOOT_SCRIPT, repeat)
+    print(f"core modules import pygame: {any(boot.pop('core_has_pygame'))}")
+    print(f"{'phase':>24} {'median ms':>10}")
+    for phase, samples in boot.items():
+        print(f"{phase:>24} {statistics.median(samples) * 1000:10.2f}")
+    for call in ("pygame.init()", "pygame.display.init()"):
+        samples = collect(INIT_SCRIPT.format(call=call), repeat)[call]
+        print(f"{call:>24} {statistics.median(samples) * 1000:10.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# benchmarks/bench_control_server.py
+"""
+루프백 소켓 제어 서버의 명령→픽셀 지연과 최대 지속 메시지 처리율을 측정합니다.
+- latency: 클라이언트가 필드 쓰기를 보낸 시점부터, 그 값이 반영된 프레임이 출력 대상(sink)에 전달될 때까지의 시간
+  (headless Noon을 start()로 백그라운드에서 60fps로 실행)
+- rate: 클라이언트가 최대 속도로 보낸 메시지 중 서버가 받아 큐에 넣은 초당 메시지 수와 손실률
+사용법: python -m benchmarks.bench_control_server [측정 횟수]
+"""
+import os
+import sys
+import tempfile
+import time
+import statistics
+
+from noon import Noon
+from noon.server import ControlServer, ControlClient, encode_field
+
+class PresentProbe:
+    """ 프레임이 출력될 때의 시각과 gaze_x 값을 기록하는 출력 대상. """
+    def __init__(self, state):
+        self.state = state
+        self.presented = [] # (시각, gaze_x)
+
+    def present(self, surface, rects):
+        self.presented.append((time.perf_counter(), self.state.gaze_x))
+
+def measure_latency(address, samples):
+    eyes = Noon(320, 160, headless=True)
+    probe = PresentProbe(eyes.state)
+    eyes.add_sink(probe)
+    server = ControlServer(eyes, address)
+    server.start()
+    client = ControlClient(server.address)
+    eyes.start()
+    latencies = []
+    try:
+        for i in range(samples):
+            value = 0.5 if i % 2 else -0.5
+            sent = time.perf_counter()
+            client.set_field("gaze_x", value)
+            deadline = sent + 1.0
+            while time.perf_counter() < deadline:
+                shown = next((t for t, gaze in reversed(probe.presented) if t >= sent and gaze == value), None)
+                if shown is not None:
+                    latencies.append((shown - sent) * 1000)
+                    break
+                time.sleep(0.0005)
+            time.sleep(0.02) # 다음 측정 전에 한 프레임 이상 쉬어 유휴 상태에서 깨어나는 경우도 포함
+    finally:
+        eyes.stop()
+        server.stop()
+        client.close()
+    return latencies
+
+def measure_rate(address, duration=1.0):
+    eyes = Noon(320, 160, headless=True)
+    server = ControlServer(eyes, address)
+    server.start()
+    client = ControlClient(server.address)
+    eyes.start()
+    message = encode_field("gaze_x", 0.25)
+    sent = 0
+    try:
+        start = time.perf_counter()
+        while time.perf_counter() - start < duration:
+            for _ in range(100):
+                try:
+                    client.send(message)
+                    sent += 1
+                except BlockingIOError:
+                    pass # Unix 데이터그램 소켓은 수신 버퍼가 차면 거부
+        elapsed = time.perf_counter() - start
+        time.sleep(0.2)
+        received = server.messages
+        coalesced = eyes.commands.coalesced
+    finally:
+        eyes.stop()
+        server.stop()
+        client.close()
+    return received / elapsed, 1 - received / sent if sent else 0.0, coalesced / max(received, 1)
+
+def main():
+    samples = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    addresses = {
+        "udp": ("127.0.0.1", 0),
+        "unix": os.path.join(tempfile.mkdtemp(), "noon.sock"),
+    }
+    print(f"{'socket':>6} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} {'msg/s':>10} {'loss %':>7} {'merged %':>9}")
+    for name, address in addresses.items():
+        latencies = sorted(measure_latency(address, samples))
+        rate, loss, merged = measure_rate(address)
+        p95 = latencies[int(len(latencies) * 0.95)]
+        print(f"{name:>6} {statistics.median(latencies):8.3f} {p95:8.3f} {latencies[-1]:8.3f} "
+              f"{rate:10.0f} {loss * 100:7.1f} {merged * 100:9.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# benchmarks/bench_dirty_rects.py
+"""
+전체 다시 그리기(fill + flip)와 dirty rect 모드(부분 fill + display.update)의 프레임 시간을 비교합니다.
+dummy 드라이버에서는 화면 전송 비용이 0에 가까우므로, 실제 패널에서의 전송량을 가늠할 수 있도록
+프레임당 전송 픽셀 비율(push %)도 함께 출력합니다.
+사용법: python -m benchmarks.bench_dirty_rects [프레임 수]
+"""
+import os
+import sys
+import time
+import statistics
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from noon.engine import NoonEngine
+from noon.face import NoonFaceRenderer
+from noon.model import NoonState
+
+RESOLUTIONS = [(240, 240), (800, 400), (1920, 1080)]
+
+def measure(width, height, dirty_rects, frames):
+    """ 시선이 천천히 움직이고 떨림이 있는 상태로 frames 만큼 그리며 프레임 시간(ms)을 측정합니다. """
+    screen = pygame.display.set_mode((width, height))
+    renderer = NoonFaceRenderer(screen, NoonEngine(width, height), dirty_rects=dirty_rects)
+    state = NoonState()
+    samples = []
+    pushed = 0
+    for i in range(frames):
+        state.gaze_x = ((i % 120) - 60) / 120
+        state.shake_x = (i % 5) - 2
+        start = time.perf_counter()
+        rects = renderer.draw(state)
+        if dirty_rects:
+            pygame.display.update(rects)
+        else:
+            pygame.display.flip()
+        samples.append((time.perf_counter() - start) * 1000)
+        pushed += sum(r.w * r.h for r in rects)
+    return samples, pushed / (frames * width * height) * 100
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    pygame.display.init()
+    print(f"{'resolution':>12} {'mode':>6} {'mean ms':>8} {'p50 ms':>8} {'p95 ms':>8} {'push %':>7}")
+    for width, height in RESOLUTIONS:
+        for dirty_rects in (False, True):
+            samples, pushed = measure(width, height, dirty_rects, frames)
+            samples.sort()
+            p95 = samples[int(len(samples) * 0.95)]
+            mode = "dirty" if dirty_rects else "full"
+            print(f"{width}x{height:<7} {mode:>6} {statistics.mean(samples):8.3f} {statistics.median(samples):8.3f} {p95:8.3f} {pushed:7.1f}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
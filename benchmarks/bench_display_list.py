@@ -0,0 +1,62 @@
+# benchmarks/bench_display_list.py
+"""
+디스플레이 리스트 백엔드별 프레임당 비용과, 같은 목록을 건너뛰는 효과를 측정합니다.
+- build: 상태에서 디스플레이 리스트를 만드는 비용
+- pygame / numpy / svg: 매 프레임 시선이 바뀌는 목록을 각 백엔드로 그리는(변환하는) 비용
+- step redraw / step skip: 화면이 멈춰 있는 headless step()을 매번 다시 그릴 때와, 같은 목록을 건너뛸 때
+사용법: python -m benchmarks.bench_display_list [프레임 수]
+"""
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from noon import Noon
+from noon.display_list import build_display_list, NumpyRasterizer, to_svg
+from noon.engine import NoonEngine
+from noon.face import NoonFaceRenderer
+from noon.model import NoonState
+
+SIZE = (800, 400)
+
+def timed(func, frames):
+    samples = []
+    for i in range(frames):
+        start = time.perf_counter()
+        func(i)
+        samples.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(samples)
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    engine = NoonEngine(*SIZE)
+    state = NoonState(eyelid_top=0.2)
+    lists = []
+    for i in range(frames):
+        state.gaze_x = ((i % 120) - 60) / 120
+        lists.append(build_display_list(engine, state))
+
+    renderer = NoonFaceRenderer(pygame.Surface(SIZE, 0, 32), engine)
+    rasterizer = NumpyRasterizer(*SIZE)
+    results = {
+        "build": timed(lambda i: build_display_list(engine, state), frames),
+        "pygame": timed(lambda i: renderer.draw_list(lists[i]), frames),
+        "numpy": timed(lambda i: rasterizer.render(lists[i]), frames),
+        "svg": timed(lambda i: to_svg(lists[i]), frames),
+    }
+
+    eyes = Noon(*SIZE, headless=True)
+    def redraw(i):
+        eyes.renderer.invalidate()
+        eyes.step(0.0)
+    results["step redraw"] = timed(redraw, frames)
+    results["step skip"] = timed(lambda i: eyes.step(0.0), frames)
+
+    for name, value in results.items():
+        print(f"{name:>12} {value:9.1f} us")
+
+if __name__ == "__main__":
+    main()
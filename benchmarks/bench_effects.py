@@ -0,0 +1,55 @@
+# benchmarks/bench_effects.py
+"""
+프레임당 동적 효과 처리 비용을 효과 레지스트리 크기별로 비교합니다.
+- legacy: 매 프레임 프리셋을 스캔하고 params dict를 새로 만들어 'apply' 핸들러를 부르는 기존 방식
+- compiled: set_emotion 시 한 번 컴파일한 EffectPlan을 실제 핸들러(EFFECT_HANDLER_MAP)로 실행하는 방식
+사용법: python -m benchmarks.bench_effects [반복 횟수]
+"""
+import random
+import sys
+import timeit
+
+from noon.effects import EFFECT_HANDLER_MAP, EffectPlan, clear_shake
+from noon.model import NoonState
+
+REGISTRY_SIZES = [1, 10, 100, 1000]
+
+def legacy_shake(state, intensity: float):
+    """ 컴파일 이전의 떨림 핸들러: 매 프레임 두 축의 난수를 새로 뽑습니다. """
+    state.shake_x = random.uniform(-intensity, intensity)
+    state.shake_y = random.uniform(-intensity, intensity)
+
+def build_registry(size, shake):
+    """ 'shake' 핸들러와, 이미 멈춰 있는 더미 효과 size-1개로 레지스트리를 만듭니다. """
+    registry = {"shake": shake}
+    for i in range(size - 1):
+        registry[f"dummy_{i}"] = {"apply": lambda state, **params: None, "clear": lambda state: True}
+    return registry
+
+def legacy_frame(state, effects, registry):
+    """ 컴파일 이전 Noon._handle_dynamic_effects와 같은 처리. """
+    active_effects = {effect['type'] for effect in effects}
+    for effect_type, handler in registry.items():
+        if effect_type in active_effects:
+            preset_effect = next((e for e in effects if e['type'] == effect_type), None)
+            if preset_effect:
+                params = {k: v for k, v in preset_effect.items() if k != 'type'}
+                handler['apply'](state, **params)
+        elif 'clear' in handler:
+            handler['clear'](state)
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    effects = [{"type": "shake", "intensity": 2.0}]
+    state = NoonState()
+    print(f"{'registry':>9} {'legacy us':>10} {'compiled us':>12}")
+    for size in REGISTRY_SIZES:
+        legacy_registry = build_registry(size, {"apply": legacy_shake, "clear": clear_shake})
+        plan = EffectPlan(effects, build_registry(size, EFFECT_HANDLER_MAP["shake"]), rng=random.Random(0))
+        plan.run(state) # 첫 스텝에서 이미 멈춘 clear 핸들러가 계획에서 빠집니다.
+        legacy = timeit.timeit(lambda: legacy_frame(state, effects, legacy_registry), number=number)
+        compiled = timeit.timeit(lambda: plan.run(state), number=number)
+        print(f"{size:>9} {legacy / number * 1e6:10.3f} {compiled / number * 1e6:12.3f}")
+
+if __name__ == "__main__":
+    main()
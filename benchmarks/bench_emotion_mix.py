@@ -0,0 +1,43 @@
+# benchmarks/bench_emotion_mix.py
+"""
+set_emotion_mix 한 번의 비용을 측정합니다. (대화 시스템이 초당 여러 번 감정 비율을 바꾸는 경우)
+- set_emotion: 기존 프리셋 전환 (비교 기준)
+- mix: 매번 다른 비율로 섞기 (프리셋 행렬 가중합 + 효과 세기 갱신)
+- mix + step: 섞은 뒤 한 스텝 시뮬레이션까지
+사용법: python -m benchmarks.bench_emotion_mix [호출 수]
+"""
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from noon import Noon
+
+def timed(func, calls):
+    samples = []
+    for i in range(calls):
+        start = time.perf_counter()
+        func(i)
+        samples.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(samples)
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    eyes = Noon(800, 400, headless=True, seed=0)
+    mixes = [{"angry": (i % 100) / 100, "neutral": 1.0 - (i % 100) / 100 + 0.01} for i in range(calls)]
+    results = {
+        "set_emotion": timed(lambda i: eyes._set_emotion("angry" if i % 2 else "neutral"), calls),
+        "mix": timed(lambda i: eyes._set_emotion_mix(mixes[i]), calls),
+    }
+    def mix_and_step(i):
+        eyes.set_emotion_mix(mixes[i])
+        eyes.step(1 / 60)
+    results["mix + step"] = timed(mix_and_step, calls)
+
+    for name, value in results.items():
+        print(f"{name:>12} {value:9.1f} us")
+
+if __name__ == "__main__":
+    main()
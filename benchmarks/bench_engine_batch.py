@@ -0,0 +1,33 @@
+# benchmarks/bench_engine_batch.py
+"""
+여러 얼굴의 눈 좌표/크기를 스칼라 메소드 반복 호출과 배치 메소드로 계산하는 시간을 비교합니다.
+사용법: python -m benchmarks.bench_engine_batch
+"""
+import timeit
+
+import numpy as np
+from noon.engine import NoonEngine
+from noon.model import NoonState, stack_states
+
+FACE_COUNTS = [1, 10, 100, 1000]
+
+def scalar_tick(engine, states):
+    for state in states:
+        engine.get_eye_center(False, state)
+        engine.get_eye_center(True, state)
+        engine.get_eye_dimensions(state)
+
+def main():
+    engine = NoonEngine(800, 400)
+    rng = np.random.default_rng(0)
+    print(f"{'faces':>6} {'scalar us':>10} {'batch us':>9}")
+    for count in FACE_COUNTS:
+        states = [NoonState(gaze_x=gx, gaze_y=gy) for gx, gy in rng.uniform(-1, 1, size=(count, 2))]
+        matrix = stack_states(states)
+        number = max(1, 20000 // count)
+        scalar = timeit.timeit(lambda: scalar_tick(engine, states), number=number) / number
+        batch = timeit.timeit(lambda: engine.get_geometry_batch(matrix), number=number) / number
+        print(f"{count:>6} {scalar * 1e6:10.1f} {batch * 1e6:9.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# benchmarks/bench_eyelids.py
+"""
+눈 깜빡임(blink 클립)을 반복 재생하며 눈꺼풀 가림 마스크 캐시 유무에 따른 프레임 시간을 비교합니다.
+- no-cache: 마스크 캐시 용량을 0으로 두어 매 프레임 마스크를 새로 만드는 방식
+- cached: 기본 캐시 (한 번 만든 깊이별 마스크를 재사용)
+- open: 눈꺼풀을 그리지 않는 기준값
+모든 모드에서 시선을 매 프레임 움직여, 같은 디스플레이 리스트를 건너뛰는 프레임 없이 그리기 비용을 잽니다.
+사용법: python -m benchmarks.bench_eyelids [프레임 수]
+"""
+import sys
+import time
+import statistics
+
+import pygame
+from noon import Noon
+
+RESOLUTIONS = [(240, 240), (800, 400), (1920, 1080)]
+
+def measure(width, height, mode, frames):
+    """ 60fps로 frames 만큼 진행하며 프레임당 update+draw 시간(ms)을 측정합니다. """
+    eyes = Noon(width, height, headless=True)
+    if mode == "no-cache":
+        eyes.renderer.lid_masks.max_bytes = 0
+    samples = []
+    for i in range(frames):
+        if mode != "open" and i % 20 == 0:
+            eyes.play_clip("blink")
+        eyes.state.gaze_x = ((i % 120) - 60) / 120
+        start = time.perf_counter()
+        eyes.update(1 / 60)
+        eyes.draw()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples, eyes.renderer.lid_masks.stats()
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    print(f"{'resolution':>12} {'mode':>9} {'mean ms':>8} {'p95 ms':>8} {'masks':>6} {'hit %':>6}")
+    for width, height in RESOLUTIONS:
+        for mode in ("open", "no-cache", "cached"):
+            samples, stats = measure(width, height, mode, frames)
+            samples.sort()
+            p95 = samples[int(len(samples) * 0.95)]
+            print(f"{width}x{height:<7} {mode:>9} {statistics.mean(samples):8.3f} {p95:8.3f} "
+                  f"{stats['entries']:6d} {stats['hit_rate'] * 100:6.1f}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
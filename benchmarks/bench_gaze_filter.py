@@ -0,0 +1,84 @@
+# benchmarks/bench_gaze_filter.py
+"""
+잡음 섞인 고속 시선 추적 입력을 화면 시선으로 바꾸는 방식들의 정확도와 떨림을 비교합니다.
+가상 시간으로 TRACKER_HZ 추적기(사인파 시선 + 가우시안 잡음 + 가끔 큰 도약)와 60fps 렌더링을 모사합니다.
+- raw: 마지막 샘플을 그대로 시선으로 씀 (떨림이 그대로 보임)
+- lerp: 마지막 샘플을 set_gaze 목표로 두고 기본 반감기로 보간 (기존 방식)
+- filter: GazeFilter (One-Euro + 표시 시점 예측 + 도약)
+- err: 표시 시점의 실제 시선과의 RMS 오차, jitter: 프레임 간 2차 차분의 RMS (둘 다 도약 직후 0.5초 제외)
+- jump ms: 도약 후 실제 시선과의 오차가 0.05 이내로 들어오기까지의 평균 시간, us/frame: 프레임당 처리 시간
+사용법: python -m benchmarks.bench_gaze_filter [시뮬레이션 시간(초)]
+"""
+import math
+import random
+import sys
+import time
+
+from noon.gaze import GazeFilter
+from noon.transition import smoothing_factor, DEFAULT_HALF_LIFE
+
+TRACKER_HZ = 120
+FRAME_TIME = 1 / 60
+NOISE = 0.03
+
+JUMP_PERIOD = 4.0
+
+def true_gaze(t):
+    """ 천천히 좌우로 훑다가 JUMP_PERIOD초마다 반대편으로 도약하는 시선. """
+    jump = 0.5 if int(t / JUMP_PERIOD) % 2 else -0.5
+    return 0.4 * math.sin(2 * math.pi * 0.3 * t) + jump
+
+def simulate(mode, duration, rng):
+    gaze_filter = GazeFilter(saccade_threshold=0.4)
+    follow = smoothing_factor(FRAME_TIME, DEFAULT_HALF_LIFE)
+    shown, errors, tracking = [], [], []
+    jump_settle, jump_start = [], None
+    latest = current = 0.0
+    next_sample = 0.0
+    cost = 0.0
+    frames = int(duration / FRAME_TIME)
+    for frame in range(frames):
+        now = frame * FRAME_TIME
+        batch = []
+        while next_sample <= now:
+            batch.append((next_sample, true_gaze(next_sample) + rng.gauss(0, NOISE), 0.0))
+            next_sample += 1 / TRACKER_HZ
+        latest = batch[-1][1] if batch else latest
+
+        start = time.perf_counter()
+        display_time = now + FRAME_TIME
+        if mode == "raw":
+            current = latest
+        elif mode == "lerp":
+            current += (latest - current) * follow
+        else:
+            gaze_filter.push_many(batch)
+            result = gaze_filter.update(display_time)
+            if result is not None:
+                current = result[0]
+        cost += time.perf_counter() - start
+
+        error = current - true_gaze(display_time)
+        shown.append(current)
+        errors.append(error)
+        tracking.append(display_time % JUMP_PERIOD > 0.5 and display_time > JUMP_PERIOD)
+        if display_time > JUMP_PERIOD and display_time % JUMP_PERIOD < FRAME_TIME:
+            jump_start = display_time - display_time % JUMP_PERIOD
+        if jump_start is not None and abs(error) < 0.05:
+            jump_settle.append(display_time - jump_start)
+            jump_start = None
+
+    rms_error = math.sqrt(sum(e * e for e, ok in zip(errors, tracking) if ok) / sum(tracking))
+    accel = [shown[i + 1] - 2 * shown[i] + shown[i - 1] for i in range(1, len(shown) - 1) if tracking[i - 1]]
+    jitter = math.sqrt(sum(a * a for a in accel) / len(accel))
+    return rms_error, jitter, sum(jump_settle) / len(jump_settle) * 1000, cost / frames * 1e6
+
+def main():
+    duration = float(sys.argv[1]) if len(sys.argv) > 1 else 30.0
+    print(f"{'mode':>7} {'err':>8} {'jitter':>8} {'jump ms':>8} {'us/frame':>9}")
+    for mode in ("raw", "lerp", "filter"):
+        rms_error, jitter, jump, cost = simulate(mode, duration, random.Random(0))
+        print(f"{mode:>7} {rms_error:8.4f} {jitter:8.4f} {jump:8.1f} {cost:9.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# benchmarks/bench_panels.py
+"""
+눈마다 패널이 따로 있을 때 두 패널 전송을 차례로 하는 경우와 패널별 출력 스레드로 겹쳐 하는 경우의 프레임 시간을 비교합니다.
+- spi: 240x240 RGB565 패널 두 개를 40MHz SPI로 보내는 것처럼 전송 바이트에 비례해 블로킹하는 가상 출력 (전송 중 GIL 해제)
+- fb: 패널마다 일반 파일을 /dev/fb 대용으로 쓰는 FramebufferSink
+매 프레임 시선이 바뀌어 양쪽 패널 전체를 다시 보내는 상황입니다.
+사용법: python -m benchmarks.bench_panels [프레임 수]
+"""
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from noon import Noon
+from noon.sinks import FramebufferSink
+
+PANEL = (240, 240)
+SPI_HZ = 40_000_000
+
+class SpiSink:
+    """ SPI 전송 시간만큼 블로킹하는 가상 패널. """
+    def present(self, surface, rects):
+        pixels = sum(rect.w * rect.h for rect in rects)
+        time.sleep(pixels * 2 * 8 / SPI_HZ)
+
+def make_sinks(kind, directory):
+    if kind == "spi":
+        return [SpiSink(), SpiSink()]
+    return [FramebufferSink(os.path.join(directory, f"fb{i}"), *PANEL) for i in range(2)]
+
+def measure(kind, threaded, frames, directory):
+    eyes = Noon(*PANEL, headless=True, seed=0)
+    panels = eyes.enable_panels(PANEL, preview=False)
+    sinks = make_sinks(kind, directory)
+    if threaded:
+        for panel, sink in zip(panels.panels, sinks):
+            panel.add_sink(sink)
+    samples = []
+    for i in range(frames):
+        eyes.set_gaze(((i % 120) - 60) / 60, 0.0)
+        start = time.perf_counter()
+        eyes.step(1 / 60)
+        if not threaded:
+            for panel, sink in zip(panels.panels, sinks):
+                sink.present(panel.surface, panel.rects)
+        samples.append((time.perf_counter() - start) * 1e3)
+    panels.wait()
+    eyes.disable_panels()
+    return statistics.median(samples)
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 120
+    print(f"{'sink':>5} {'serial ms':>10} {'threaded ms':>12}")
+    with tempfile.TemporaryDirectory() as directory:
+        for kind in ("spi", "fb"):
+            measure(kind, True, 10, directory) # 워밍업
+            serial = measure(kind, False, frames, directory)
+            threaded = measure(kind, True, frames, directory)
+            print(f"{kind:>5} {serial:10.2f} {threaded:12.2f}")
+
+if __name__ == "__main__":
+    main()
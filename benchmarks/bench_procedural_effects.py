@@ -0,0 +1,48 @@
+# benchmarks/bench_procedural_effects.py
+"""
+테이블 기반 절차적 효과의 프레임당 비용을 겹쳐 쓴 효과 수별로 측정합니다.
+- uniform: 매 프레임 random.uniform을 두 번 부르는 기존 떨림 (uniform_shake)
+- shake, +blink, +saccade, +breathing: 효과를 하나씩 더 겹친 EffectPlan의 restore() + run()
+- setup: set_emotion 때 한 번 드는 테이블 생성 비용 (네 효과 모두)
+사용법: python -m benchmarks.bench_procedural_effects [반복 횟수]
+"""
+import random
+import sys
+import timeit
+
+from noon.effects import EffectPlan
+from noon.model import NoonState
+
+STACK = [
+    ("shake", {"type": "shake", "intensity": 2.0}),
+    ("+blink", {"type": "blink"}),
+    ("+saccade", {"type": "saccade"}),
+    ("+breathing", {"type": "breathing"}),
+]
+
+def uniform_shake(state, intensity: float, rng=random):
+    """ 테이블 이전의 떨림 효과: 매 프레임 두 축의 난수를 새로 뽑습니다. (비교용) """
+    state.shake_x = rng.uniform(-intensity, intensity)
+    state.shake_y = rng.uniform(-intensity, intensity)
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    state = NoonState()
+    rng = random.Random(0)
+    cost = timeit.timeit(lambda: uniform_shake(state, 2.0, rng), number=number)
+    print(f"{'effects':>10} {'us/frame':>9}")
+    print(f"{'uniform':>10} {cost / number * 1e6:9.3f}")
+    for count, (name, _) in enumerate(STACK, 1):
+        plan = EffectPlan([effect for _, effect in STACK[:count]], rng=rng)
+        values = state.values
+        def frame():
+            plan.restore(values)
+            plan.run(state)
+        cost = timeit.timeit(frame, number=number)
+        print(f"{name:>10} {cost / number * 1e6:9.3f}")
+    effects = [effect for _, effect in STACK]
+    setup = timeit.timeit(lambda: EffectPlan(effects, rng=rng), number=100) / 100
+    print(f"setup: {setup * 1e3:.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# benchmarks/bench_profiler.py
+"""
+프레임 프로파일러가 렌더 루프에 더하는 비용을 측정합니다.
+- off: 프로파일러 없음 (profiler is None 검사만), on: 단계별 기록, overlay: 기록 + 화면 그래프
+- 각 모드로 Noon._frame() + _pace()를 (대기 없이) 반복 실행한 프레임당 시간과, mark() 한 번의 비용을 출력합니다.
+사용법: python -m benchmarks.bench_profiler [프레임 수]
+"""
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from noon import Noon
+from noon.profiler import FrameProfiler
+
+def measure(mode, frames):
+    eyes = Noon(width=800, height=400, headless=True)
+    eyes.fps = 100000 # clock.tick이 기다리지 않도록
+    eyes.max_frame_skip = 0
+    if mode != "off":
+        eyes.enable_profiler(overlay=mode == "overlay")
+    samples = []
+    for i in range(frames):
+        eyes.state.gaze_x = ((i % 120) - 60) / 120 # 매 프레임 다시 그리도록
+        eyes._drawn_snapshot = None
+        start = time.perf_counter()
+        eyes._frame()
+        eyes._pace(False)
+        samples.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(samples)
+
+def mark_cost(count=100000):
+    profiler = FrameProfiler(stages=("a",))
+    profiler.begin_frame()
+    start = time.perf_counter()
+    for _ in range(count):
+        profiler.mark("a")
+    return (time.perf_counter() - start) / count * 1e9
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    print(f"{'mode':>8} {'us/frame':>9}")
+    for mode in ("off", "on", "overlay"):
+        measure(mode, 50) # 워밍업
+        print(f"{mode:>8} {measure(mode, frames):9.1f}")
+    print(f"mark(): {mark_cost():.0f} ns")
+
+if __name__ == "__main__":
+    main()
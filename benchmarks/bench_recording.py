@@ -0,0 +1,64 @@
+# benchmarks/bench_recording.py
+"""
+상태 기록이 프레임 시간에 주는 영향과 기록 파일 크기, 재생 시 임의 프레임 탐색 비용을 측정합니다.
+- step off/on: 800x400 headless에서 기록 없이/기록하며 step()한 프레임당 시간의 중앙값 (떨림 효과로 매 프레임 변화, 5회 중 최솟값)
+- record(): 레코드 하나를 쓰는 비용, MB/hour: 60fps로 매 프레임 기록할 때 한 시간 분량의 크기
+- seek: 메모리 매핑된 기록에서 임의 프레임을 상태로 읽는 비용
+사용법: python -m benchmarks.bench_recording [프레임 수]
+"""
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from noon import Noon
+from noon.recording import StateLog, RECORD, HEADER_SIZE
+
+def step_time(path, frames):
+    eyes = Noon(800, 400, headless=True, seed=0)
+    eyes.set_emotion("angry")
+    if path:
+        eyes.start_recording(path)
+    samples = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        eyes.step(1 / 60)
+        samples.append((time.perf_counter() - start) * 1e6)
+    eyes.stop_recording()
+    return statistics.median(samples)
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.noonlog")
+        step_time(None, 100) # 워밍업
+        # 다른 프로세스의 간섭을 줄이려고 기록 없이/기록하며를 번갈아 여러 번 재고 가장 빠른 회차를 씁니다.
+        rounds = [(step_time(None, frames // 5), step_time(path, frames // 5)) for _ in range(5)]
+        off, on = min(r[0] for r in rounds), min(r[1] for r in rounds)
+        print(f"step off: {off:8.1f} us   on: {on:8.1f} us   ({(on / off - 1) * 100:+.1f}%)")
+
+        eyes = Noon(64, 32, headless=True)
+        recorder = eyes.start_recording(path)
+        count = 100000
+        start = time.perf_counter()
+        for i in range(count):
+            recorder.record(eyes.state, i / 60)
+        cost = (time.perf_counter() - start) / count * 1e9
+        eyes.stop_recording()
+        print(f"record(): {cost:.0f} ns   {RECORD.size} B/frame   {RECORD.size * 60 * 3600 / 1e6:.1f} MB/hour")
+
+        with StateLog(path) as log:
+            assert os.path.getsize(path) == HEADER_SIZE + len(log) * RECORD.size
+            indices = [random.randrange(len(log)) for _ in range(count)]
+            state = eyes.state
+            start = time.perf_counter()
+            for index in indices:
+                log.state(index, state)
+            print(f"seek: {(time.perf_counter() - start) / count * 1e9:.0f} ns/frame over {len(log)} frames")
+
+if __name__ == "__main__":
+    main()
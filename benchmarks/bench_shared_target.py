@@ -0,0 +1,90 @@
+# benchmarks/bench_shared_target.py
+"""
+다른 프로세스가 보낸 시선 목표를 렌더 루프가 받아오는 비용과 지연을 비교합니다.
+- queue: multiprocessing.Queue로 dict를 보내고, 프레임마다 쌓인 것을 모두 꺼내 마지막 값만 쓰는 방식
+- shm: SharedTargetWriter/SharedTargetReader 공유 메모리 블록을 프레임마다 한 번 읽는 방식
+생산자는 PRODUCER_HZ로 값을 쓰고(시각을 gaze_x에 실어 보냄), 소비자는 60fps로 읽습니다.
+- read us: 프레임당 최신 값을 얻는 데 든 시간
+- age ms: 읽은 값이 생산된 뒤 흐른 시간 (렌더링에 반영될 때의 신선도)
+사용법: python -m benchmarks.bench_shared_target [측정 시간(초)]
+"""
+import multiprocessing
+import queue
+import sys
+import time
+import statistics
+
+from noon.shm import SharedTargetWriter, SharedTargetReader
+
+PRODUCER_HZ = [120, 1000]
+FRAME_TIME = 1 / 60
+
+def produce_queue(q, hz, duration):
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        q.put({"gaze_x": time.perf_counter(), "gaze_y": 0.0})
+        time.sleep(1 / hz)
+
+def produce_shm(name, hz, duration):
+    writer = SharedTargetWriter(name)
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        writer.write(gaze_x=time.perf_counter(), gaze_y=0.0)
+        time.sleep(1 / hz)
+    writer.close()
+
+def consume(read_latest, duration):
+    costs, ages = [], []
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        start = time.perf_counter()
+        latest = read_latest()
+        now = time.perf_counter()
+        costs.append((now - start) * 1e6)
+        if latest is not None:
+            ages.append((now - latest["gaze_x"]) * 1000)
+        time.sleep(max(0.0, FRAME_TIME - (time.perf_counter() - start)))
+    return costs, ages
+
+def bench_queue(context, hz, duration):
+    q = context.Queue()
+    producer = context.Process(target=produce_queue, args=(q, hz, duration + 0.5))
+    producer.start()
+    time.sleep(0.5)
+    def read_latest():
+        latest = None
+        try:
+            while True:
+                latest = q.get_nowait()
+        except queue.Empty:
+            return latest
+    result = consume(read_latest, duration)
+    producer.join()
+    return result
+
+def bench_shm(context, hz, duration):
+    writer = SharedTargetWriter()
+    reader = SharedTargetReader(writer.name)
+    producer = context.Process(target=produce_shm, args=(writer.name, hz, duration + 0.5))
+    producer.start()
+    time.sleep(0.5)
+    result = consume(reader.read, duration)
+    producer.join()
+    reader.close()
+    writer.close()
+    return result
+
+def main():
+    duration = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    context = multiprocessing.get_context("spawn")
+    print(f"{'producer':>9} {'mode':>6} {'read us p50':>12} {'read us p95':>12} {'age ms p50':>11} {'age ms p95':>11}")
+    for hz in PRODUCER_HZ:
+        for mode, bench in (("queue", bench_queue), ("shm", bench_shm)):
+            costs, ages = bench(context, hz, duration)
+            costs.sort()
+            ages.sort()
+            print(f"{hz:>6} Hz {mode:>6} {statistics.median(costs):12.1f} {costs[int(len(costs) * 0.95)]:12.1f} "
+                  f"{statistics.median(ages):11.2f} {ages[int(len(ages) * 0.95)]:11.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# benchmarks/bench_sprite_cache.py
+"""
+눈 스프라이트 캐시 사용 여부에 따른 draw() 시간을 비교합니다.
+- settled: 모양은 그대로이고 떨림(shake_x)만 바뀌는 프레임
+- transition: eye_scale이 매 프레임 조금씩 바뀌는 프레임
+사용법: python -m benchmarks.bench_sprite_cache [프레임 수]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from noon.engine import NoonEngine
+from noon.face import NoonFaceRenderer
+from noon.model import NoonState
+
+RESOLUTIONS = [(240, 240), (800, 400), (1920, 1080)]
+CACHE_BYTES = 16 * 1024 * 1024
+
+def measure(renderer, frames, mutate):
+    """ mutate(state, i)로 상태를 바꿔가며 frames 만큼 그린 평균 시간(ms)을 반환합니다. """
+    state = NoonState()
+    start = time.perf_counter()
+    for i in range(frames):
+        mutate(state, i)
+        renderer.draw(state)
+    return (time.perf_counter() - start) / frames * 1000
+
+def settled(state, i):
+    state.shake_x = (i % 5) - 2
+
+def transition(state, i):
+    state.eye_scale = 1.0 + i * 0.0005
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    pygame.display.init()
+    print(f"{'resolution':>12} {'cache':>6} {'settled ms':>11} {'transition ms':>14} {'hit rate':>9}")
+    for width, height in RESOLUTIONS:
+        screen = pygame.display.set_mode((width, height))
+        for cache_bytes in (0, CACHE_BYTES):
+            renderer = NoonFaceRenderer(screen, NoonEngine(width, height), sprite_cache_bytes=cache_bytes)
+            settled_ms = measure(renderer, frames, settled)
+            transition_ms = measure(renderer, frames, transition)
+            hit_rate = renderer.sprite_cache.stats()["hit_rate"] if renderer.sprite_cache else 0.0
+            label = "on" if cache_bytes else "off"
+            print(f"{width}x{height:<7} {label:>6} {settled_ms:11.3f} {transition_ms:14.3f} {hit_rate:9.2f}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
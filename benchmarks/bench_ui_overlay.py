@@ -0,0 +1,57 @@
+# benchmarks/bench_ui_overlay.py
+"""
+데모 UI(UIManager) 오버레이의 프레임당 그리기 시간을 비교합니다.
+- direct: 버튼, 슬라이더를 매 프레임 pygame.draw와 font.render로 직접 그림 (기존 방식)
+- cached: 정적 레이어 한 번 블릿 + 값 막대 + 글자 Surface 캐시 (UIManager.draw)
+시선은 천천히 움직이고 슬라이더 값은 가끔 바뀌는, 조정 작업 중의 상황을 흉내 냅니다.
+사용법: python -m benchmarks.bench_ui_overlay [프레임 수]
+"""
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from noon.model import NoonState
+from utils.ui import UIManager
+
+def draw_direct(ui, screen, state):
+    for btn in ui.buttons:
+        btn.draw(screen)
+    for s in ui.sliders:
+        s.draw(screen, state)
+    debug_text = f"Gaze(x,y): ({state.gaze_x:.2f}, {state.gaze_y:.2f})"
+    screen.blit(ui.font.render(debug_text, True, (150, 150, 150)), (20, screen.get_height() - 20))
+
+def measure(mode, frames, size=(800, 400)):
+    screen = pygame.Surface(size, 0, 32)
+    state = NoonState()
+    ui = UIManager(state, size[0])
+    samples = []
+    for i in range(frames):
+        state.gaze_x = ((i % 240) - 120) / 240
+        if i % 60 == 0:
+            state.eye_scale = 0.8 + (i % 600) / 1500
+        start = time.perf_counter()
+        if mode == "direct":
+            draw_direct(ui, screen, state)
+        else:
+            ui.draw(screen, state)
+        samples.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(samples), statistics.quantiles(samples, n=20)[-1], ui
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 1200
+    pygame.font.init()
+    print(f"{'mode':>7} {'p50 us':>8} {'p95 us':>8}")
+    for mode in ("direct", "cached"):
+        measure(mode, 60) # 워밍업
+        p50, p95, ui = measure(mode, frames)
+        print(f"{mode:>7} {p50:8.1f} {p95:8.1f}")
+    stats = ui.text_cache.surfaces.stats()
+    print(f"text cache: {stats['entries']} entries, {stats['bytes_used'] / 1024:.0f} KB, hit rate {stats['hit_rate']:.1%}")
+
+if __name__ == "__main__":
+    main()
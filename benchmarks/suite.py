@@ -0,0 +1,200 @@
+# benchmarks/suite.py
+"""
+디스플레이 없이(SDL dummy 드라이버) 엔진, 상태 전환, 동적 효과, 렌더러의 프레임당 처리 시간을 측정하는 벤치마크 모음.
+해상도(240x240 ~ 1920x1080), 감정, 효과 개수별로 호출당 시간(us)의 백분위수를 출력하고 JSON으로 저장하며,
+저장된 기준값(baseline)과 비교하여 느려진 항목을 표시합니다. 느려진 항목이 있으면 종료 코드 1을 반환합니다.
+
+사용법:
+    python -m benchmarks.suite                         # 측정 후 benchmarks/baseline.json과 비교
+    python -m benchmarks.suite --output result.json    # 결과를 JSON으로 저장
+    python -m benchmarks.suite --save-baseline         # 현재 결과를 새 기준값으로 저장
+    python -m benchmarks.suite --filter render --frames 100
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+from noon import Noon
+from noon.effects import EFFECT_HANDLER_MAP, EffectPlan
+from noon.engine import NoonEngine
+from noon.face import NoonFaceRenderer
+from noon.model import NoonState
+from noon.presets import EMOTION_PRESETS
+from noon.transition import CompiledTarget, transition_state
+
+RESOLUTIONS = [(240, 240), (480, 320), (800, 400), (1280, 720), (1920, 1080)]
+EMOTIONS = list(EMOTION_PRESETS)
+EFFECT_COUNTS = [0, 1, 4, 16]
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+DEFAULT_THRESHOLD = 0.25 # 기준값보다 이 비율 이상 느려지면 회귀로 표시
+DEFAULT_REPEAT = 3
+
+def summarize(samples: list[float]) -> dict:
+    """ 호출당 시간(us) 목록을 요약 통계로 만듭니다. """
+    samples = sorted(samples)
+    last = len(samples) - 1
+    return {
+        "n": len(samples),
+        "mean": statistics.fmean(samples),
+        "p50": samples[int(last * 0.50)],
+        "p95": samples[int(last * 0.95)],
+        "p99": samples[int(last * 0.99)],
+        "max": samples[-1],
+    }
+
+def _timed(func, frames: int, prepare=None) -> list[float]:
+    """ func()를 frames번 호출하며 호출당 시간(us)을 잽니다. prepare(i)는 시간 측정 밖에서 매번 먼저 호출됩니다. """
+    samples = []
+    clock = time.perf_counter_ns
+    for i in range(frames):
+        if prepare is not None:
+            prepare(i)
+        start = clock()
+        func()
+        samples.append((clock() - start) / 1000)
+    return samples
+
+def _sweep_gaze(state: NoonState):
+    """ 프레임 번호에 따라 시선을 좌우로 움직이는 prepare 함수를 만듭니다. """
+    def prepare(i):
+        state.gaze_x = ((i % 120) - 60) / 60
+    return prepare
+
+def bench_engine_geometry(width, height, frames):
+    engine = NoonEngine(width, height)
+    state = NoonState()
+    def frame():
+        engine.get_eye_center(False, state)
+        engine.get_eye_center(True, state)
+        engine.get_eye_dimensions(state)
+    return _timed(frame, frames, _sweep_gaze(state))
+
+def bench_transition(emotion, frames):
+    """ 다른 감정에서 emotion으로 전환하는 한 스텝. 수렴하면 출발 상태로 되돌려 계속 전환 중인 스텝을 잽니다. """
+    start_emotion = next(name for name in EMOTIONS if name != emotion) if len(EMOTIONS) > 1 else emotion
+    start = NoonState(**EMOTION_PRESETS[start_emotion]["values"])
+    target = CompiledTarget(EMOTION_PRESETS[emotion]["values"])
+    state = start.copy()
+    def prepare(i):
+        nonlocal state
+        if i % 30 == 0:
+            state = start.copy()
+    return _timed(lambda: transition_state(state, target, 0.1), frames, prepare)
+
+def bench_effects(count, frames):
+    """ 실제 떨림 핸들러(EFFECT_HANDLER_MAP["shake"])를 쓰는 서로 다른 떨림 효과 count개가 활성화된 Noon._handle_dynamic_effects. """
+    registry = {f"shake_{i}": EFFECT_HANDLER_MAP["shake"] for i in range(max(count, 1))}
+    eyes = Noon(64, 64, headless=True)
+    eyes._effect_plan = EffectPlan([{"type": f"shake_{i}", "intensity": 2.0} for i in range(count)], registry,
+                                   rng=eyes.rng, rate=1.0 / eyes.sim_step)
+    return _timed(eyes._handle_dynamic_effects, frames)
+
+def bench_render(width, height, emotion, dirty_rects, frames):
+    screen = pygame.Surface((width, height), 0, 32)
+    renderer = NoonFaceRenderer(screen, NoonEngine(width, height), dirty_rects=dirty_rects)
+    state = NoonState(**EMOTION_PRESETS[emotion]["values"])
+    plan = EffectPlan(EMOTION_PRESETS[emotion]["effects"])
+    sweep = _sweep_gaze(state)
+    def prepare(i):
+        sweep(i)
+        plan.run(state)
+    return _timed(lambda: renderer.draw(state), frames, prepare)
+
+def cases():
+    """ (이름, 측정 함수(frames) → 샘플 목록) 목록. """
+    for width, height in RESOLUTIONS:
+        yield f"engine/geometry/{width}x{height}", lambda n, w=width, h=height: bench_engine_geometry(w, h, n)
+    for emotion in EMOTIONS:
+        yield f"transition/{emotion}", lambda n, e=emotion: bench_transition(e, n)
+    for count in EFFECT_COUNTS:
+        yield f"effects/{count}", lambda n, c=count: bench_effects(c, n)
+    for width, height in RESOLUTIONS:
+        for emotion in EMOTIONS:
+            for dirty_rects in (False, True):
+                mode = "dirty" if dirty_rects else "full"
+                yield (f"render/{width}x{height}/{emotion}/{mode}",
+                       lambda n, w=width, h=height, e=emotion, d=dirty_rects: bench_render(w, h, e, d, n))
+
+def run(frames: int, name_filter: str | None = None, repeat: int = DEFAULT_REPEAT) -> dict:
+    """ 항목마다 repeat번 측정하여 p50이 가장 낮은 회차를 씁니다. (다른 프로세스의 간섭으로 인한 흔들림을 줄입니다.) """
+    results = {}
+    for name, bench in cases():
+        if name_filter and name_filter not in name:
+            continue
+        bench(min(frames, 20)) # 워밍업
+        results[name] = min((summarize(bench(frames)) for _ in range(repeat)), key=lambda stats: stats["p50"])
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "frames": frames,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+def compare(results: dict, baseline: dict, threshold: float, metrics=("p50",)) -> list[tuple]:
+    """
+    기준값보다 metrics 지표가 threshold 비율 이상 느려진 (이름, 지표, 기준값, 현재값) 목록.
+    꼬리 지표(p95, p99)는 다른 프로세스의 간섭에 크게 흔들리므로 기본으로는 p50만 비교합니다.
+    """
+    regressions = []
+    for name, current in results["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        for metric in metrics:
+            if current[metric] > base[metric] * (1 + threshold):
+                regressions.append((name, metric, base[metric], current[metric]))
+    return regressions
+
+def print_table(results: dict, baseline: dict | None, regressions: list[tuple]):
+    flagged = {name for name, *_ in regressions}
+    print(f"{'case':<36} {'p50 us':>10} {'p95 us':>10} {'p99 us':>10} {'vs base':>8}")
+    for name, stats in results["results"].items():
+        base = baseline["results"].get(name) if baseline else None
+        delta = f"{(stats['p50'] / base['p50'] - 1) * 100:+7.1f}%" if base else "      -"
+        flag = "  REGRESSION" if name in flagged else ""
+        print(f"{name:<36} {stats['p50']:10.1f} {stats['p95']:10.1f} {stats['p99']:10.1f} {delta:>8}{flag}")
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="noon_noon headless benchmark suite")
+    parser.add_argument("--frames", type=int, default=300, help="항목별 측정 횟수")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="항목별 반복 측정 횟수 (가장 빠른 회차 사용)")
+    parser.add_argument("--filter", help="이름에 이 문자열이 들어간 항목만 실행")
+    parser.add_argument("--output", help="결과를 저장할 JSON 경로")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="비교할 기준값 JSON 경로")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="회귀로 볼 감속 비율")
+    parser.add_argument("--metric", action="append", choices=["p50", "p95", "p99"], help="회귀 판정에 쓸 지표 (여러 번 지정 가능, 기본 p50)")
+    parser.add_argument("--save-baseline", action="store_true", help="결과를 기준값 경로에 저장")
+    args = parser.parse_args(argv)
+
+    results = run(args.frames, args.filter, args.repeat)
+    baseline = None
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold, args.metric or ("p50",)) if baseline else []
+    print_table(results, baseline, regressions)
+
+    for path in filter(None, (args.output, args.baseline if args.save_baseline else None)):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"saved {path}")
+    if regressions:
+        print(f"{len(regressions)} regression(s) over {args.threshold:.0%}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,7 @@
 import pygame
 import sys
 from noon import Noon
+from noon.profiler import FrameProfiler
 from utils.ui import UIManager
 
 def main():
@@ -14,17 +15,23 @@ def main():
     clock = pygame.time.Clock()
 
     # 2. Init Modules
-    eyes = Noon(screen)
+    eyes = Noon(surface=screen)
     # UI 매니저는 Noon 컨트롤러가 내부적으로 관리하는 state 객체를 공유합니다.
     ui_manager = UIManager(eyes.state, screen.get_width())
+    # 단계별 프레임 시간 기록. 'p' 키로 그래프를 켜고 끕니다.
+    profiler = FrameProfiler()
 
     # 3. Main Loop
     running = True
+    dt = 0.0 # 직전 프레임 이후 흐른 시간(초)
     while running:
+        profiler.begin_frame()
         # Handle events
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_p:
+                ui_manager.profiler = None if ui_manager.profiler else profiler
             
             # UI 매니저가 이벤트를 처리 (슬라이더 조작 등)
             clicked_emotion = ui_manager.handle_event(event, eyes.state)
@@ -33,10 +40,13 @@ def main():
                 eyes.set_emotion(clicked_emotion)
                 # 슬라이더의 is_modified 플래그를 리셋하여 새 감정 값이 적용되게 함
                 ui_manager.reset_slider_modifications()
+        profiler.mark("events")
 
         # Update state
         # Noon 컨트롤러의 update는 프리셋에 따른 상태 전환과 동적 효과를 담당
-        eyes.update()
+        # 경과 시간(dt)을 넘기면 프레임 속도와 무관하게 같은 속도로 움직임
+        eyes.update(dt)
+        profiler.mark("update")
         
         # 슬라이더에 의해 직접 조작된 값은 update 이후에도 유지됨
         # (단, 새 감정 선택 시 reset_slider_modifications가 호출되어 초기화됨)
@@ -45,9 +55,13 @@ def main():
         screen.fill((0, 0, 0))
         eyes.draw()
         ui_manager.draw(screen, eyes.state)
+        profiler.mark("draw")
         pygame.display.flip()
+        profiler.mark("present")
         
-        clock.tick(60)
+        dt = clock.tick(60) / 1000
+        profiler.mark("wait")
+        profiler.end_frame()
 
     pygame.quit()
     sys.exit()
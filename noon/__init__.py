@@ -3,5 +3,15 @@
 """
 noon_noon 라이브러리의 메인 컨트롤러를 쉽게 임포트할 수 있도록 합니다.
 사용법: from noon import Noon
+
+Noon(과 Pygame 렌더링 백엔드)은 처음 접근할 때 불러옵니다.
+model, engine, transition, presets, effects 등 순수 로직 모듈은 Pygame 없이 임포트할 수 있습니다.
 """
-from .controller import Noon
+__all__ = ["Noon"]
+
+def __getattr__(name):
+    if name == "Noon":
+        from .controller import Noon
+        globals()["Noon"] = Noon # 다음부터는 모듈 속성으로 바로 찾습니다.
+        return Noon
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
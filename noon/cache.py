@@ -0,0 +1,63 @@
+# noon/cache.py
+from collections import OrderedDict
+
+class LRUCache:
+    """
+    메모리 사용량(바이트) 상한이 있는 LRU 캐시.
+    항목의 크기는 생성 시 전달한 sizeof 함수로 계산하며, 상한을 넘으면 가장 오래 쓰지 않은 항목부터 버립니다.
+    """
+    def __init__(self, max_bytes: int, sizeof):
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._items = OrderedDict()
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key):
+        """ 캐시된 값을 반환합니다. 없으면 None. """
+        value = self._items.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._items.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """ 값을 저장하고, 상한을 넘으면 오래된 항목을 제거합니다. 상한보다 큰 값은 저장하지 않습니다. """
+        size = self._sizeof(value)
+        if size > self.max_bytes:
+            return value
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.bytes_used -= self._sizeof(old)
+        self._items[key] = value
+        self.bytes_used += size
+        while self.bytes_used > self.max_bytes:
+            _, evicted = self._items.popitem(last=False)
+            self.bytes_used -= self._sizeof(evicted)
+            self.evictions += 1
+        return value
+
+    def clear(self):
+        """ 모든 항목을 제거합니다. (통계 카운터는 유지) """
+        self._items.clear()
+        self.bytes_used = 0
+
+    def stats(self) -> dict:
+        """ 적중/실패/제거 횟수와 메모리 사용량을 반환합니다. """
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._items),
+            "bytes_used": self.bytes_used,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
@@ -0,0 +1,160 @@
+# noon/clips.py
+import json
+import math
+import numpy as np
+from .model import FIELD_INDEX
+from .presets import CLIP_PRESETS
+
+# 이징 곡선의 사전 계산 테이블 크기와 클립 기본 샘플링 주기(Hz)
+EASING_LUT_SIZE = 256
+DEFAULT_SAMPLE_RATE = 120
+
+def _ease_out_back(t):
+    c = 1.70158
+    return 1 + (c + 1) * (t - 1) ** 3 + c * (t - 1) ** 2
+
+# 이징 이름 → 0~1 구간의 진행률 곡선
+EASING_FUNCTIONS = {
+    "linear": lambda t: t,
+    "ease_in": lambda t: t * t,
+    "ease_out": lambda t: 1 - (1 - t) ** 2,
+    "ease_in_out": lambda t: t * t * (3 - 2 * t),
+    "ease_out_back": _ease_out_back,
+}
+
+_LUT_X = np.linspace(0.0, 1.0, EASING_LUT_SIZE)
+EASING_LUTS = {name: func(_LUT_X) for name, func in EASING_FUNCTIONS.items()}
+
+class BakedClip:
+    """
+    키프레임 클립을 고정 간격 샘플 배열로 미리 구워둔 것.
+    재생 시에는 시간 t에 해당하는 이웃 샘플 두 개를 인덱스로 찾아 선형 보간만 하므로, 키프레임 수와 상관없이 O(1)입니다.
+    - indices: 클립이 다루는 필드의 NoonState.values 버퍼 인덱스
+    - rows: 샘플 시점별 필드 값 목록
+    """
+    __slots__ = ("name", "duration", "additive", "loop", "indices", "rate", "rows")
+
+    def __init__(self, name: str, spec: dict, sample_rate: float = DEFAULT_SAMPLE_RATE):
+        tracks = spec.get("tracks") or {}
+        if not tracks:
+            raise ValueError(f"Clip '{name}' has no tracks")
+        mode = spec.get("mode", "additive")
+        if mode not in ("additive", "absolute"):
+            raise ValueError(f"Clip '{name}' has unknown mode '{mode}'. Use 'additive' or 'absolute'")
+        for field in tracks:
+            if field not in FIELD_INDEX:
+                raise ValueError(f"Clip '{name}' animates unknown or non-numeric field '{field}'")
+
+        self.name = name
+        self.additive = mode == "additive"
+        self.loop = bool(spec.get("loop", False))
+        self.duration = float(spec.get("duration") or max(key[0] for keys in tracks.values() for key in keys))
+        self.indices = tuple(FIELD_INDEX[field] for field in tracks)
+
+        # 마지막 샘플이 정확히 duration에 오도록 샘플 간격을 맞춥니다.
+        count = max(2, math.ceil(self.duration * sample_rate) + 1)
+        times = np.linspace(0.0, self.duration, count)
+        self.rate = (count - 1) / self.duration if self.duration > 0 else 0.0
+        samples = np.column_stack([_bake_track(name, field, keys, times) for field, keys in tracks.items()])
+        self.rows = samples.tolist()
+
+    def sample(self, t: float) -> list[float]:
+        """ 시간 t(초)의 필드 값 목록을 indices 순서로 반환합니다. """
+        if self.loop and self.duration > 0:
+            t %= self.duration
+        position = min(max(t, 0.0), self.duration) * self.rate
+        i = min(int(position), len(self.rows) - 2)
+        frac = position - i
+        a, b = self.rows[i], self.rows[i + 1]
+        return [x + (y - x) * frac for x, y in zip(a, b)]
+
+def _bake_track(clip_name: str, field: str, keys: list, times: np.ndarray) -> np.ndarray:
+    """ 한 필드의 키프레임을 times 시점들의 값으로 계산합니다. 첫/마지막 키프레임 바깥은 값을 유지합니다. """
+    keys = sorted(keys, key=lambda key: key[0])
+    key_times = np.array([key[0] for key in keys], dtype=np.float64)
+    key_values = np.array([key[1] for key in keys], dtype=np.float64)
+    if len(keys) == 1:
+        return np.full(times.shape, key_values[0])
+
+    easings = [key[2] if len(key) > 2 else "linear" for key in keys[1:]]
+    for easing in easings:
+        if easing not in EASING_LUTS:
+            raise ValueError(f"Clip '{clip_name}' track '{field}' uses unknown easing '{easing}'")
+
+    # 각 시점이 속한 구간과 구간 내 진행률(0~1)
+    segment = np.clip(np.searchsorted(key_times, times, side="right") - 1, 0, len(keys) - 2)
+    t0, t1 = key_times[segment], key_times[segment + 1]
+    span = t1 - t0
+    progress = np.where(span > 0, (times - t0) / np.where(span > 0, span, 1.0), 1.0)
+    progress = np.clip(progress, 0.0, 1.0)
+
+    # 구간별 이징을 테이블에서 읽어 진행률을 변형합니다.
+    eased = np.empty_like(progress)
+    segment_easing = np.array(easings)[segment]
+    for easing in set(easings):
+        mask = segment_easing == easing
+        eased[mask] = np.interp(progress[mask], _LUT_X, EASING_LUTS[easing])
+
+    v0, v1 = key_values[segment], key_values[segment + 1]
+    return v0 + (v1 - v0) * eased
+
+def bake_clips(specs: dict, sample_rate: float = DEFAULT_SAMPLE_RATE) -> dict:
+    """ {이름: 클립 정의} dict를 {이름: BakedClip} dict로 굽습니다. """
+    return {name: BakedClip(name, spec, sample_rate) for name, spec in specs.items()}
+
+def load_clips(path: str, sample_rate: float = DEFAULT_SAMPLE_RATE) -> dict:
+    """ {이름: 클립 정의} 형식의 JSON 파일을 읽어 구운 클립 dict를 반환합니다. (형식은 presets.CLIP_PRESETS 참고) """
+    with open(path, encoding="utf-8") as f:
+        return bake_clips(json.load(f), sample_rate)
+
+class ClipPlayer:
+    """
+    재생 중인 클립들을 NoonState.values 버퍼 위에 레이어로 얹는 재생기.
+    클립이 덮어쓴 필드의 원래 값(기저값)을 보관해 두었다가 다음 스텝 전에 restore()로 되돌리므로,
+    감정 전환은 클립과 상관없이 기저값 위에서 진행되고 클립이 끝나면 흔적 없이 사라집니다.
+    """
+    def __init__(self):
+        self.playing = [] # [BakedClip, 경과 시간] 목록
+        self._base = {}   # 버퍼 인덱스 → 클립 적용 전 값
+
+    def play(self, clip: BakedClip):
+        """ 클립을 처음부터 재생합니다. 같은 이름의 클립이 재생 중이면 다시 시작합니다. """
+        self.stop(clip.name)
+        self.playing.append([clip, 0.0])
+
+    def stop(self, name: str | None = None):
+        """ 이름이 name인 클립(None이면 전부)을 멈춥니다. 값은 다음 restore()에서 기저값으로 돌아갑니다. """
+        self.playing = [entry for entry in self.playing if name is not None and entry[0].name != name]
+
+    def restore(self, values):
+        """ 클립이 덮어쓴 값을 기저값으로 되돌립니다. """
+        for index, value in self._base.items():
+            values[index] = value
+        self._base.clear()
+
+    def forget(self):
+        """ 보관한 기저값을 되돌리지 않고 버립니다. (values가 바깥에서 통째로 바뀐 경우, 예: 기록 재생) """
+        self._base.clear()
+
+    def advance(self, values, dt: float) -> bool:
+        """
+        재생 중인 클립들을 현재 시점 값으로 values에 적용하고 dt초만큼 진행합니다.
+        재생 중인 클립이 없고 모든 값이 기저값으로 돌아와 있으면 True를 반환합니다.
+        """
+        base = self._base
+        still_playing = []
+        for entry in self.playing:
+            clip, elapsed = entry
+            for index, value in zip(clip.indices, clip.sample(elapsed)):
+                if index not in base:
+                    base[index] = values[index]
+                values[index] = values[index] + value if clip.additive else value
+            entry[1] = elapsed + dt
+            # 마지막 샘플까지 한 번 적용한 뒤에 목록에서 뺍니다.
+            if clip.loop or elapsed < clip.duration:
+                still_playing.append(entry)
+        self.playing = still_playing
+        return not self.playing and not base
+
+# 기본 제공 클립 (presets.CLIP_PRESETS를 모듈 로드 시 한 번 굽습니다)
+CLIP_LIBRARY = bake_clips(CLIP_PRESETS)
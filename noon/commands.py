@@ -0,0 +1,91 @@
+# noon/commands.py
+import threading
+import traceback
+
+class CommandQueue:
+    """
+    여러 스레드에서 넣은 명령을 모아두었다가, 렌더 루프가 프레임마다 한 번 drain()으로 실행하는 큐.
+    같은 key의 명령은 가장 마지막 것만 남기므로(coalescing), 센서 루프가 시선 갱신을 초당 수백 번 보내도
+    프레임당 한 번만 적용됩니다. 서로 다른 key의 명령은 넣은 순서대로 실행됩니다.
+    """
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._pending = {} # key → (func, args)
+        self.coalesced = 0 # 실행되기 전에 새 명령으로 대체된 횟수
+
+    def __len__(self):
+        with self._cond:
+            return len(self._pending)
+
+    def put(self, key, func, *args):
+        """ 명령을 넣습니다. 같은 key의 명령이 대기 중이면 대체합니다. (key가 매번 다르면 모두 실행) """
+        with self._cond:
+            if self._pending.pop(key, None) is not None:
+                self.coalesced += 1
+            self._pending[key] = (func, args)
+            self._cond.notify_all()
+
+    def drain(self) -> int:
+        """ 대기 중인 명령을 모두 실행하고, 실행한 개수를 반환합니다. """
+        with self._cond:
+            if not self._pending:
+                return 0
+            pending, self._pending = self._pending, {}
+        for func, args in pending.values():
+            func(*args)
+        return len(pending)
+
+    def wait(self, timeout: float) -> bool:
+        """ 명령이 들어오거나 wake()가 호출될 때까지 최대 timeout초 기다립니다. 대기 중인 명령이 있으면 True. """
+        with self._cond:
+            if not self._pending:
+                self._cond.wait(timeout)
+            return bool(self._pending)
+
+    def wake(self):
+        """ wait() 중인 스레드를 깨웁니다. """
+        with self._cond:
+            self._cond.notify_all()
+
+class CallbackWorker:
+    """
+    사용자 콜백을 렌더 스레드가 아닌 별도의 작업 스레드에서 실행합니다.
+    콜백이 느려도 렌더링은 멈추지 않으며, 밀린 호출은 CommandQueue처럼 key별로 최신 것만 남습니다.
+    콜백에서 난 예외는 출력만 하고 다음 콜백을 계속 실행합니다.
+    """
+    def __init__(self, name: str = "noon-callbacks"):
+        self.queue = CommandQueue()
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name=name, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def post(self, key, callback, *args):
+        """ 콜백 호출을 예약합니다. """
+        self.queue.put(key, self._call, callback, args)
+
+    @property
+    def is_current(self) -> bool:
+        """ 호출한 코드가 이 작업 스레드(콜백 안)에서 실행 중인지 여부. """
+        return self._thread is threading.current_thread()
+
+    def stop(self, timeout: float | None = None):
+        """ 대기 중인 콜백을 마저 실행하지 않고 작업 스레드를 멈춥니다. """
+        self._stop_event.set()
+        self.queue.wake()
+        if self._thread.is_alive() and not self.is_current:
+            self._thread.join(timeout)
+
+    def _loop(self):
+        while not self._stop_event.is_set():
+            if self.queue.wait(0.1):
+                self.queue.drain()
+
+    def _call(self, callback, args):
+        if self._stop_event.is_set():
+            return
+        try:
+            callback(*args)
+        except Exception:
+            traceback.print_exc()
@@ -1,47 +1,354 @@
 # noon/controller.py
+import asyncio
+from array import array
 import pygame
-import sys
-from .model import NoonState
+import random
+import threading
+import time
+from .model import NoonState, FIELD_INDEX
 from .engine import NoonEngine
 from .face import NoonFaceRenderer
 from .presets import EMOTION_PRESETS
-from .transition import transition_state
-from .effects import EFFECT_HANDLER_MAP
+from .transition import (transition_state, smoothing_factor, speed_vector, CompiledTarget,
+                         PresetMatrix, DEFAULT_HALF_LIFE)
+from .effects import EffectPlan, blend_effects
+from .clips import CLIP_LIBRARY, ClipPlayer, load_clips
+from .commands import CommandQueue, CallbackWorker
+from .shm import SharedTargetReader
+from .gaze import GazeFilter
+from .profiler import FrameProfiler, ProfilerOverlay
+from .recording import StateRecorder, StateLog, StateReplay
+from .panels import EyePanel, PanelSet
+
+# 렌더 루프가 이벤트를 기다리는 중에 새 명령이 들어왔음을 알리는 이벤트
+WAKE_EVENT = pygame.event.custom_type()
 
 class Noon:
     """
     noon_noon 라이브러리의 모든 기능을 관리하는 고수준 컨트롤러 클래스.
     Pygame 루프를 내장하여 사용자가 Pygame을 몰라도 쉽게 사용할 수 있습니다.
+
+    - 기본: 창을 열고 run()으로 이벤트 루프를 실행합니다.
+      start()로 렌더 루프를 백그라운드 스레드에서, run_async()로 asyncio 태스크로 실행할 수도 있습니다.
+      이때 set_emotion 등의 명령은 큐에 쌓였다가 프레임마다 한 번 적용되고, 콜백은 별도 작업 스레드에서 호출됩니다.
+    - surface 지정: 이미 만들어진 Surface(예: 사용자가 연 창)에 그립니다. 루프는 사용자가 관리합니다.
+    - headless=True: 창 없이 메모리 내 Surface에 그립니다. step()으로 프레임을 진행하고
+      frame_buffer()/frame_array()로 픽셀을 복사 없이 읽습니다. (서버, 테스트, 비 SDL 디스플레이용)
     """
-    def __init__(self, width: int = 800, height: int = 400, bg_color: tuple = (0, 0, 0)):
-        # Pygame 초기화를 클래스 내부에서 처리
-        pygame.init()
-        pygame.display.set_caption("noon_noon")
-        self.screen = pygame.display.set_mode((width, height))
+    def __init__(self, width: int = 800, height: int = 400, bg_color: tuple = (0, 0, 0),
+                 dirty_rects: bool = False, sprite_cache_bytes: int = 0,
+                 fps: int = 60, idle_fps: int = 10, sim_hz: int = 60,
+                 half_life: float = DEFAULT_HALF_LIFE, half_lives: dict | None = None,
+                 headless: bool = False, surface: pygame.Surface | None = None, seed: int | None = None):
+        self.headless = headless
+        # 창을 직접 연 경우에만 렌더 루프가 Pygame 이벤트를 처리합니다.
+        self._owns_display = not headless and surface is None
+        if surface is not None:
+            self.screen = surface
+            width, height = surface.get_size()
+        elif headless:
+            # 창 없이 32비트 메모리 Surface에 그립니다. (디스플레이 초기화 불필요)
+            self.screen = pygame.Surface((width, height), 0, 32)
+        else:
+            # Pygame 초기화를 클래스 내부에서 처리. 오디오, 조이스틱 등은 쓰지 않으므로 비디오(와 이벤트)만 켭니다.
+            pygame.display.init()
+            pygame.display.set_caption("noon_noon")
+            self.screen = pygame.display.set_mode((width, height))
         self.clock = pygame.time.Clock()
         self.bg_color = bg_color
+        # 화면 변화가 없을 때(안정 상태)는 idle_fps로 낮춰 이벤트만 확인합니다.
+        self.fps = fps
+        self.idle_fps = idle_fps
+        # 부하가 걸려 프레임이 밀리면 최대 max_frame_skip 프레임까지 그리기를 건너뜁니다.
+        self.max_frame_skip = 2
+        self._skipped_frames = 0
+        self._last_frame_work = 0.0 # 마지막으로 그린 프레임의 작업 시간(대기 제외)
+
+        # 시뮬레이션은 렌더링과 별개로 고정된 시간 간격(1/sim_hz초)으로 진행합니다.
+        # 전환 속도는 필드별 반감기(초)로 설정하며, half_lives에 없는 필드는 half_life를 씁니다.
+        self.sim_step = 1.0 / sim_hz
+        self.max_sim_steps = 8 # 한 번의 update에서 따라잡을 최대 스텝 수
+        self._step_speeds = speed_vector(
+            {key: smoothing_factor(self.sim_step, value) for key, value in (half_lives or {}).items()},
+            default=smoothing_factor(self.sim_step, half_life),
+        )
+        self._sim_time_debt = 0.0
+        self._last_update_time = None
         
         # 내부 컴포넌트 초기화
         self.state = NoonState()
         self.engine = NoonEngine(width, height)
-        self.renderer = NoonFaceRenderer(self.screen, self.engine)
+        # dirty_rects=True이면 눈이 있는 영역만 다시 그리고 화면에 반영합니다.
+        # sprite_cache_bytes > 0이면 렌더링된 눈을 해당 용량까지 캐시하여 재사용합니다.
+        self.renderer = NoonFaceRenderer(self.screen, self.engine, dirty_rects=dirty_rects,
+                                         sprite_cache_bytes=sprite_cache_bytes)
+        self.renderer.bg_color = bg_color
         
+        # 동적 효과가 쓰는 난수 생성기. seed를 주지 않아도 임의의 seed를 골라 기록에 남기므로 실행을 재현할 수 있습니다.
+        self.seed = seed if seed is not None else random.SystemRandom().getrandbits(32)
+        self.rng = random.Random(self.seed)
         self.current_emotion = "neutral"
+        self.emotion_mix = None # set_emotion_mix로 섞은 감정 가중치 (한 감정만 쓰는 중이면 None)
+        self._preset_matrix = None # 프리셋을 컴파일한 목표 행렬 (처음 섞을 때 만듦)
+        self._target_overrides = {} # 감정 프리셋 위에 덮어쓰는 목표값 (set_gaze)
+        self._shared_target = None  # 공유 메모리 목표 채널 (attach_shared_target)
+        self._shared_values = {}
+        self._shared_replace = False
+        # 시선 추적기 입력 (push_gaze). 추적 중에는 필터가 평활을 맡으므로,
+        # 시선 필드는 반감기 gaze_follow_half_life(0이면 즉시)로 예측 목표를 따라갑니다.
+        self.gaze_filter = GazeFilter()
+        self.gaze_follow_half_life = 0.0
+        self._gaze_input_values = {}
+        self._preset_step_speeds = None # 추적 중일 때 원래 전환 속도 보관
+        self._saccade = None # 다음 스텝에서 건너뛸 시선 (x, y)
         self.target_values = EMOTION_PRESETS["neutral"]["values"]
+        self._effect_plan = EffectPlan(EMOTION_PRESETS["neutral"]["effects"], rng=self.rng, rate=sim_hz)
+
+        # 감정 목표 위에 얹어 재생하는 키프레임 클립 (눈 깜빡임, 곁눈질 등)
+        self.clips = dict(CLIP_LIBRARY)
+        self._clip_player = ClipPlayer()
         
+        # 화면 외에 프레임을 내보낼 출력 대상 (예: FramebufferSink)
+        self.sinks = []
+        # 눈마다 따로 있는 패널에 나누어 그리는 분할 출력 (enable_panels). None이면 screen 하나에 양쪽 눈을 그립니다.
+        self.panels = None
+        self._panel_preview = False
+        self._dirty_rects = dirty_rects
+        self._sprite_cache_bytes = sprite_cache_bytes
+
+        # 백그라운드 실행(start/run_async) 상태. 다른 스레드의 명령은 commands 큐를 거쳐 렌더 루프에서 실행됩니다.
+        self.commands = CommandQueue()
+        self._background = False
+        self._render_ident = None
+        self._render_thread = None
+        self._stop_event = threading.Event()
+        self._async_wake = None
+        self._async_loop = None
+        self._callback_worker = None
+
+        # 렌더 루프 단계별 시간 기록 (enable_profiler). None이면 기록하지 않습니다.
+        self.profiler = None
+        self.profiler_overlay = None
+
+        # 표시한 상태의 기록(start_recording)과 기록 재생(replay)
+        self.recorder = None
+        self._replay = None
+
         # 콜백 함수
         self._key_press_callback = None
         self._every_frame_callback = None
+        self._settled_callback = None
         
         # 초기 상태 즉시 적용
         for key, value in self.target_values.items():
             setattr(self.state, key, value)
+        self.is_settled = True
+        self._drawn_snapshot = None # 마지막으로 화면에 그린 상태
+
+    @property
+    def target_values(self) -> dict:
+        """ 현재 목표 상태 dict. 대입하면 목표 벡터로 한 번 컴파일되어 매 스텝 재사용됩니다. """
+        return self._target_values
+
+    @target_values.setter
+    def target_values(self, values: dict):
+        self._target_values = values
+        if self._shared_replace:
+            # 숫자형 목표는 공유 메모리 값만 쓰고, 프리셋에서는 비숫자 값만 가져옵니다.
+            values = {key: value for key, value in values.items() if key not in FIELD_INDEX}
+        self._target = CompiledTarget({**values, **self._target_overrides, **self._shared_values,
+                                       **self._gaze_input_values})
 
     def set_emotion(self, emotion_name: str):
         """ 눈의 목표 감정을 설정합니다. """
-        if emotion_name in EMOTION_PRESETS and self.current_emotion != emotion_name:
+        self._submit("set_emotion", self._set_emotion, emotion_name)
+
+    def _set_emotion(self, emotion_name: str):
+        if emotion_name in EMOTION_PRESETS and (self.current_emotion != emotion_name or self.emotion_mix is not None):
             self.current_emotion = emotion_name
+            self.emotion_mix = None
             self.target_values = EMOTION_PRESETS[emotion_name]["values"]
+            self._effect_plan = EffectPlan(EMOTION_PRESETS[emotion_name]["effects"], rng=self.rng,
+                                           rate=1.0 / self.sim_step, previous=self._effect_plan)
+            self.is_settled = False
+
+    def set_emotion_mix(self, weights: dict):
+        """
+        여러 감정을 가중치로 섞은 표정을 목표로 설정합니다. 예: set_emotion_mix({"angry": 0.3, "neutral": 0.7})
+        가중치는 합이 1이 되도록 정규화하며, 숫자형 값은 가중 평균, eyebrow_shape 같은 비숫자 값은 가중치가 가장 큰 감정,
+        동적 효과의 세기는 가중치에 비례합니다. 대화 시스템처럼 초당 여러 번 호출해도 비용은 프리셋 행렬과의 곱 한 번이며,
+        효과는 세기만 바뀌면 진행 중인 깜빡임/떨림을 다시 시작하지 않습니다.
+        """
+        unknown = [name for name in weights if name not in EMOTION_PRESETS]
+        if unknown:
+            raise ValueError(f"Unknown emotions {unknown}. Use any of {list(EMOTION_PRESETS)}")
+        if not any(weight > 0 for weight in weights.values()):
+            raise ValueError("Emotion mix needs at least one positive weight")
+        self._submit("set_emotion", self._set_emotion_mix, dict(weights))
+
+    def _set_emotion_mix(self, mix: dict):
+        presets = self._preset_matrix
+        if presets is None or presets.names != tuple(EMOTION_PRESETS):
+            presets = self._preset_matrix = PresetMatrix(EMOTION_PRESETS)
+        weights = presets.weights(mix)
+        target, self.current_emotion = presets.blend(weights)
+        self.emotion_mix = mix
+        self.target_values = target
+        effects = blend_effects(presets.effects, weights)
+        if not self._effect_plan.rescale(effects):
+            self._effect_plan = EffectPlan(effects, rng=self.rng, rate=1.0 / self.sim_step,
+                                           previous=self._effect_plan)
+        self.is_settled = False
+
+    def set_gaze(self, x: float | None, y: float | None = None):
+        """
+        감정 프리셋과 별개로 시선 목표(gaze_x, gaze_y)를 지정합니다. 감정을 바꿔도 유지됩니다.
+        None을 준 축은 다시 감정 프리셋을 따릅니다.
+        """
+        self._submit("set_gaze", self._set_gaze, x, y)
+
+    def _set_gaze(self, x, y):
+        for key, value in (("gaze_x", x), ("gaze_y", y)):
+            if value is None:
+                self._target_overrides.pop(key, None)
+            else:
+                self._target_overrides[key] = value
+        self.target_values = self._target_values # 덮어쓴 값을 반영하여 다시 컴파일
+        self.is_settled = False
+
+    def set_field(self, name: str, value: float | None):
+        """
+        숫자형 필드 하나의 목표를 감정 프리셋과 별개로 지정합니다. (set_gaze와 같이 감정을 바꿔도 유지)
+        값은 전환을 거쳐 목표로 가며, 효과와 클립 레이어는 그 위에 얹힙니다. None을 주면 다시 감정 프리셋을 따릅니다.
+        """
+        if name not in FIELD_INDEX:
+            raise ValueError(f"Unknown field '{name}'. Use one of {list(FIELD_INDEX)}")
+        self._submit(("set_field", name), self._set_field, name, value)
+
+    def _set_field(self, name, value):
+        if value is None:
+            self._target_overrides.pop(name, None)
+        else:
+            self._target_overrides[name] = value
+        self.target_values = self._target_values
+        self.is_settled = False
+
+    def attach_shared_target(self, name: str, replace: bool = False):
+        """
+        다른 프로세스가 noon.shm.SharedTargetWriter로 쓰는 공유 메모리 블록을 목표값으로 연결합니다.
+        렌더 루프는 프레임마다 한 번 블록을 읽어, 값이 바뀌었을 때만 목표를 다시 컴파일합니다.
+        replace=False이면 감정 프리셋 위에 덮어쓰고, True이면 숫자형 목표를 블록의 값으로만 대체합니다.
+        """
+        self.detach_shared_target()
+        self._shared_target = SharedTargetReader(name)
+        self._shared_replace = replace
+        self.target_values = self._target_values
+
+    def detach_shared_target(self):
+        """ 공유 메모리 목표 채널 연결을 끊고 감정 프리셋 목표로 돌아갑니다. """
+        if self._shared_target is not None:
+            self._shared_target.close()
+        self._shared_target = None
+        self._shared_values = {}
+        self._shared_replace = False
+        self.target_values = self._target_values
+
+    def _poll_shared_target(self):
+        """ 공유 메모리 목표가 바뀌었으면 목표에 반영합니다. """
+        values = self._shared_target.read()
+        if values is not None:
+            self._shared_values = values
+            self.target_values = self._target_values
+            self.is_settled = False
+
+    def push_gaze(self, x: float, y: float, timestamp: float | None = None):
+        """
+        시선 추적기의 샘플 하나를 넣습니다. 아무 스레드에서나, 아무 주기로 호출할 수 있습니다.
+        timestamp는 샘플을 측정한 time.perf_counter() 기준 시각(초)이며, 생략하면 현재 시각입니다.
+        샘플은 프레임마다 한 번 gaze_filter로 한꺼번에 처리되어, 다음 프레임 표시 시점의 예측 시선이 목표가 됩니다.
+        gaze_filter.timeout 동안 샘플이 없으면 추적을 멈추고 감정 프리셋의 시선으로 돌아갑니다.
+        """
+        self.gaze_filter.push(x, y, timestamp)
+        if self._background:
+            self._wake()
+
+    def _update_gaze_input(self, now: float):
+        """ 쌓인 시선 샘플을 처리하여 표시 시점의 예측 시선을 목표로 삼습니다. """
+        result = self.gaze_filter.update(now + 1.0 / self.fps)
+        gaze_indices = (FIELD_INDEX["gaze_x"], FIELD_INDEX["gaze_y"])
+        if result is None:
+            if self._preset_step_speeds is not None: # 추적 종료
+                self._step_speeds = self._preset_step_speeds
+                self._preset_step_speeds = None
+                self._gaze_input_values = {}
+                self.target_values = self._target_values
+                self.is_settled = False
+            return
+
+        x, y, saccade = result
+        if self._preset_step_speeds is None: # 추적 시작
+            self._preset_step_speeds = self._step_speeds
+            self._step_speeds = array("d", self._step_speeds)
+            for index in gaze_indices:
+                self._step_speeds[index] = smoothing_factor(self.sim_step, self.gaze_follow_half_life)
+        if self._gaze_input_values.get("gaze_x") != x or self._gaze_input_values.get("gaze_y") != y:
+            self._gaze_input_values = {"gaze_x": x, "gaze_y": y}
+            self.target_values = self._target_values
+            self.is_settled = False
+        if saccade:
+            # 도약: 전환을 거치지 않고 다음 스텝에서 바로 새 시선으로 건너뜁니다.
+            # 효과/클립 레이어가 기록한 양과 어긋나지 않도록 레이어를 걷어낸 기저 상태에 적용합니다. (_step)
+            self._saccade = (x, y)
+
+    def play_clip(self, clip_name: str):
+        """
+        이름이 clip_name인 애니메이션 클립을 현재 감정 위에 겹쳐 재생합니다.
+        같은 클립이 재생 중이면 처음부터 다시 재생합니다.
+        """
+        self._submit(("play_clip", clip_name), self._play_clip, clip_name)
+
+    def _play_clip(self, clip_name: str):
+        clip = self.clips.get(clip_name)
+        if clip is not None:
+            self._clip_player.play(clip)
+            self.is_settled = False
+
+    def stop_clip(self, clip_name: str | None = None):
+        """ 재생 중인 클립을 멈춥니다. clip_name을 생략하면 모든 클립을 멈춥니다. """
+        self._submit(("stop_clip", clip_name), self._clip_player.stop, clip_name)
+
+    def load_clips(self, path: str):
+        """ JSON 파일에 정의된 클립들을 읽어 play_clip으로 재생할 수 있게 등록합니다. """
+        clips = load_clips(path) # 파일 읽기와 굽기는 호출한 스레드에서 합니다.
+        self._submit(object(), self.clips.update, clips)
+
+    def _submit(self, key, func, *args):
+        """
+        명령을 실행합니다. 렌더 루프가 다른 스레드에서 돌고 있으면 큐에 넣어 다음 프레임에 실행합니다.
+        같은 key의 명령이 아직 대기 중이면 마지막 명령만 실행됩니다.
+        """
+        if self._render_ident is None or threading.get_ident() == self._render_ident:
+            func(*args)
+            if self._background:
+                self._wake()
+        else:
+            self.post_command(key, func, *args)
+
+    def post_command(self, key, func, *args):
+        """
+        func(*args)를 렌더 루프에서 실행하도록 commands 큐에 넣고, 유휴 대기 중인 루프를 깨웁니다.
+        update()가 매번 큐를 비우므로 어떤 실행 방식에서도 렌더링과 같은 스레드에서 실행됩니다.
+        같은 key의 명령이 아직 대기 중이면 마지막 명령만 실행됩니다. (외부 입력 소스용, noon.server 참고)
+        """
+        self.commands.put(key, func, *args)
+        self._wake()
+
+    def _dispatch(self, key, callback, *args):
+        """ 사용자 콜백을 호출합니다. 백그라운드 실행 중에는 작업 스레드에서 호출하여 렌더링을 막지 않습니다. """
+        if self._callback_worker is not None:
+            self._callback_worker.post(key, callback, *args)
+        else:
+            callback(*args)
 
     def on_key_press(self, callback):
         """ 키보드 키가 눌렸을 때 호출될 콜백 함수를 등록합니다. """
@@ -51,23 +358,349 @@ class Noon:
         """ 매 프레임마다 호출될 콜백 함수를 등록합니다. """
         self._every_frame_callback = callback
 
-    def update(self):
-        """ 상태 전환 및 동적 효과를 처리합니다. (수동 루프 제어용) """
-        transition_state(self.state, self.target_values, 0.1)
-        self._handle_dynamic_effects()
+    def on_settled(self, callback):
+        """ 표정 전환과 동적 효과가 모두 끝나 상태가 안정되었을 때 한 번 호출될 콜백 함수를 등록합니다. """
+        self._settled_callback = callback
+
+    def update(self, dt: float | None = None) -> bool:
+        """
+        상태 전환 및 동적 효과를 처리합니다. (수동 루프 제어용)
+        dt는 직전 update 이후 흐른 시간(초)이며, 생략하면 실제 경과 시간을 측정합니다.
+        경과 시간만큼 고정 간격 시뮬레이션 스텝을 진행하므로 프레임 속도와 무관하게 같은 속도로 움직입니다.
+        상태가 목표에 수렴하고 활성 효과가 없으면 True를 반환합니다.
+        """
+        self.commands.drain()
+        if self._shared_target is not None:
+            self._poll_shared_target()
+        now = time.perf_counter()
+        if self._preset_step_speeds is not None or self.gaze_filter.has_pending:
+            self._update_gaze_input(now)
+        if dt is None:
+            dt = self.sim_step if self._last_update_time is None else now - self._last_update_time
+        self._last_update_time = now
+        if self._replay is not None:
+            if self._replay.advance(dt, self.state):
+                self.stop_replay()
+            return False
+
+        # 오래 멈췄다 재개되어도 한 번에 따라잡는 양을 제한합니다.
+        self._sim_time_debt = min(self._sim_time_debt + dt, self.max_sim_steps * self.sim_step)
+        while self._sim_time_debt >= self.sim_step:
+            self._sim_time_debt -= self.sim_step
+            self._step()
+        return self.is_settled
+
+    def _step(self):
+        """ 시뮬레이션을 고정 간격(sim_step) 한 번만큼 진행합니다. """
+        # 클립과 효과 레이어를 얹은 역순으로 걷어낸 기저 상태에서 전환을 진행한 뒤, 효과와 클립을 다시 얹습니다.
+        self._clip_player.restore(self.state.values)
+        self._effect_plan.restore(self.state.values)
+        if self._saccade is not None:
+            self.state.gaze_x, self.state.gaze_y = self._saccade
+            self._saccade = None
+        converged = transition_state(self.state, self._target, self._step_speeds)
+        effects_idle = self._handle_dynamic_effects()
+        clips_idle = self._clip_player.advance(self.state.values, self.sim_step)
+        settled = converged and effects_idle and clips_idle
+        if settled and not self.is_settled and self._settled_callback:
+            self._dispatch("settled", self._settled_callback)
+        self.is_settled = settled
+
+    def draw(self) -> list[pygame.Rect]:
+        """
+        눈을 화면에 그리고, 갱신된 화면 영역 목록을 반환합니다. (수동 루프 제어용)
+        직전 프레임과 디스플레이 리스트가 같으면 그리지 않고 빈 목록을 반환합니다.
+        단, 사용자가 준 surface에 그리는 경우에는 사용자가 매 프레임 화면을 덮어쓸 수 있으므로 항상 다시 그립니다.
+        """
+        if self.panels is None:
+            if not self._owns_display and not self.headless:
+                self.renderer.invalidate()
+            return self.renderer.draw(self.state)
+        self.panels.draw(self.state)
+        return self.panels.preview(self.screen) if self._panel_preview else []
+
+    def enable_panels(self, left_size: tuple[int, int], right_size: tuple[int, int] | None = None,
+                      preview: bool | None = None) -> PanelSet:
+        """
+        눈마다 패널이 따로 있는 로봇용 분할 출력을 켭니다. 각 눈은 자기 크기의 Surface에 자기 좌표 엔진으로 그려지고,
+        반환된 PanelSet의 left/right.add_sink()로 등록한 출력 대상에 패널별 작업 스레드가 동시에 전송합니다.
+        preview=True이면 두 패널을 screen에 나란히 옮겨 그립니다. (기본: 창이 있을 때만)
+        """
+        self.disable_panels()
+        right_size = right_size or left_size
+        self.panels = PanelSet([
+            EyePanel(*size, is_right_eye, self.bg_color, self._dirty_rects, self._sprite_cache_bytes)
+            for size, is_right_eye in ((left_size, False), (right_size, True))
+        ])
+        self._panel_preview = not self.headless if preview is None else preview
+        self.screen.fill(self.bg_color)
+        self._drawn_snapshot = None
+        return self.panels
+
+    def disable_panels(self):
+        """ 분할 출력을 끄고 screen 하나에 양쪽 눈을 그리는 방식으로 돌아갑니다. """
+        if self.panels is not None:
+            self.panels.close()
+            self.panels = None
+            self.renderer.invalidate()
+            self._drawn_snapshot = None
 
-    def draw(self):
-        """ 눈을 화면에 그립니다. (수동 루프 제어용) """
-        self.renderer.draw(self.state)
+    def enable_profiler(self, capacity: int = 600, overlay: bool = False) -> FrameProfiler:
+        """
+        run()/start()/run_async() 렌더 루프의 단계별 시간 기록을 켜고 프로파일러를 반환합니다.
+        overlay=True이면 화면 왼쪽 위에 프레임 시간 그래프를 그립니다. (화면을 다시 그리는 프레임에만 갱신)
+        """
+        shown = self.profiler_overlay is not None
+        self.profiler = FrameProfiler(capacity, self.fps)
+        self.profiler_overlay = ProfilerOverlay() if overlay else None
+        if shown != overlay:
+            self._redraw_all()
+        return self.profiler
+
+    def disable_profiler(self):
+        """ 시간 기록과 오버레이를 끕니다. 오버레이가 남지 않도록 다음 프레임에 화면 전체를 다시 그립니다. """
+        if self.profiler_overlay is not None:
+            self._redraw_all()
+        self.profiler = self.profiler_overlay = None
+
+    def _redraw_all(self):
+        """
+        다음 프레임에 화면 전체를 다시 그리게 합니다. 눈 영역만 갱신하는 dirty_rects 모드나 패널 미리보기에서도
+        눈 밖에 그려진 것(프로파일러 오버레이 등)이 지워지고 화면에 반영됩니다.
+        """
+        self.screen.fill(self.bg_color)
+        self.renderer.invalidate()
+        if self.panels is not None:
+            self.panels.invalidate()
+        self._drawn_snapshot = None
+
+    def start_recording(self, path: str) -> StateRecorder:
+        """
+        화면에 반영하는 프레임마다 상태를 path에 기록하기 시작합니다. (noon.recording 참고)
+        seed와 화면 크기도 함께 남기므로 python -m noon.recording path로 그대로 재생할 수 있습니다.
+        """
+        self.stop_recording()
+        width, height = self.screen.get_size()
+        self.recorder = StateRecorder(path, {"seed": self.seed, "width": width, "height": height,
+                                             "fps": self.fps, "bg_color": list(self.bg_color)})
+        return self.recorder
+
+    def stop_recording(self):
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
+    def replay(self, log: StateLog | str, frame: int = 0, speed: float = 1.0, loop: bool = False) -> StateReplay:
+        """
+        기록을 재생합니다. 재생 중에는 시뮬레이션 대신 기록된 상태를 그리며, 끝나면 현재 감정으로 다시 전환합니다.
+        반환된 커서의 seek(frame)으로 아무 프레임으로나 바로 옮길 수 있습니다.
+        """
+        if isinstance(log, str):
+            log = StateLog(log)
+        self._replay = StateReplay(log, frame, speed, loop)
+        self._replay.log.state(self._replay.index, self.state)
+        self._forget_layers()
+        self.is_settled = False
+        return self._replay
+
+    def stop_replay(self):
+        self._replay = None
+        self._forget_layers()
+        self.is_settled = False
+
+    def _forget_layers(self):
+        """ 재생이 상태를 통째로 바꾸므로, 효과와 클립 레이어가 이전 상태에 대해 기록해 둔 양을 버립니다. """
+        self._effect_plan.forget()
+        self._clip_player.forget()
+
+    def add_sink(self, sink):
+        """
+        그려진 프레임을 받아갈 출력 대상을 등록합니다.
+        sink는 present(surface, rects) 메소드를 가져야 합니다. (noon.sinks.FramebufferSink 참고)
+        """
+        self.sinks.append(sink)
+
+    def present(self, rects: list[pygame.Rect]):
+        """
+        그려진 프레임을 디스플레이와 출력 대상에 반영합니다. dirty_rects 모드에서는 변경된 영역만 전송합니다.
+        rects가 비어 있으면(직전 프레임과 같음) 상태 기록만 하고 전송은 건너뜁니다.
+        """
+        if self.recorder is not None:
+            self.recorder.record(self.state)
+        if self.panels is not None:
+            # 패널 전송은 출력 스레드에서 진행되므로 아래 화면 반영과도 겹칩니다.
+            self.panels.present()
+        if not rects:
+            return # 직전 프레임과 같으면 화면과 출력 대상에 보낼 것이 없습니다.
+        for sink in self.sinks:
+            sink.present(self.screen, rects)
+        if self.headless:
+            return
+        if self.renderer.dirty_rects:
+            pygame.display.update(rects)
+        else:
+            pygame.display.flip()
+
+    def step(self, dt: float | None = None) -> list[pygame.Rect]:
+        """
+        한 프레임을 진행합니다: 상태를 dt초만큼 갱신하고 그린 뒤 화면에 반영합니다.
+        직접 프레임을 구동하는 headless 모드나 사용자 루프에서 사용하며, 갱신된 영역 목록을 반환합니다.
+        """
+        if self.screen.get_locked():
+            raise RuntimeError("frame_buffer()/frame_array()로 얻은 뷰를 해제한 뒤 다음 프레임을 그려야 합니다.")
+        self.update(dt)
+        rects = self.draw()
+        self.present(rects)
+        return rects
+
+    def frame_buffer(self) -> memoryview:
+        """
+        현재 프레임의 픽셀 메모리를 복사 없이 memoryview로 반환합니다.
+        headless 모드에서는 행마다 pitch 바이트인 32비트 픽셀(리틀 엔디언 B, G, R, X 순)입니다.
+        뷰가 살아있는 동안 Surface가 잠기므로, 다음 step() 전에 release() 해야 합니다.
+        """
+        return memoryview(self.screen.get_view("1"))
+
+    def frame_array(self):
+        """
+        현재 프레임을 복사 없이 (width, height, 3) RGB NumPy 뷰로 반환합니다.
+        뷰가 살아있는 동안 Surface가 잠기므로, 다음 step() 전에 참조를 지워야 합니다.
+        """
+        return pygame.surfarray.pixels3d(self.screen)
 
     def run(self):
         """
         메인 애플리케이션 루프를 시작합니다.
         이 메소드는 사용자의 Pygame 보일러플레이트를 모두 추상화합니다.
+        사용자가 'q' 키를 누르거나 창을 닫으면 반환합니다.
+        """
+        if self.headless:
+            raise RuntimeError("headless 모드에는 이벤트 루프가 없습니다. step()으로 프레임을 진행하세요.")
+        # 실행 중에 다른 스레드에서 온 명령은 큐를 거쳐 이 스레드에서 실행됩니다.
+        self._render_ident = threading.get_ident()
+        try:
+            while True:
+                running, idle = self._frame()
+                if not running:
+                    break
+                self._pace(idle)
+        finally:
+            self._render_ident = None
+            self.stop_recording()
+            self.disable_panels()
+        pygame.quit()
+
+    @property
+    def is_running(self) -> bool:
+        """ start() 또는 run_async()로 렌더 루프가 백그라운드에서 실행 중인지 여부. """
+        return self._background
+
+    def start(self):
+        """
+        렌더 루프를 백그라운드 스레드에서 시작하고 즉시 반환합니다. stop()으로 멈춥니다.
+        호출한 스레드는 로봇 제어 코드를 계속 실행하면서 set_emotion, set_gaze, play_clip 등으로 명령만 보내면 됩니다.
+        창 이벤트 처리는 SDL 제약상 리눅스(X11/KMS)와 headless 모드에서만 보장되며, macOS에서는 run_async()를 쓰세요.
+        """
+        self._begin_background()
+        self._render_thread = threading.Thread(target=self._thread_loop, name="noon-render", daemon=True)
+        self._render_thread.start()
+
+    def stop(self, timeout: float | None = None):
+        """
+        start()/run_async()로 시작한 렌더 루프와 콜백 작업 스레드를 멈추고, 스레드가 끝날 때까지 기다립니다.
+        콜백 안(렌더 스레드나 콜백 작업 스레드)에서 호출하면 멈추라는 신호만 보내고 바로 반환합니다.
+        (렌더 스레드가 끝나면서 콜백 작업 스레드를 기다리므로, 여기서 기다리면 서로를 기다리게 됩니다)
+        """
+        self._stop_event.set()
+        self._wake()
+        thread = self._render_thread
+        worker = self._callback_worker
+        if thread is None or thread is threading.current_thread() or (worker is not None and worker.is_current):
+            return
+        thread.join(timeout)
+        self._render_thread = None
+
+    async def run_async(self):
+        """
+        렌더 루프를 현재 asyncio 이벤트 루프의 태스크로 실행합니다.
+        asyncio.create_task(eyes.run_async())로 시작하고, stop()을 호출하거나 창이 닫히면 끝납니다.
+        """
+        self._begin_background()
+        self._async_loop = asyncio.get_running_loop()
+        self._async_wake = asyncio.Event()
+        try:
+            while not self._stop_event.is_set():
+                frame_start = time.perf_counter()
+                running, idle = self._frame()
+                if not running:
+                    break
+                if idle:
+                    # 명령이 들어오면 바로 깨어납니다.
+                    try:
+                        await asyncio.wait_for(self._async_wake.wait(), 1.0 / self.idle_fps)
+                    except asyncio.TimeoutError:
+                        pass
+                else:
+                    await asyncio.sleep(max(0.0, 1.0 / self.fps - (time.perf_counter() - frame_start)))
+                self._async_wake.clear()
+                profiler = self.profiler
+                if profiler is not None:
+                    profiler.mark("wait")
+                    profiler.end_frame(idle)
+        finally:
+            self._async_loop = self._async_wake = None
+            self._end_background()
+
+    def _begin_background(self):
+        if self._background:
+            raise RuntimeError("렌더 루프가 이미 실행 중입니다.")
+        self._stop_event.clear()
+        self._background = True
+        self._render_ident = threading.get_ident()
+        self._callback_worker = CallbackWorker()
+        self._callback_worker.start()
+
+    def _end_background(self):
+        self._callback_worker.stop()
+        self._callback_worker = None
+        self._background = False
+        self._render_ident = None
+        if self.panels is not None:
+            self.panels.wait()
+        self.commands.drain() # 멈추는 사이에 들어온 명령도 버리지 않고 적용합니다.
+
+    def _thread_loop(self):
+        """ start()로 만든 렌더 스레드의 본체. """
+        self._render_ident = threading.get_ident()
+        try:
+            while not self._stop_event.is_set():
+                running, idle = self._frame()
+                if not running:
+                    break
+                self._pace(idle)
+        finally:
+            self._end_background()
+
+    def _wake(self):
+        """ 유휴 대기 중인 렌더 루프를 깨워 새 명령을 바로 반영하게 합니다. """
+        self.commands.wake()
+        loop, wake = self._async_loop, self._async_wake
+        if loop is not None and wake is not None:
+            loop.call_soon_threadsafe(wake.set)
+        elif self._owns_display and pygame.display.get_init():
+            pygame.event.post(pygame.event.Event(WAKE_EVENT))
+
+    def _frame(self) -> tuple[bool, bool]:
+        """
+        이벤트 처리, 상태 갱신, 그리기를 한 프레임 진행합니다.
+        (계속 실행할지 여부, 화면에 바뀐 것이 없는 유휴 상태인지 여부)를 반환합니다.
         """
         running = True
-        while running:
-            # 1. 이벤트 처리
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.begin_frame()
+        # 1. 이벤트 처리
+        if self._owns_display:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
@@ -75,31 +708,68 @@ class Noon:
                     if event.key == pygame.K_q: # 'q' 키로 종료
                         running = False
                     if self._key_press_callback:
-                        self._key_press_callback(event.key)
-            
-            # 2. 매 프레임 콜백 실행
-            if self._every_frame_callback:
-                self._every_frame_callback()
-
-            # 3. 내부 상태 업데이트 및 렌더링
-            self.screen.fill(self.bg_color)
-            self.update()
-            self.draw()
-            
-            pygame.display.flip()
-            self.clock.tick(60)
+                        self._dispatch(object(), self._key_press_callback, event.key)
+        if profiler is not None:
+            profiler.mark("events")
 
-        pygame.quit()
-        sys.exit()
-
-    def _handle_dynamic_effects(self):
-        """ 현재 감정 프리셋의 'effects' 목록을 기반으로 애니메이션을 적용합니다. """
-        active_effects = {effect['type'] for effect in EMOTION_PRESETS[self.current_emotion]['effects']}
-        for effect_type, handler in EFFECT_HANDLER_MAP.items():
-            if effect_type in active_effects:
-                preset_effect = next((e for e in EMOTION_PRESETS[self.current_emotion]['effects'] if e['type'] == effect_type), None)
-                if preset_effect:
-                    params = {k: v for k, v in preset_effect.items() if k != 'type'}
-                    handler['apply'](self.state, **params)
-            elif 'clear' in handler:
-                handler['clear'](self.state)
\ No newline at end of file
+        # 2. 매 프레임 콜백 실행 (백그라운드 실행 중에는 밀린 호출을 하나로 합칩니다)
+        if self._every_frame_callback:
+            self._dispatch("every_frame", self._every_frame_callback)
+        if profiler is not None:
+            profiler.mark("callbacks")
+
+        # 3. 내부 상태 업데이트 및 렌더링 (배경 지우기는 렌더러가 담당)
+        frame_start = time.perf_counter()
+        self.update()
+        snapshot = self.state.snapshot()
+        if profiler is not None:
+            profiler.mark("update")
+        changed = snapshot != self._drawn_snapshot
+        if changed:
+            # 직전 프레임 작업이 프레임 예산을 넘었으면 그리기를 건너뛰어 시뮬레이션이 따라잡게 합니다.
+            behind = self._last_frame_work > 1.0 / self.fps
+            if behind and self._skipped_frames < self.max_frame_skip:
+                self._skipped_frames += 1
+            else:
+                rects = self.draw()
+                if profiler is not None:
+                    if self.profiler_overlay is not None:
+                        rects.append(self.profiler_overlay.draw(self.screen, profiler))
+                    profiler.mark("draw")
+                self.present(rects)
+                self._drawn_snapshot = snapshot
+                self._skipped_frames = 0
+                self._last_frame_work = time.perf_counter() - frame_start
+        if profiler is not None:
+            profiler.mark("present")
+
+        return running, self.is_settled and not changed
+
+    def _pace(self, idle: bool):
+        """ 다음 프레임까지 기다립니다. 화면에 바뀐 것이 없으면 그리지 않고, 낮은 주기로 이벤트만 기다립니다. """
+        if idle:
+            self._wait_idle()
+        else:
+            self.clock.tick(self.fps)
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.mark("wait")
+            profiler.end_frame(idle)
+
+    def _wait_idle(self):
+        """ 최대 1/idle_fps초 동안 이벤트나 명령을 기다립니다. 무언가 오면 즉시 깨어나 전체 속도로 돌아갑니다. """
+        timeout = 1.0 / self.idle_fps
+        if self._owns_display:
+            event = pygame.event.wait(int(timeout * 1000))
+            if event.type != pygame.NOEVENT:
+                pygame.event.post(event) # 다음 루프의 이벤트 처리에서 다루도록 되돌려 놓습니다.
+        else:
+            self.commands.wait(timeout)
+        self.clock.tick()
+
+    def _handle_dynamic_effects(self) -> bool:
+        """
+        현재 감정 프리셋의 'effects' 목록을 기반으로 애니메이션을 적용합니다.
+        활성 효과가 없고 모든 효과가 완전히 제거되었으면 True를 반환합니다.
+        """
+        return self._effect_plan.run(self.state)
@@ -0,0 +1,281 @@
+# noon/display_list.py
+"""
+그래픽 라이브러리와 독립적인 한 프레임의 도형 목록(디스플레이 리스트)과, 이를 그리는 Pygame 외 백엔드.
+NoonEngine이 계산한 좌표로 build_display_list()가 도형 목록을 만들고, 백엔드는 목록만 보고 그립니다.
+- Pygame: noon.face.NoonFaceRenderer.draw_list
+- NumPy: NumpyRasterizer (SDL 없는 headless 환경용)
+- SVG: to_svg (문서용)
+목록은 튜플이라 == 비교가 싸므로, 직전 프레임과 같은 목록이면 그리기와 전송을 통째로 건너뜁니다.
+
+도형은 눈 중심 기준 상대 좌표 튜플이며, 각도는 라디안(반시계 방향, 0=오른쪽), 사각형은 (x, y, w, h)입니다.
+- ("ellipse", color, rect)
+- ("rect", color, rect, border_radius)
+- ("line", color, (x1, y1), (x2, y2), width)
+- ("arc", color, rect, start_angle, stop_angle, width)  # 두께는 rect 안쪽으로
+- ("lids", color, rect, top, btm)  # rect의 위/아래에서 top/btm 픽셀 깊이까지 덮는 눈꺼풀
+"""
+import math
+from typing import NamedTuple
+import numpy as np
+from .model import NoonState
+
+HIGHLIGHT_COLOR = (255, 255, 255)
+LID_MARGIN = 2  # 눈꺼풀이 링의 안티에일리어싱 가장자리까지 덮도록 눈 영역보다 넓게 그리는 픽셀
+LID_SAG = 0.15  # 눈꺼풀 가장자리가 가운데에서 처지는 정도 (눈 높이 대비)
+LID_EDGE_STEPS = 16 # 눈꺼풀 가장자리 곡선을 근사하는 선분 수
+
+class DisplayList(NamedTuple):
+    """ 한 프레임의 디스플레이 리스트. eyes는 눈별 (중심 x, 중심 y, 상대 좌표 도형 튜플)입니다. """
+    size: tuple
+    bg_color: tuple
+    eyes: tuple
+
+def build_display_list(engine, state: NoonState, eyes: tuple[bool, ...] = (False, True),
+                       bg_color: tuple = (0, 0, 0)) -> DisplayList:
+    """ state를 engine의 좌표계로 그릴 디스플레이 리스트를 만듭니다. (eyes: False=왼쪽, True=오른쪽) """
+    return DisplayList((engine.width, engine.height), tuple(bg_color),
+                       tuple(eye_shapes(engine, state, is_right, bg_color) for is_right in eyes))
+
+def eye_shapes(engine, state: NoonState, is_right: bool, bg_color: tuple = (0, 0, 0)) -> tuple:
+    """ 한 쪽 눈의 중심 좌표와, 중심 기준 상대 좌표로 표현된 도형 목록을 계산합니다. """
+    # 1. 계산 (Engine 위임)
+    cx, cy = engine.get_eye_center(is_right, state)
+    cx += state.shake_x
+    cy += state.shake_y
+    w, h = engine.get_eye_dimensions(state)
+    color = tuple(state.color)
+    inner_w, inner_h = w * state.ring_inner_ratio, h * state.ring_inner_ratio
+
+    shapes = [
+        # 2. Outer Ring (도넛 몸통)
+        ("ellipse", color, (-w/2, -h/2, w, h)),
+        # 3. Inner Hole (구멍 뚫기)
+        ("ellipse", tuple(bg_color), (-inner_w/2, -inner_h/2, inner_w, inner_h)),
+        # 4. Reflection (알약 하이라이트)
+        _highlight_shape(inner_w, inner_h, state),
+    ]
+    # 5. Eyelids (링과 하이라이트를 가림)
+    if state.eyelid_top > 0 or state.eyelid_btm > 0:
+        shapes.append(_eyelid_shape(w, h, state, bg_color))
+    # 6. Eyebrows
+    shapes.append(_eyebrow_shape(w, h, color, state, is_right))
+    return cx, cy, tuple(shapes)
+
+def _highlight_shape(w, h, state):
+    hl_w = w * 0.3 * state.highlight_scale
+    hl_h = h * 0.2 * state.highlight_scale
+    hl_x = state.highlight_x * w * 0.4
+    hl_y = state.highlight_y * h * 0.4
+    return ("rect", HIGHLIGHT_COLOR, (hl_x - hl_w/2, hl_y - hl_h/2, hl_w, hl_h), int(hl_h))
+
+def _eyelid_shape(w, h, state, bg_color):
+    """ 눈꺼풀 도형. 위/아래 눈꺼풀이 덮는 깊이를 정수 픽셀로 양자화합니다. (Pygame 백엔드의 마스크 캐시 키) """
+    lid_h = h + 2 * LID_MARGIN
+    top = round(min(max(state.eyelid_top, 0.0), 1.0) * lid_h)
+    btm = round(min(max(state.eyelid_btm, 0.0), 1.0) * lid_h)
+    return ("lids", tuple(bg_color), (-w/2 - LID_MARGIN, -h/2 - LID_MARGIN, w + 2 * LID_MARGIN, lid_h), top, btm)
+
+def _eyebrow_shape(w, h, color, state, is_right: bool):
+    if state.eyebrow_shape == 'angry':
+        y_offset = -(h * 0.6) - (state.eyebrow_lift * 30)
+        x_extent = w * 0.6
+        angle_offset = w * 0.25
+
+        if is_right:
+            start_pos = (-x_extent, y_offset + angle_offset)
+            end_pos = (x_extent, y_offset - angle_offset)
+        else: # left eye
+            start_pos = (-x_extent, y_offset - angle_offset)
+            end_pos = (x_extent, y_offset + angle_offset)
+        return ("line", color, start_pos, end_pos, 14)
+
+    # default "arc" shape
+    brow_y = -(h * 0.6) - (state.eyebrow_lift * 20)
+    rect = (-w * 0.6, brow_y - h * 0.3, w * 1.2, h * 0.6)
+    return ("arc", color, rect, math.radians(40), math.radians(140), 12)
+
+def lid_edge(w: float, h: float, depth: float) -> list[tuple[float, float]]:
+    """
+    w x h 눈 영역을 위에서 depth만큼 덮는 눈꺼풀의 외곽 다각형. (왼쪽 위 기준 좌표)
+    가장자리는 가운데가 가장 깊고 양 끝으로 갈수록 올라가는 포물선입니다.
+    """
+    sag = min(depth, h * LID_SAG)
+    steps = LID_EDGE_STEPS
+    edge = [(w * (1 - i / steps), depth - sag * (2 * (1 - i / steps) - 1) ** 2) for i in range(steps + 1)]
+    return [(0, 0), (w, 0)] + edge
+
+def absolute_shapes(display_list: DisplayList):
+    """ 도형을 화면 절대 좌표로 옮긴 목록을 순서대로 내놓습니다. (좌표를 옮기는 것 외에는 형식이 같음) """
+    for cx, cy, shapes in display_list.eyes:
+        for shape in shapes:
+            kind, color = shape[0], shape[1]
+            if kind == "line":
+                (x1, y1), (x2, y2) = shape[2], shape[3]
+                yield (kind, color, (cx + x1, cy + y1), (cx + x2, cy + y2), shape[4])
+            else:
+                x, y, w, h = shape[2]
+                yield (kind, color, (cx + x, cy + y, w, h)) + shape[3:]
+
+class NumpyRasterizer:
+    """
+    디스플레이 리스트를 NumPy 배열에 그리는 백엔드. Pygame/SDL 없이 동작합니다.
+    픽셀은 0x00RRGGBB uint32 하나로 채우고(한 번의 스칼라 대입), pixels는 그 메모리를 (height, width, 3) RGB로 보는 뷰입니다.
+    도형마다 외접 사각형 범위의 픽셀 중심만 검사하며, 안티에일리어싱은 하지 않습니다. (Pygame 백엔드와 같음)
+    직전과 같은 목록이면 그리지 않고 skipped_frames만 늘립니다.
+    """
+    def __init__(self, width: int, height: int):
+        self.width, self.height = width, height
+        self.packed = np.zeros((height, width), dtype="<u4")
+        # 리틀 엔디언 0x00RRGGBB는 메모리에 B, G, R, 0 순서이므로 뒤집어 RGB로 봅니다. (복사 없음)
+        self.pixels = self.packed.view(np.uint8).reshape(height, width, 4)[..., 2::-1]
+        self._last = None
+        self.skipped_frames = 0
+
+    def render(self, display_list: DisplayList) -> bool:
+        """ 목록을 그립니다. 직전 목록과 같아 건너뛰었으면 False를 반환합니다. """
+        if display_list == self._last:
+            self.skipped_frames += 1
+            return False
+        self._last = display_list
+        self.packed.fill(_pack(display_list.bg_color))
+        for shape in absolute_shapes(display_list):
+            getattr(self, "_" + shape[0])(*shape[1:])
+        return True
+
+    def _region(self, x0, y0, x1, y1):
+        """ 화면 안으로 자른 정수 픽셀 범위와, 범위 내 픽셀 중심 좌표 격자(xs, ys)를 반환합니다. """
+        c0, r0 = max(int(math.floor(x0)), 0), max(int(math.floor(y0)), 0)
+        c1, r1 = min(int(math.ceil(x1)), self.width), min(int(math.ceil(y1)), self.height)
+        if c0 >= c1 or r0 >= r1:
+            return None
+        ys, xs = np.ogrid[r0:r1, c0:c1]
+        return (slice(r0, r1), slice(c0, c1)), xs + 0.5, ys + 0.5
+
+    def _fill(self, region, mask, color):
+        if region is not None:
+            self.packed[region[0]][mask] = _pack(color)
+
+    def _ellipse(self, color, rect):
+        x, y, w, h = rect
+        region = self._region(x, y, x + w, y + h)
+        if region is None or w <= 0 or h <= 0:
+            return
+        _, xs, ys = region
+        mask = ((xs - x - w / 2) / (w / 2)) ** 2 + ((ys - y - h / 2) / (h / 2)) ** 2 <= 1.0
+        self._fill(region, mask, color)
+
+    def _rect(self, color, rect, radius):
+        x, y, w, h = rect
+        region = self._region(x, y, x + w, y + h)
+        if region is None:
+            return
+        _, xs, ys = region
+        r = max(min(radius, w / 2, h / 2), 0)
+        # 모서리 원의 중심까지의 거리가 r 이하이면 안쪽 (직선 구간은 중심으로 눌러 붙임)
+        dx = np.maximum(np.abs(xs - x - w / 2) - (w / 2 - r), 0)
+        dy = np.maximum(np.abs(ys - y - h / 2) - (h / 2 - r), 0)
+        self._fill(region, dx * dx + dy * dy <= r * r, color)
+
+    def _line(self, color, start, end, width):
+        (x1, y1), (x2, y2) = start, end
+        pad = width / 2
+        region = self._region(min(x1, x2) - pad, min(y1, y2) - pad, max(x1, x2) + pad, max(y1, y2) + pad)
+        if region is None:
+            return
+        _, xs, ys = region
+        # Pygame처럼 두꺼운 선을 주 방향에 수직인 축(가로선이면 세로)으로 width만큼 벌린 평행사변형으로 그립니다.
+        if abs(x2 - x1) >= abs(y2 - y1):
+            (x1, y1), (x2, y2) = sorted(((x1, y1), (x2, y2)))
+            t = (xs - x1) / ((x2 - x1) or 1.0)
+            mask = (t >= 0) & (t <= 1) & (np.abs(ys - (y1 + t * (y2 - y1))) <= pad)
+        else:
+            (x1, y1), (x2, y2) = sorted(((x1, y1), (x2, y2)), key=lambda p: p[1])
+            t = (ys - y1) / ((y2 - y1) or 1.0)
+            mask = (t >= 0) & (t <= 1) & (np.abs(xs - (x1 + t * (x2 - x1))) <= pad)
+        self._fill(region, mask, color)
+
+    def _arc(self, color, rect, start, stop, width):
+        x, y, w, h = rect
+        region = self._region(x, y, x + w, y + h)
+        if region is None or w <= 0 or h <= 0:
+            return
+        _, xs, ys = region
+        a, b = w / 2, h / 2
+        dx, dy = xs - x - a, ys - y - b
+        outer = (dx / a) ** 2 + (dy / b) ** 2 <= 1.0
+        ia, ib = max(a - width, 1e-6), max(b - width, 1e-6)
+        inner = (dx / ia) ** 2 + (dy / ib) ** 2 < 1.0
+        # 각도 범위 검사: 시작/끝 방향 벡터와의 외적 부호로 판단합니다. (픽셀마다 arctan2를 부르지 않음)
+        px, py = dx / a, -dy / b
+        sx, sy, ex, ey = math.cos(start), math.sin(start), math.cos(stop), math.sin(stop)
+        after_start = sx * py - sy * px >= 0
+        before_stop = px * ey - py * ex >= 0
+        if (stop - start) % (2 * math.pi) <= math.pi:
+            within = after_start & before_stop
+        else:
+            within = after_start | before_stop
+        self._fill(region, outer & ~inner & within, color)
+
+    def _lids(self, color, rect, top, btm):
+        x, y, w, h = rect
+        for depth, bottom in ((min(top, h), False), (min(btm, h), True)):
+            if not depth:
+                continue
+            y0 = y + h - depth if bottom else y
+            region = self._region(x, y0, x + w, y0 + depth)
+            if region is None:
+                continue
+            _, xs, ys = region
+            # lid_edge의 포물선: 가장자리 깊이 = depth - sag * (2u - 1)^2
+            sag = min(depth, h * LID_SAG)
+            edge = depth - sag * (2 * (xs - x) / w - 1) ** 2
+            local = (y + h - ys) if bottom else (ys - y)
+            self._fill(region, local <= edge, color)
+
+def _pack(color) -> int:
+    r, g, b = color[:3]
+    return (int(r) << 16) | (int(g) << 8) | int(b)
+
+def _svg_color(color) -> str:
+    return "rgb({},{},{})".format(*color[:3])
+
+def to_svg(display_list: DisplayList) -> str:
+    """ 디스플레이 리스트를 SVG 문서 문자열로 변환합니다. (문서, 미리보기용) """
+    width, height = display_list.size
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+             f'viewBox="0 0 {width} {height}">',
+             f'<rect width="{width}" height="{height}" fill="{_svg_color(display_list.bg_color)}"/>']
+    for shape in absolute_shapes(display_list):
+        kind, color = shape[0], _svg_color(shape[1])
+        if kind == "ellipse":
+            x, y, w, h = shape[2]
+            parts.append(f'<ellipse cx="{x + w/2:.2f}" cy="{y + h/2:.2f}" rx="{w/2:.2f}" ry="{h/2:.2f}" fill="{color}"/>')
+        elif kind == "rect":
+            x, y, w, h = shape[2]
+            r = min(shape[3], w / 2, h / 2)
+            parts.append(f'<rect x="{x:.2f}" y="{y:.2f}" width="{w:.2f}" height="{h:.2f}" rx="{r:.2f}" fill="{color}"/>')
+        elif kind == "line":
+            (x1, y1), (x2, y2) = shape[2], shape[3]
+            parts.append(f'<line x1="{x1:.2f}" y1="{y1:.2f}" x2="{x2:.2f}" y2="{y2:.2f}" '
+                         f'stroke="{color}" stroke-width="{shape[4]}"/>')
+        elif kind == "arc":
+            x, y, w, h = shape[2]
+            start, stop, width = shape[3], shape[4], shape[5]
+            # 두께가 안쪽으로 그려지므로 선의 중심은 반지름에서 width/2만큼 들어간 곳입니다.
+            a, b = w / 2 - width / 2, h / 2 - width / 2
+            cx, cy = x + w / 2, y + h / 2
+            x1, y1 = cx + a * math.cos(start), cy - b * math.sin(start)
+            x2, y2 = cx + a * math.cos(stop), cy - b * math.sin(stop)
+            large = 1 if (stop - start) % (2 * math.pi) > math.pi else 0
+            parts.append(f'<path d="M {x1:.2f} {y1:.2f} A {a:.2f} {b:.2f} 0 {large} 0 {x2:.2f} {y2:.2f}" '
+                         f'fill="none" stroke="{color}" stroke-width="{width}"/>')
+        elif kind == "lids":
+            x, y, w, h = shape[2]
+            for depth, bottom in ((min(shape[3], h), False), (min(shape[4], h), True)):
+                if not depth:
+                    continue
+                points = [(x + px, y + h - py if bottom else y + py) for px, py in lid_edge(w, h, depth)]
+                path = " ".join(f"{px:.2f},{py:.2f}" for px, py in points)
+                parts.append(f'<polygon points="{path}" fill="{color}"/>')
+    parts.append("</svg>")
+    return "\n".join(parts)
@@ -1,22 +1,278 @@
 # noon/effects.py
+import inspect
+import math
 import random
+from functools import partial
+import numpy as np
+from .model import FIELD_INDEX
 from .transition import lerp
 
-def apply_shake(state, intensity: float):
-    """ state에 떨림 효과를 적용합니다. """
-    state.shake_x = random.uniform(-intensity, intensity)
-    state.shake_y = random.uniform(-intensity, intensity)
+SHAKE_EPSILON = 0.05 # 이 값(픽셀) 이하의 떨림은 0으로 고정합니다.
+EFFECT_RATE = 60 # 효과 테이블의 기본 샘플링 주기(Hz). EffectPlan.run() 한 번이 한 샘플입니다.
+NOISE_TABLE_SIZE = 4096 # 노이즈 테이블 길이 (샘플 수, 2의 거듭제곱). 60Hz에서 약 68초마다 반복됩니다.
+PERIOD_TABLE_SIZE = 64  # 깜빡임/미세 도약 간격 테이블 길이 (2의 거듭제곱)
 
-def clear_shake(state):
-    """ 떨림 효과를 부드럽게 제거합니다. """
+_SHAKE_X, _SHAKE_Y = FIELD_INDEX["shake_x"], FIELD_INDEX["shake_y"]
+_GAZE_X, _GAZE_Y = FIELD_INDEX["gaze_x"], FIELD_INDEX["gaze_y"]
+_LID_TOP, _LID_BTM = FIELD_INDEX["eyelid_top"], FIELD_INDEX["eyelid_btm"]
+_EYE_SCALE = FIELD_INDEX["eye_scale"]
+
+def smooth_noise(rng, frequency: float, rate: float = EFFECT_RATE, size: int = NOISE_TABLE_SIZE) -> list[float]:
+    """
+    -1~1 사이의 부드러운 value noise 테이블을 만듭니다. 끝과 처음이 이어지므로 인덱스를 순환하며 읽으면 됩니다.
+    초당 frequency개의 난수 제어점을 smoothstep으로 잇습니다. (rng는 uniform()을 가진 난수 생성기)
+    """
+    count = max(2, round(size * frequency / rate))
+    points = np.array([rng.uniform(-1.0, 1.0) for _ in range(count)])
+    position = np.arange(size) * (count / size)
+    index = position.astype(np.int64)
+    frac = position - index
+    frac = frac * frac * (3 - 2 * frac)
+    a, b = points[index % count], points[(index + 1) % count]
+    return (a + (b - a) * frac).tolist()
+
+def period_table(rng, interval: float, jitter: float, rate: float = EFFECT_RATE,
+                 size: int = PERIOD_TABLE_SIZE) -> list[int]:
+    """ 평균 interval초, ±jitter 비율로 흔들리는 간격 size개를 샘플 수로 만듭니다. (최소 1샘플) """
+    return [max(1, round(interval * (1 + rng.uniform(-jitter, jitter)) * rate)) for _ in range(size)]
+
+class NoiseShake:
+    """ 부드러운 노이즈 테이블을 따라가는 떨림. 매 프레임 난수를 뽑는 대신 미리 만든 두 축의 테이블을 순서대로 읽습니다. """
+    __slots__ = ("intensity", "x", "y", "step")
+
+    def __init__(self, intensity: float, frequency: float = 12.0, rng=random, rate: float = EFFECT_RATE):
+        self.intensity = intensity
+        self.x = smooth_noise(rng, frequency, rate)
+        self.y = smooth_noise(rng, frequency, rate)
+        self.step = 0
+
+    def __call__(self, state):
+        values, i = state.values, self.step
+        values[_SHAKE_X] = self.x[i] * self.intensity
+        values[_SHAKE_Y] = self.y[i] * self.intensity
+        self.step = (i + 1) & (NOISE_TABLE_SIZE - 1)
+
+class Blink:
+    """
+    주기적인 눈 깜빡임. 빠르게 감고 천천히 뜨는 곡선 하나와 깜빡임 간격 테이블을 미리 만들어 두고,
+    간격마다 곡선을 처음부터 읽어 eyelid_top(과 lower 비율만큼 eyelid_btm)에 더합니다.
+    """
+    __slots__ = ("curve", "depth", "lower", "periods", "index", "step")
+
+    def __init__(self, interval: float = 4.0, jitter: float = 0.5, duration: float = 0.2,
+                 depth: float = 1.0, lower: float = 0.15, rng=random, rate: float = EFFECT_RATE):
+        samples = max(2, round(duration * rate))
+        close = max(1, samples // 3)
+        # 감기: 0 → 1 (ease_in), 뜨기: 1 → 0 (ease_out)
+        self.curve = ([(i / close) ** 2 for i in range(close)] +
+                      [(1 - i / (samples - close)) ** 2 for i in range(samples - close + 1)])
+        self.depth = depth
+        self.lower = lower
+        self.periods = period_table(rng, interval, jitter, rate)
+        self.index = 0
+        self.step = 0
+
+    def __call__(self, state):
+        step = self.step
+        if step < len(self.curve):
+            closure = self.curve[step] * self.depth
+            values = state.values
+            values[_LID_TOP] += closure
+            values[_LID_BTM] += closure * self.lower
+        step += 1
+        if step >= self.periods[self.index]:
+            self.index = (self.index + 1) & (PERIOD_TABLE_SIZE - 1)
+            step = 0
+        self.step = step
+
+class MicroSaccade:
+    """ 시선의 미세 도약. 간격 테이블의 간격마다 미리 뽑아 둔 작은 시선 오프셋으로 건너뛰고, 다음 도약까지 유지합니다. """
+    __slots__ = ("amplitude", "dx", "dy", "periods", "index", "remaining")
+
+    def __init__(self, amplitude: float = 0.03, interval: float = 0.6, jitter: float = 0.6,
+                 rng=random, rate: float = EFFECT_RATE):
+        self.amplitude = amplitude
+        self.dx = [rng.uniform(-1.0, 1.0) for _ in range(PERIOD_TABLE_SIZE)]
+        self.dy = [rng.uniform(-1.0, 1.0) for _ in range(PERIOD_TABLE_SIZE)]
+        self.periods = period_table(rng, interval, jitter, rate)
+        self.index = 0
+        self.remaining = self.periods[0]
+
+    def __call__(self, state):
+        index = self.index
+        values = state.values
+        values[_GAZE_X] += self.dx[index] * self.amplitude
+        values[_GAZE_Y] += self.dy[index] * self.amplitude
+        self.remaining -= 1
+        if self.remaining <= 0:
+            self.index = index = (index + 1) & (PERIOD_TABLE_SIZE - 1)
+            self.remaining = self.periods[index]
+
+class Breathing:
+    """ eye_scale을 period초 주기로 amplitude만큼 오르내리게 합니다. 한 주기의 사인 곡선을 미리 계산해 둡니다. """
+    __slots__ = ("amplitude", "wave", "step")
+
+    def __init__(self, amplitude: float = 0.03, period: float = 4.0, rate: float = EFFECT_RATE):
+        samples = max(2, round(period * rate))
+        self.amplitude = amplitude
+        self.wave = [math.sin(2 * math.pi * i / samples) for i in range(samples)]
+        self.step = 0
+
+    def __call__(self, state):
+        step = self.step
+        state.values[_EYE_SCALE] += self.wave[step] * self.amplitude
+        step += 1
+        self.step = 0 if step == len(self.wave) else step
+
+def clear_shake(state) -> bool:
+    """ 떨림 효과를 부드럽게 제거합니다. 완전히 멈추면 True를 반환합니다. """
+    if abs(state.shake_x) <= SHAKE_EPSILON and abs(state.shake_y) <= SHAKE_EPSILON:
+        state.shake_x = state.shake_y = 0.0
+        return True
     state.shake_x = lerp(state.shake_x, 0, 0.2)
     state.shake_y = lerp(state.shake_y, 0, 0.2)
+    return False
 
 # 효과의 'type' 문자열과 실제 함수를 매핑합니다.
 # 'apply'는 효과가 활성화될 때, 'clear'는 비활성화될 때 호출됩니다.
+# 'clear'는 효과가 완전히 사라졌을 때 True를 반환하여 상태가 안정되었음을 알립니다.
+# 'apply'가 rng 인자를 받으면 EffectPlan에 준 난수 생성기가 전달됩니다.
+# 'setup'은 'apply' 대신 쓰며, EffectPlan을 만들 때 효과 파라미터와 rng, rate로 한 번 호출되어
+# 테이블을 미리 계산한 뒤 매 프레임 호출할 apply 함수(객체)를 반환합니다.
+# 'fields'에 적은 필드는 전환이 관리하는 값 위에 더해지는 레이어로, 다음 스텝 전에 EffectPlan.restore()로 걷어냅니다.
+# 'scale'은 {파라미터: 생략 시 기본값} 형식의 효과 세기로, 감정을 섞을 때(set_emotion_mix) 가중치를 곱해 합칩니다.
+# 세기 파라미터는 apply 함수의 인자 또는 setup이 반환한 객체의 같은 이름 속성이어야 하며, 테이블을 다시 만들지 않고 바꿀 수 있습니다.
 EFFECT_HANDLER_MAP = {
     "shake": {
-        "apply": apply_shake,
+        "setup": NoiseShake,
         "clear": clear_shake,
-    }
+        "scale": {"intensity": 0.0},
+    },
+    "blink": {
+        "setup": Blink,
+        "fields": ("eyelid_top", "eyelid_btm"),
+        "scale": {"depth": 1.0},
+    },
+    "saccade": {
+        "setup": MicroSaccade,
+        "fields": ("gaze_x", "gaze_y"),
+        "scale": {"amplitude": 0.03},
+    },
+    "breathing": {
+        "setup": Breathing,
+        "fields": ("eye_scale",),
+        "scale": {"amplitude": 0.03},
+    },
 }
+
+def _active_effects(effects: list, handler_map: dict):
+    """ 효과 목록에서 레지스트리에 있는 효과를 종류별로 처음 것만 (효과, 핸들러) 쌍으로 내놓습니다. """
+    seen = set()
+    for effect in effects:
+        handler = handler_map.get(effect['type'])
+        if handler is None or effect['type'] in seen:
+            continue
+        seen.add(effect['type'])
+        yield effect, handler
+
+def _structure(effect: dict, handler: dict) -> tuple:
+    """ 세기 파라미터를 뺀 효과 정의. 이 값이 같으면 테이블을 다시 만들지 않고 세기만 바꿀 수 있습니다. """
+    scale = handler.get('scale', {})
+    return effect['type'], tuple(sorted((k, v) for k, v in effect.items() if k != 'type' and k not in scale))
+
+def blend_effects(effect_lists: list, weights, handler_map: dict = EFFECT_HANDLER_MAP) -> list:
+    """
+    여러 감정 프리셋의 'effects' 목록을 가중치(합이 1)로 섞은 효과 목록을 만듭니다.
+    세기 파라미터('scale')는 프리셋별 값(생략 시 'scale'에 적은 기본값)의 가중합이고, 효과가 없는 프리셋은 0으로 셈합니다.
+    나머지 파라미터는 그 효과를 가진 프리셋 중 가중치가 가장 큰 것을 따릅니다.
+    """
+    best, sums = {}, {}
+    for effects, weight in zip(effect_lists, weights):
+        if weight <= 0:
+            continue
+        for effect, handler in _active_effects(effects, handler_map):
+            effect_type = effect['type']
+            if effect_type not in best or weight > best[effect_type][0]:
+                best[effect_type] = (weight, effect)
+            totals = sums.setdefault(effect_type, {})
+            for name, default in handler.get('scale', {}).items():
+                totals[name] = totals.get(name, 0.0) + weight * effect.get(name, default)
+    return [{**effect, **sums[effect_type]} for effect_type, (_, effect) in best.items()]
+
+class EffectPlan:
+    """
+    감정 프리셋의 'effects' 목록을 미리 컴파일한 실행 계획.
+    set_emotion 시 한 번만 만들어지며, 매 프레임에는 파라미터가 바인딩된 핸들러 목록만 호출합니다.
+    rng를 주면 rng 인자를 받는 핸들러에 바인딩하여, 전역 random 대신 그 생성기를 쓰게 합니다.
+    previous를 주면 직전 계획이 더해 둔 레이어 값을 다음 restore()에서 함께 걷어냅니다.
+    """
+    def __init__(self, effects: list, handler_map: dict = EFFECT_HANDLER_MAP, rng=None,
+                 rate: float = EFFECT_RATE, previous: "EffectPlan | None" = None):
+        active_types = set()
+        layer_fields = set()
+        self.appliers = []
+        self._structure = []
+        for effect, handler in _active_effects(effects, handler_map):
+            active_types.add(effect['type'])
+            params = {k: v for k, v in effect.items() if k != 'type'}
+            if 'setup' in handler:
+                if 'rng' in inspect.signature(handler['setup']).parameters:
+                    params['rng'] = rng or random
+                self.appliers.append(handler['setup'](**params, rate=rate))
+            else:
+                if rng is not None and 'rng' in inspect.signature(handler['apply']).parameters:
+                    params['rng'] = rng
+                self.appliers.append(partial(handler['apply'], **params))
+            layer_fields.update(handler.get('fields', ()))
+            self._structure.append(_structure(effect, handler))
+        self._handler_map = handler_map
+
+        # 비활성 효과의 clear 핸들러는 효과가 완전히 사라질 때까지만 실행합니다.
+        self.clears = [handler['clear'] for effect_type, handler in handler_map.items()
+                       if effect_type not in active_types and 'clear' in handler]
+
+        # 레이어 필드의 버퍼 인덱스와, 마지막 run()에서 더한 양
+        self.layer = tuple(sorted(FIELD_INDEX[field] for field in layer_fields))
+        self._deltas = previous._deltas if previous is not None else []
+
+    def rescale(self, effects: list) -> bool:
+        """
+        effects가 이 계획과 세기 파라미터만 다르면, 테이블과 진행 위치를 그대로 두고 세기만 바꾼 뒤 True를 반환합니다.
+        효과 종류나 다른 파라미터가 다르면 아무것도 바꾸지 않고 False를 반환합니다. (새 EffectPlan을 만들어야 함)
+        """
+        active = list(_active_effects(effects, self._handler_map))
+        if [_structure(effect, handler) for effect, handler in active] != self._structure:
+            return False
+        for apply, (effect, handler) in zip(self.appliers, active):
+            for name in handler.get('scale', {}):
+                if name not in effect:
+                    continue
+                if isinstance(apply, partial):
+                    apply.keywords[name] = effect[name]
+                else:
+                    setattr(apply, name, effect[name])
+        return True
+
+    def forget(self):
+        """ 마지막 run()에서 더한 양을 빼지 않고 버립니다. (values가 바깥에서 통째로 바뀐 경우, 예: 기록 재생) """
+        self._deltas = []
+
+    def restore(self, values):
+        """ 마지막 run()에서 레이어 필드에 더한 양을 values에서 뺍니다. (전환은 효과가 없는 값 위에서 진행) """
+        for index, delta in self._deltas:
+            values[index] -= delta
+        self._deltas = []
+
+    def run(self, state) -> bool:
+        """ 효과를 한 스텝 적용합니다. 활성 효과가 없고 모든 clear가 끝났으면 True를 반환합니다. """
+        layer = self.layer
+        if layer:
+            values = state.values
+            before = [values[index] for index in layer]
+        for apply in self.appliers:
+            apply(state)
+        if layer:
+            self._deltas = [(index, values[index] - value) for index, value in zip(layer, before)]
+        if self.clears:
+            self.clears = [clear for clear in self.clears if clear(state) is False]
+        return not self.appliers and not self.clears
@@ -1,10 +1,13 @@
 import math
-from .model import NoonState
+import numpy as np
+from .model import NoonState, NUMERIC_FIELDS, FIELD_INDEX, stack_states
 
 class NoonEngine:
     """
     렌더링을 위한 좌표 계산 및 물리 로직 엔진.
     그래픽 라이브러리(Pygame)와 독립적으로 작동합니다.
+    단일 상태용 메소드와 여러 얼굴을 한 번에 계산하는 NumPy 배치 메소드(*_batch)는
+    같은 수식을 공유하므로 결과가 정확히 일치합니다.
     """
     def __init__(self, width: int, height: int):
         self.width = width
@@ -20,6 +23,50 @@ class NoonEngine:
 
     def get_eye_center(self, is_right_eye: bool, state: NoonState) -> tuple[float, float]:
         """ Gaze(시선)에 따른 눈의 중심 좌표 계산 (Head Turn Logic) """
+        return self._eye_center(is_right_eye, state.gaze_x, state.gaze_y)
+
+    def get_eye_dimensions(self, state: NoonState) -> tuple[float, float]:
+        """ 이심률과 스케일이 적용된 눈의 너비/높이 계산 """
+        return self._eye_dimensions(state.eye_scale, state.eye_eccentricity)
+
+    def get_eye_centers_batch(self, gaze_x, gaze_y, shake_x=0.0, shake_y=0.0) -> np.ndarray:
+        """
+        N개 얼굴의 양쪽 눈 중심 좌표를 한 번에 계산합니다.
+        반환 shape은 (N, 2, 2) = [얼굴, 눈(0=왼쪽, 1=오른쪽), (x, y)] 입니다.
+        shake를 생략하면 get_eye_center와 같은 값(떨림 미적용)을 반환합니다.
+        """
+        gaze_x, gaze_y = np.asarray(gaze_x, dtype=np.float64), np.asarray(gaze_y, dtype=np.float64)
+        centers = np.empty(np.broadcast(gaze_x, gaze_y).shape + (2, 2))
+        for eye, is_right_eye in enumerate((False, True)):
+            cx, cy = self._eye_center(is_right_eye, gaze_x, gaze_y)
+            centers[..., eye, 0] = cx + shake_x
+            centers[..., eye, 1] = cy + shake_y
+        return centers
+
+    def get_eye_dimensions_batch(self, eye_scale, eye_eccentricity) -> np.ndarray:
+        """
+        N개 얼굴의 눈 너비/높이를 한 번에 계산합니다. (양쪽 눈의 크기는 같습니다)
+        반환 shape은 (N, 2) = [얼굴, (w, h)] 입니다.
+        """
+        w, h = self._eye_dimensions(np.asarray(eye_scale, dtype=np.float64),
+                                    np.asarray(eye_eccentricity, dtype=np.float64))
+        return np.stack(np.broadcast_arrays(w, h), axis=-1)
+
+    def get_geometry_batch(self, states) -> tuple[np.ndarray, np.ndarray]:
+        """
+        여러 상태의 (눈 중심 좌표, 눈 크기)를 한 번에 계산합니다. 중심 좌표에는 떨림(shake)이 포함됩니다.
+        states는 NoonState 목록, STATE_DTYPE 구조화 배열, 또는 (N, len(NUMERIC_FIELDS)) float 배열입니다.
+        """
+        values = self._as_field_matrix(states)
+        def column(name):
+            return values[:, FIELD_INDEX[name]]
+        centers = self.get_eye_centers_batch(column("gaze_x"), column("gaze_y"),
+                                             column("shake_x"), column("shake_y"))
+        dimensions = self.get_eye_dimensions_batch(column("eye_scale"), column("eye_eccentricity"))
+        return centers, dimensions
+
+    def _eye_center(self, is_right_eye: bool, gaze_x, gaze_y):
+        """ 스칼라와 NumPy 배열 모두에 쓰이는 눈 중심 좌표 수식 """
         spacing = self.width * self.base_spacing_ratio
         center_offset = spacing if is_right_eye else -spacing
         
@@ -27,13 +74,22 @@ class NoonEngine:
         max_pan_x = self.width * 0.3
         max_pan_y = self.height * 0.2
         
-        cx = (self.width / 2) + center_offset + (state.gaze_x * max_pan_x)
-        cy = (self.height / 2) + (state.gaze_y * max_pan_y)
+        cx = (self.width / 2) + center_offset + (gaze_x * max_pan_x)
+        cy = (self.height / 2) + (gaze_y * max_pan_y)
         return cx, cy
 
-    def get_eye_dimensions(self, state: NoonState) -> tuple[float, float]:
-        """ 이심률과 스케일이 적용된 눈의 너비/높이 계산 """
+    def _eye_dimensions(self, eye_scale, eye_eccentricity):
+        """ 스칼라와 NumPy 배열 모두에 쓰이는 눈 크기 수식 """
         r = self.base_radius
-        w = r * 2 * state.eye_eccentricity * state.eye_scale
-        h = r * 2 * state.eye_scale
-        return w, h
\ No newline at end of file
+        w = r * 2 * eye_eccentricity * eye_scale
+        h = r * 2 * eye_scale
+        return w, h
+
+    @staticmethod
+    def _as_field_matrix(states) -> np.ndarray:
+        """ 다양한 형태의 상태 묶음을 (N, len(NUMERIC_FIELDS)) float64 배열로 맞춥니다. """
+        if isinstance(states, np.ndarray):
+            if states.dtype.names:
+                return np.stack([states[name] for name in NUMERIC_FIELDS], axis=-1).astype(np.float64, copy=False)
+            return states.reshape(-1, len(NUMERIC_FIELDS))
+        return stack_states(states)
@@ -0,0 +1,210 @@
+# noon/export.py
+"""
+표정 스크립트를 창 없이 영상(Y4M, raw RGB) 또는 PNG 연속 이미지로 렌더링하는 오프라인 내보내기.
+
+1. 스크립트와 시드로 NoonState 궤적을 한 프로세스에서 순서대로 시뮬레이션하고 (같은 입력이면 항상 같은 궤적)
+2. 상태 스냅샷을 몇 프레임씩 묶어 프로세스 풀의 headless NoonFaceRenderer들이 병렬로 그리고 인코딩한 뒤
+3. 결과를 프레임 순서대로 파일에 이어 씁니다.
+시뮬레이션은 필요한 만큼만 앞서 진행하고 동시에 처리 중인 묶음 수를 제한하므로, 클립 길이와 상관없이 메모리 사용량이 일정합니다.
+
+스크립트는 [시각(초), 명령, 인자...] 목록입니다. 명령은 Noon의 같은 이름 메소드로 전달됩니다.
+    [[0.0, "set_emotion", "angry"], [0.8, "play_clip", "blink"], [1.2, "set_gaze", 0.5, 0.0]]
+
+사용법:
+    python -m noon.export script.json preview.y4m --duration 3 --size 800x400 --seed 1
+    python -m noon.export script.json frames/frame_%05d.png --workers 4
+"""
+import argparse
+import io
+import json
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import numpy as np
+import pygame
+from .engine import NoonEngine
+from .face import NoonFaceRenderer
+from .model import NoonState
+from .controller import Noon
+
+# 스크립트에서 쓸 수 있는 Noon 메소드
+SCRIPT_COMMANDS = ("set_emotion", "set_emotion_mix", "set_gaze", "play_clip", "stop_clip")
+
+def simulate(script: list, duration: float, fps: float = 60, seed: int = 0, width: int = 800, height: int = 400):
+    """
+    스크립트를 1/fps초 간격으로 시뮬레이션하며 프레임마다 NoonState.snapshot()을 내놓는 생성기.
+    동적 효과의 난수는 Noon의 seed로 고정되므로 전역 random 상태와 무관하게 항상 같은 궤적이 나옵니다.
+    """
+    events = sorted((float(event[0]), index, event[1], event[2:]) for index, event in enumerate(script))
+    for _, _, command, _ in events:
+        if command not in SCRIPT_COMMANDS:
+            raise ValueError(f"Unknown script command '{command}'. Use one of {list(SCRIPT_COMMANDS)}")
+    eyes = Noon(width, height, fps=fps, headless=True, seed=seed)
+    frame_time = 1.0 / fps
+    pending = deque(events)
+    for frame in range(round(duration * fps)):
+        now = frame * frame_time
+        while pending and pending[0][0] <= now + 1e-9:
+            _, _, command, args = pending.popleft()
+            getattr(eyes, command)(*args)
+        eyes.update(frame_time)
+        yield eyes.state.snapshot()
+
+def _to_yuv444(rgb: bytes, width: int, height: int) -> bytes:
+    """ RGB24 프레임을 Y, Cb, Cr 평면 순서의 YUV 4:4:4 (BT.601 전체 범위)로 바꿉니다. """
+    pixels = np.frombuffer(rgb, dtype=np.uint8).reshape(height, width, 3).astype(np.int32)
+    r, g, b = pixels[..., 0], pixels[..., 1], pixels[..., 2]
+    planes = np.empty((3, height, width), dtype=np.int32)
+    planes[0] = (77 * r + 150 * g + 29 * b + 128) >> 8
+    planes[1] = ((-43 * r - 85 * g + 128 * b + 128) >> 8) + 128
+    planes[2] = ((128 * r - 107 * g - 21 * b + 128) >> 8) + 128
+    return np.clip(planes, 0, 255).astype(np.uint8).tobytes()
+
+# 작업 프로세스마다 한 번 만드는 렌더러 (_init_worker)
+_worker = None
+
+def _init_worker(width: int, height: int, bg_color: tuple, encoding: str):
+    global _worker
+    screen = pygame.Surface((width, height), 0, 32)
+    renderer = NoonFaceRenderer(screen, NoonEngine(width, height))
+    renderer.bg_color = bg_color
+    _worker = (screen, renderer, encoding)
+
+def _render_chunk(snapshots: list) -> list[bytes]:
+    """ 스냅샷 묶음을 그리고 인코딩한 프레임 목록을 반환합니다. (작업 프로세스에서 실행) """
+    screen, renderer, encoding = _worker
+    frames = []
+    for snapshot in snapshots:
+        renderer.draw(NoonState.from_snapshot(snapshot))
+        if encoding == "png":
+            buffer = io.BytesIO()
+            pygame.image.save(screen, buffer, "frame.png")
+            frames.append(buffer.getvalue())
+        else:
+            rgb = pygame.image.tobytes(screen, "RGB")
+            frames.append(_to_yuv444(rgb, *screen.get_size()) if encoding == "yuv444" else rgb)
+    return frames
+
+class Y4MWriter:
+    """ YUV4MPEG2 (C444, 전체 범위) 영상. ffmpeg, mpv 등에서 바로 열 수 있습니다. """
+    encoding = "yuv444"
+
+    def __init__(self, path: str, width: int, height: int, fps: float):
+        self._file = open(path, "wb")
+        rate = f"{round(fps * 1000)}:1000" if fps != int(fps) else f"{int(fps)}:1"
+        self._file.write(f"YUV4MPEG2 W{width} H{height} F{rate} Ip A1:1 C444 XCOLORRANGE=FULL\n".encode())
+
+    def write(self, frame: bytes):
+        self._file.write(b"FRAME\n")
+        self._file.write(frame)
+
+    def close(self):
+        self._file.close()
+
+class RawWriter:
+    """ 헤더 없는 RGB24 프레임 연속. (ffmpeg -f rawvideo -pix_fmt rgb24 -s WxH) """
+    encoding = "rgb"
+
+    def __init__(self, path: str, width: int, height: int, fps: float):
+        self._file = open(path, "wb")
+
+    def write(self, frame: bytes):
+        self._file.write(frame)
+
+    def close(self):
+        self._file.close()
+
+class PNGSequenceWriter:
+    """ 프레임마다 PNG 파일 하나. pattern은 프레임 번호가 들어갈 %d 서식을 포함합니다. (예: frames/frame_%05d.png) """
+    encoding = "png"
+
+    def __init__(self, pattern: str, width: int, height: int, fps: float):
+        self.pattern = pattern
+        self.index = 0
+        os.makedirs(os.path.dirname(pattern) or ".", exist_ok=True)
+
+    def write(self, frame: bytes):
+        with open(self.pattern % self.index, "wb") as f:
+            f.write(frame)
+        self.index += 1
+
+    def close(self):
+        pass
+
+def open_writer(path: str, width: int, height: int, fps: float):
+    """ 경로로 출력 형식을 고릅니다: .y4m, .rgb/.raw, %d가 들어간 .png 패턴 또는 디렉토리 """
+    if path.endswith(".y4m"):
+        return Y4MWriter(path, width, height, fps)
+    if path.endswith((".rgb", ".raw")):
+        return RawWriter(path, width, height, fps)
+    if "%" in path:
+        return PNGSequenceWriter(path, width, height, fps)
+    if path.endswith(os.sep) or os.path.isdir(path) or not os.path.splitext(path)[1]:
+        return PNGSequenceWriter(os.path.join(path, "frame_%05d.png"), width, height, fps)
+    raise ValueError(f"Unsupported output '{path}'. Use .y4m, .rgb/.raw or a PNG pattern like frames/frame_%05d.png")
+
+def export(script: list, path: str, duration: float | None = None, width: int = 800, height: int = 400,
+           fps: float = 60, seed: int = 0, bg_color: tuple = (0, 0, 0),
+           workers: int | None = None, chunk_frames: int = 8) -> int:
+    """
+    스크립트를 렌더링하여 path에 저장하고, 쓴 프레임 수를 반환합니다.
+    duration을 생략하면 마지막 명령 1초 뒤까지 렌더링합니다.
+    workers는 렌더링 프로세스 수(None이면 CPU 수, 0이면 현재 프로세스에서 직접)이며,
+    동시에 처리 중인 묶음은 최대 workers x 2개라 메모리에는 그만큼의 프레임만 머뭅니다.
+    """
+    if duration is None:
+        duration = max((float(event[0]) for event in script), default=0.0) + 1.0
+    writer = open_writer(path, width, height, fps)
+    trajectory = simulate(script, duration, fps, seed, width, height)
+    chunks = iter(lambda: list(islice(trajectory, chunk_frames)), [])
+    written = 0
+    try:
+        if workers == 0:
+            _init_worker(width, height, bg_color, writer.encoding)
+            for chunk in chunks:
+                written += _write_frames(writer, _render_chunk(chunk))
+            return written
+        workers = workers or os.cpu_count() or 1
+        # 작업 프로세스는 렌더러만 새로 만들면 되므로, 스레드가 있는 프로세스를 fork하지 않고 spawn으로 띄웁니다.
+        with ProcessPoolExecutor(workers, multiprocessing.get_context("spawn"), initializer=_init_worker,
+                                 initargs=(width, height, bg_color, writer.encoding)) as pool:
+            window = 2 * workers
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(_render_chunk, chunk))
+                # 창이 가득 찼거나 맨 앞 묶음이 끝났으면 순서대로 씁니다.
+                while len(pending) >= window or (pending and pending[0].done()):
+                    written += _write_frames(writer, pending.popleft().result())
+            while pending:
+                written += _write_frames(writer, pending.popleft().result())
+        return written
+    finally:
+        trajectory.close()
+        writer.close()
+
+def _write_frames(writer, frames: list[bytes]) -> int:
+    for frame in frames:
+        writer.write(frame)
+    return len(frames)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render a noon_noon expression script offline")
+    parser.add_argument("script", help="[시각, 명령, 인자...] 목록이 담긴 JSON 파일")
+    parser.add_argument("output", help=".y4m, .rgb/.raw 또는 frames/frame_%%05d.png")
+    parser.add_argument("--duration", type=float, help="렌더링할 길이(초)")
+    parser.add_argument("--size", default="800x400", help="가로x세로 픽셀")
+    parser.add_argument("--fps", type=float, default=60)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, help="렌더링 프로세스 수 (0이면 현재 프로세스)")
+    args = parser.parse_args(argv)
+
+    with open(args.script, encoding="utf-8") as f:
+        script = json.load(f)
+    width, height = (int(value) for value in args.size.lower().split("x"))
+    frames = export(script, args.output, args.duration, width, height, args.fps, args.seed, workers=args.workers)
+    print(f"wrote {frames} frames to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -2,68 +2,205 @@ import pygame
 import math
 from .model import NoonState
 from .engine import NoonEngine
+from .cache import LRUCache
+from .display_list import DisplayList, build_display_list, lid_edge
+
+DIRTY_MARGIN = 2  # 안티에일리어싱/정수 변환 오차를 덮기 위한 여유 픽셀
+SPRITE_MIN_REPEATS = 3  # 같은 눈에 같은 모양이 이 횟수만큼 연속으로 그려져야 스프라이트로 캐싱
+SPRITE_COLORKEY = (255, 0, 255) # 스프라이트의 투명 영역을 나타내는 색 (눈 도형에 쓰지 않는 색)
+LID_MASK_CACHE_BYTES = 8 * 1024 * 1024
+LID_MASK_QUANTUM = 4  # 마스크 크기를 이 픽셀 단위로 올림 (숨쉬기처럼 눈 크기가 조금씩 변해도 같은 마스크를 재사용)
 
 class NoonFaceRenderer:
     """
-    NoonState와 NoonEngine을 사용하여 실제 화면에 픽셀을 그리는 렌더러.
+    NoonState와 NoonEngine을 사용하여 실제 화면에 픽셀을 그리는 렌더러. (디스플레이 리스트의 Pygame 백엔드)
+    도형 계산은 noon.display_list가 맡고, 렌더러는 목록을 그리기만 합니다. 직전 프레임과 같은 목록이면 아무것도 그리지 않습니다.
+    dirty_rects=True이면 화면 전체 대신 눈이 차지하는 영역만 지우고 다시 그립니다.
+    sprite_cache_bytes > 0이면 눈 모양을 sprite_quantum 픽셀 단위로 양자화하여 미리 그린 Surface를
+    LRU 캐시에 보관하고, 떨림/시선 이동은 단순 blit 위치 이동으로 처리합니다.
+    눈꺼풀은 배경색 가림 마스크를 링과 하이라이트 위에 덮어 그리며, 마스크는 픽셀 단위 깊이와 양자화한 눈 크기별로 캐시됩니다.
+    eyes로 그릴 눈을 고릅니다. (False=왼쪽, True=오른쪽. 눈마다 패널이 따로 있으면 한 쪽만 그림, noon.panels 참고)
     """
-    def __init__(self, screen: pygame.Surface, engine: NoonEngine):
+    def __init__(self, screen: pygame.Surface, engine: NoonEngine, dirty_rects: bool = False,
+                 sprite_cache_bytes: int = 0, sprite_quantum: float = 1.0,
+                 eyes: tuple[bool, ...] = (False, True)):
         self.screen = screen
         self.engine = engine
+        self.eyes = eyes
         self.bg_color = (0, 0, 0)
+        self.dirty_rects = dirty_rects
+        self._last_bounds = None # 직전 프레임의 눈별 영역 (None이면 전체 다시 그리기)
+        self._last_list = None   # 직전 프레임에 그린 디스플레이 리스트
+        self.skipped_frames = 0  # 목록이 같아 그리기를 건너뛴 프레임 수
+
+        # 1px 양자화는 pygame.Rect의 정수 변환과 같은 해상도이므로 전환 중 계단 현상이 보이지 않습니다.
+        self.sprite_quantum = sprite_quantum
+        self.sprite_cache = None
+        if sprite_cache_bytes > 0:
+            self.sprite_cache = LRUCache(sprite_cache_bytes, lambda entry: entry[0].get_pitch() * entry[0].get_height())
+        self._miss_streaks = {} # 눈 번호 → (마지막으로 직접 그린 모양, 연속 횟수)
+        # 눈꺼풀 가림 마스크 캐시. 깜빡임은 몇 프레임 만에 모든 깊이를 지나가므로 한 번 만든 마스크를 재사용합니다.
+        self.lid_masks = LRUCache(LID_MASK_CACHE_BYTES, lambda mask: mask.get_pitch() * mask.get_height())
+
+    def invalidate(self):
+        """ 다음 draw()에서 화면 전체를 다시 그리도록 합니다. (외부에서 화면을 덮어쓴 경우) """
+        self._last_bounds = None
+        self._last_list = None
+
+    def build(self, state: NoonState) -> DisplayList:
+        """ state를 이 렌더러의 화면에 그릴 디스플레이 리스트를 만듭니다. """
+        return build_display_list(self.engine, state, self.eyes, self.bg_color)
+
+    def draw(self, state: NoonState) -> list[pygame.Rect]:
+        """ 눈을 그리고, 화면에 반영해야 할 영역 목록을 반환합니다. 직전 프레임과 같으면 빈 목록입니다. """
+        return self.draw_list(self.build(state))
+
+    def draw_list(self, display_list: DisplayList) -> list[pygame.Rect]:
+        """ 디스플레이 리스트를 그리고, 화면에 반영해야 할 영역 목록을 반환합니다. 직전 프레임과 같으면 빈 목록입니다. """
+        if self.sprite_cache is not None:
+            display_list = display_list._replace(
+                eyes=tuple(self._quantize(cx, cy, shapes) for cx, cy, shapes in display_list.eyes))
+        if display_list == self._last_list:
+            self.skipped_frames += 1
+            return []
+        self._last_list = display_list
+        eyes = display_list.eyes
+
+        if not self.dirty_rects:
+            self.screen.fill(self.bg_color)
+            for eye, (cx, cy, shapes) in enumerate(eyes):
+                self._draw_eye(eye, cx, cy, shapes)
+            return [self.screen.get_rect()]
+
+        # Damage tracking: 이번 프레임과 직전 프레임 영역의 합집합만 다시 그린다.
+        bounds = [self._shapes_bounds(cx, cy, shapes) for cx, cy, shapes in eyes]
+        if self._last_bounds is None:
+            self.screen.fill(self.bg_color)
+            dirty = [self.screen.get_rect()]
+        else:
+            screen_rect = self.screen.get_rect()
+            dirty = [new.union(old).clip(screen_rect) for new, old in zip(bounds, self._last_bounds)]
+            for rect in dirty:
+                self.screen.fill(self.bg_color, rect)
+
+        for eye, (cx, cy, shapes) in enumerate(eyes):
+            self._draw_eye(eye, cx, cy, shapes)
+        self._last_bounds = bounds
+        return dirty
+
+    def _lid_mask(self, w: int, h: int, depth: int, bottom: bool, color) -> pygame.Surface:
+        """
+        w x h 눈 영역을 위(또는 아래)에서 depth 픽셀만큼 덮는 가림 마스크를 캐시에서 찾거나 만듭니다.
+        w, h는 LID_MASK_QUANTUM 단위로 올려서 만들므로 마스크가 눈 영역보다 조금 넓을 수 있습니다. (가운데 맞춰 blit)
+        """
+        q = LID_MASK_QUANTUM
+        w, h = -(-w // q) * q, -(-h // q) * q
+        key = (w, h, depth, bottom, color)
+        mask = self.lid_masks.get(key)
+        if mask is not None:
+            return mask
+
+        mask = pygame.Surface((w, depth), 0, self.screen)
+        key_color = tuple(255 - c for c in color[:3]) # 마스크 바깥은 투명
+        mask.fill(key_color)
+        pygame.draw.polygon(mask, color, lid_edge(w, h, depth))
+        mask.set_colorkey(key_color)
+        if bottom:
+            mask = pygame.transform.flip(mask, False, True)
+        return self.lid_masks.put(key, mask)
+
+    def _quantize(self, cx, cy, shapes):
+        """ 중심을 정수 픽셀로, 도형 좌표를 sprite_quantum 단위로 반올림하여 캐시 키로 쓸 수 있게 만듭니다. """
+        q = self.sprite_quantum
+        quantized = []
+        for shape in shapes:
+            kind, color = shape[0], shape[1]
+            if kind == "line":
+                (x1, y1), (x2, y2) = shape[2], shape[3]
+                quantized.append((kind, color, (round(x1 / q) * q, round(y1 / q) * q),
+                                  (round(x2 / q) * q, round(y2 / q) * q), shape[4]))
+            else:
+                rect = tuple(round(v / q) * q for v in shape[2])
+                quantized.append((kind, color, rect) + shape[3:])
+        return round(cx), round(cy), tuple(quantized)
+
+    def _draw_eye(self, eye: int, cx, cy, shapes):
+        """ eye번째 눈을 그립니다. 스프라이트 캐시가 켜져 있으면 캐시된 Surface를 blit 합니다. """
+        if self.sprite_cache is None:
+            self._draw_shapes(self.screen, cx, cy, shapes)
+            return
+
+        entry = self.sprite_cache.get(shapes)
+        if entry is None:
+            last, streak = self._miss_streaks.get(eye, (None, 0))
+            streak = streak + 1 if shapes == last else 1
+            if streak < SPRITE_MIN_REPEATS:
+                # 전환 중처럼 모양이 매 프레임 바뀌면 캐싱 비용만 들므로,
+                # 같은 눈에 같은 모양이 연속으로 그려질 때에만 스프라이트를 만듭니다. (떨림/시선 이동은 위치만 바뀜)
+                self._miss_streaks[eye] = (shapes, streak)
+                self._draw_shapes(self.screen, cx, cy, shapes)
+                return
+            self._miss_streaks.pop(eye, None)
+            entry = self.sprite_cache.put(shapes, self._render_sprite(shapes))
+
+        sprite, (dx, dy) = entry
+        self.screen.blit(sprite, (cx + dx, cy + dy))
+
+    def _render_sprite(self, shapes):
+        """ 도형 목록을 딱 맞는 크기의 Surface에 그리고, (Surface, 중심 기준 좌상단 좌표)를 반환합니다. """
+        local = self._shapes_bounds(0, 0, shapes)
+        sprite = pygame.Surface(local.size, 0, self.screen)
+        # 여백만 전용 colorkey로 투명하게 하고, 배경색으로 그린 안쪽 구멍과 눈꺼풀은 직접 그릴 때처럼 덮어 그립니다.
+        sprite.fill(SPRITE_COLORKEY)
+        self._draw_shapes(sprite, -local.x, -local.y, shapes)
+        # 그리기를 마친 뒤 colorkey를 지정해야 RLE 가속이 유지됩니다.
+        sprite.set_colorkey(SPRITE_COLORKEY, pygame.RLEACCEL)
+        return sprite, local.topleft
+
+    def _draw_shapes(self, surface: pygame.Surface, ox, oy, shapes):
+        """ 상대 좌표 도형 목록을 (ox, oy)를 원점으로 surface에 그립니다. """
+        for shape in shapes:
+            kind, color = shape[0], shape[1]
+            if kind == "ellipse":
+                x, y, w, h = shape[2]
+                pygame.draw.ellipse(surface, color, pygame.Rect(ox + x, oy + y, w, h))
+            elif kind == "rect":
+                x, y, w, h = shape[2]
+                pygame.draw.rect(surface, color, pygame.Rect(ox + x, oy + y, w, h), border_radius=shape[3])
+            elif kind == "line":
+                (x1, y1), (x2, y2) = shape[2], shape[3]
+                pygame.draw.line(surface, color, (ox + x1, oy + y1), (ox + x2, oy + y2), width=shape[4])
+            elif kind == "arc":
+                x, y, w, h = shape[2]
+                pygame.draw.arc(surface, color, pygame.Rect(ox + x, oy + y, w, h), shape[3], shape[4], width=shape[5])
+            elif kind == "lids":
+                x, y, w, h = shape[2]
+                rect = pygame.Rect(ox + x, oy + y, w, h)
+                top, btm = min(shape[3], rect.h), min(shape[4], rect.h)
+                if top:
+                    mask = self._lid_mask(rect.w, rect.h, top, False, color)
+                    surface.blit(mask, (rect.centerx - mask.get_width() // 2, rect.y))
+                if btm:
+                    mask = self._lid_mask(rect.w, rect.h, btm, True, color)
+                    surface.blit(mask, (rect.centerx - mask.get_width() // 2, rect.bottom - btm))
+
+    def _shapes_bounds(self, ox, oy, shapes) -> pygame.Rect:
+        """ 도형 목록이 차지하는 화면 영역(외접 사각형)을 계산합니다. """
+        left = top = math.inf
+        right = bottom = -math.inf
+        for shape in shapes:
+            if shape[0] == "line":
+                (x1, y1), (x2, y2) = shape[2], shape[3]
+                pad = shape[4] / 2
+                x, y = min(x1, x2) - pad, min(y1, y2) - pad
+                w, h = abs(x2 - x1) + 2 * pad, abs(y2 - y1) + 2 * pad
+            else:
+                x, y, w, h = shape[2]
+            left, top = min(left, x), min(top, y)
+            right, bottom = max(right, x + w), max(bottom, y + h)
 
-    def draw(self, state: NoonState):
-        self.screen.fill(self.bg_color)
-        self._draw_eye(state, is_right=False)
-        self._draw_eye(state, is_right=True)
-
-    def _draw_eye(self, state: NoonState, is_right: bool):
-        # 1. 계산 (Engine 위임)
-        cx, cy = self.engine.get_eye_center(is_right, state)
-        cx += state.shake_x
-        cy += state.shake_y
-        w, h = self.engine.get_eye_dimensions(state)
-        
-        # 2. Outer Ring (도넛 몸통)
-        rect = pygame.Rect(cx - w/2, cy - h/2, w, h)
-        pygame.draw.ellipse(self.screen, state.color, rect)
-
-        # 3. Inner Hole (구멍 뚫기)
-        inner_w, inner_h = w * state.ring_inner_ratio, h * state.ring_inner_ratio
-        inner_rect = pygame.Rect(cx - inner_w/2, cy - inner_h/2, inner_w, inner_h)
-        pygame.draw.ellipse(self.screen, self.bg_color, inner_rect)
-
-        # 4. Reflection (알약 하이라이트)
-        self._draw_highlight(cx, cy, inner_w, inner_h, state)
-
-        # 5. Eyebrows
-        self._draw_eyebrow(cx, cy, w, h, state, is_right)
-
-    def _draw_highlight(self, cx, cy, w, h, state):
-        hl_w = w * 0.3 * state.highlight_scale
-        hl_h = h * 0.2 * state.highlight_scale
-        hl_x = cx + (state.highlight_x * w * 0.4)
-        hl_y = cy + (state.highlight_y * h * 0.4)
-        
-        rect = pygame.Rect(hl_x - hl_w/2, hl_y - hl_h/2, hl_w, hl_h)
-        pygame.draw.rect(self.screen, (255, 255, 255), rect, border_radius=int(hl_h))
-
-    def _draw_eyebrow(self, cx, cy, w, h, state, is_right: bool):
-        if state.eyebrow_shape == 'angry':
-            y_offset = cy - (h * 0.6) - (state.eyebrow_lift * 30)
-            x_extent = w * 0.6
-            angle_offset = w * 0.25
-            
-            if is_right:
-                start_pos = (cx - x_extent, y_offset + angle_offset)
-                end_pos = (cx + x_extent, y_offset - angle_offset)
-            else: # left eye
-                start_pos = (cx - x_extent, y_offset - angle_offset)
-                end_pos = (cx + x_extent, y_offset + angle_offset)
-            
-            pygame.draw.line(self.screen, state.color, start_pos, end_pos, width=14)
-        
-        else: # default "arc" shape
-            brow_y = cy - (h * 0.6) - (state.eyebrow_lift * 20)
-            rect = pygame.Rect(cx - w * 0.6, brow_y - h * 0.3, w * 1.2, h * 0.6)
-            pygame.draw.arc(self.screen, state.color, rect, math.radians(40), math.radians(140), width=12)
+        x0 = math.floor(ox + left) - DIRTY_MARGIN
+        y0 = math.floor(oy + top) - DIRTY_MARGIN
+        x1 = math.ceil(ox + right) + DIRTY_MARGIN
+        y1 = math.ceil(oy + bottom) + DIRTY_MARGIN
+        return pygame.Rect(x0, y0, x1 - x0, y1 - y0)
@@ -0,0 +1,95 @@
+# noon/gaze.py
+import math
+import time
+from collections import deque
+
+class GazeFilter:
+    """
+    시선 추적기에서 들어오는 잡음 섞인 고속 샘플을 다듬어, 다음 프레임이 화면에 표시될 시점의 시선을 예측하는 필터.
+    One-Euro 필터(Casiez et al., 2012) 방식으로 느리게 움직일 때는 강하게 평활하여 떨림을 없애고,
+    빠르게 움직일 때는 차단 주파수를 높여 지연을 줄입니다.
+    평활로 생긴 지연(저역 통과 필터의 시정수)과 표시 시점까지 남은 시간만큼, 추정한 속도로 앞당겨 예측합니다.
+
+    - push(): 아무 스레드에서나, 아무 주기로 타임스탬프가 있는 샘플을 넣습니다.
+    - update(): 렌더 루프가 프레임마다 한 번 호출하여 그동안 쌓인 샘플을 한꺼번에 처리합니다.
+    - saccade_threshold: 필터 값과 새 샘플의 차이가 이보다 크면 평활하지 않고 바로 건너뜁니다. (None이면 사용 안 함)
+    """
+    def __init__(self, min_cutoff: float = 1.0, beta: float = 2.0, d_cutoff: float = 0.5,
+                 max_lead: float = 0.1, saccade_threshold: float | None = None, timeout: float = 0.5):
+        self.min_cutoff = min_cutoff   # 정지 시 차단 주파수(Hz): 낮을수록 떨림이 줄고 지연이 늘어납니다.
+        self.beta = beta               # 속도에 따라 차단 주파수를 올리는 비율: 높을수록 빠른 움직임의 지연이 줄어듭니다.
+        self.d_cutoff = d_cutoff       # 속도 추정용 저역 통과 차단 주파수(Hz)
+        self.max_lead = max_lead       # 예측으로 앞당기는 최대 시간(초)
+        self.saccade_threshold = saccade_threshold
+        self.timeout = timeout         # 이 시간(초) 동안 샘플이 없으면 추적을 멈춥니다.
+        self._pending = deque()        # 아직 처리하지 않은 (t, x, y) 샘플. append/popleft는 스레드 안전합니다.
+        self.reset()
+
+    def reset(self):
+        """ 필터 상태를 지웁니다. 다음 샘플부터 새로 시작합니다. """
+        self._t = None
+        self._x = self._y = 0.0   # 평활된 위치
+        self._rx = self._ry = 0.0 # 직전 원본 샘플 (속도 계산용)
+        self._dx = self._dy = 0.0 # 평활된 속도(초당)
+        self._lag = 0.0           # 위치 평활 필터의 현재 시정수(초)
+        self._saccade = False
+
+    @property
+    def has_pending(self) -> bool:
+        """ 아직 처리하지 않은 샘플이 있는지 여부. """
+        return bool(self._pending)
+
+    def push(self, x: float, y: float, timestamp: float | None = None):
+        """ 샘플 하나를 넣습니다. timestamp는 time.perf_counter() 기준 초이며, 생략하면 현재 시각입니다. """
+        self._pending.append((time.perf_counter() if timestamp is None else timestamp, x, y))
+
+    def push_many(self, samples):
+        """ (timestamp, x, y) 샘플 여러 개를 한 번에 넣습니다. """
+        self._pending.extend(samples)
+
+    def update(self, display_time: float) -> tuple[float, float, bool] | None:
+        """
+        쌓인 샘플을 모두 처리하고, display_time에 예상되는 시선 (x, y, 도약 여부)을 반환합니다.
+        추적 중인 샘플이 없거나 마지막 샘플이 timeout보다 오래되었으면 None을 반환합니다.
+        도약 여부는 직전 update() 이후 saccade_threshold를 넘는 급격한 변화가 있었는지를 뜻합니다.
+        """
+        pending = self._pending
+        if pending:
+            self._process(pending)
+        if self._t is None or display_time - self._t > self.timeout:
+            return None
+        lead = min(max(display_time - self._t, 0.0) + self._lag, self.max_lead)
+        x = min(max(self._x + self._dx * lead, -1.0), 1.0)
+        y = min(max(self._y + self._dy * lead, -1.0), 1.0)
+        saccade, self._saccade = self._saccade, False
+        return x, y, saccade
+
+    def _process(self, pending: deque):
+        """ 샘플 묶음을 순서대로 필터에 통과시킵니다. (프레임당 한 번, 지역 변수로 처리) """
+        t_prev, fx, fy, dx, dy, rx, ry = self._t, self._x, self._y, self._dx, self._dy, self._rx, self._ry
+        lag = self._lag
+        min_cutoff, beta, threshold = self.min_cutoff, self.beta, self.saccade_threshold
+        d_alpha_tau = 1.0 / (2 * math.pi * self.d_cutoff)
+        while pending:
+            t, x, y = pending.popleft()
+            if t_prev is None or (threshold is not None and max(abs(x - fx), abs(y - fy)) > threshold):
+                # 첫 샘플이거나 도약: 평활하지 않고 새 위치에서 다시 시작합니다.
+                self._saccade = self._saccade or t_prev is not None
+                t_prev, fx, fy, dx, dy, rx, ry, lag = t, x, y, 0.0, 0.0, x, y, 0.0
+                continue
+            dt = t - t_prev
+            if dt <= 0:
+                continue # 순서가 뒤바뀌거나 중복된 샘플
+            t_prev = t
+            # 1. 속도를 고정 차단 주파수로 평활
+            a = 1.0 / (1.0 + d_alpha_tau / dt)
+            dx += a * ((x - rx) / dt - dx)
+            dy += a * ((y - ry) / dt - dy)
+            rx, ry = x, y
+            # 2. 속도가 클수록 차단 주파수를 높여 위치를 평활
+            lag = 1.0 / (2 * math.pi * (min_cutoff + beta * math.hypot(dx, dy)))
+            a = 1.0 / (1.0 + lag / dt)
+            fx += a * (x - fx)
+            fy += a * (y - fy)
+        self._t, self._x, self._y, self._dx, self._dy, self._rx, self._ry = t_prev, fx, fy, dx, dy, rx, ry
+        self._lag = lag
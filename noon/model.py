@@ -1,32 +1,112 @@
-from dataclasses import dataclass
+from array import array
+import numpy as np
 
-@dataclass
-class NoonState:
-    """
-    로봇의 표정과 동작을 결정하는 상태 데이터 모델.
-    모든 값은 가능한 0.0 ~ 1.0 (비율) 또는 -1.0 ~ 1.0 (좌표) 범위를 권장합니다.
-    """
+# 숫자형 필드와 기본값. 선언 순서가 곧 NoonState.values 버퍼 내 인덱스입니다.
+# 모든 값은 가능한 0.0 ~ 1.0 (비율) 또는 -1.0 ~ 1.0 (좌표) 범위를 권장합니다.
+NUMERIC_DEFAULTS = {
     # [Face Orientation]
-    gaze_x: float = 0.0  # -1.0(Left) ~ 1.0(Right)
-    gaze_y: float = 0.0  # -1.0(Up) ~ 1.0(Down)
-    
+    "gaze_x": 0.0,  # -1.0(Left) ~ 1.0(Right)
+    "gaze_y": 0.0,  # -1.0(Up) ~ 1.0(Down)
+
     # [Eye Geometry]
-    eye_scale: float = 1.0        # 전체 크기 배율
-    eye_eccentricity: float = 1.0 # 1.0=원, >1.0=가로타원
-    ring_inner_ratio: float = 0.65 # 링 두께 (0.0=꽉참 ~ 1.0=투명)
-    
+    "eye_scale": 1.0,        # 전체 크기 배율
+    "eye_eccentricity": 1.0, # 1.0=원, >1.0=가로타원
+    "ring_inner_ratio": 0.65, # 링 두께 (0.0=꽉참 ~ 1.0=투명)
+
     # [Reflection]
-    highlight_scale: float = 1.0
-    highlight_x: float = 0.3
-    highlight_y: float = -0.3
-    
+    "highlight_scale": 1.0,
+    "highlight_x": 0.3,
+    "highlight_y": -0.3,
+
     # [Emotion/Expression]
-    eyebrow_lift: float = 0.0     # 눈썹 높이
-    eyebrow_shape: str = "arc"    # "arc", "angry"
-    eyelid_top: float = 0.0       # 윗 눈꺼풀 닫힘 (0.0~1.0)
-    eyelid_btm: float = 0.0       # 아랫 눈꺼풀 닫힘
-    
+    "eyebrow_lift": 0.0,     # 눈썹 높이
+    "eyelid_top": 0.0,       # 윗 눈꺼풀 닫힘 (0.0~1.0)
+    "eyelid_btm": 0.0,       # 아랫 눈꺼풀 닫힘
+
     # [System]
-    color: tuple = (180, 180, 180) # Main Eye Color
-    shake_x: float = 0.0
-    shake_y: float = 0.0
\ No newline at end of file
+    "shake_x": 0.0,
+    "shake_y": 0.0,
+}
+
+# 숫자가 아니어서 보간하지 않고 즉시 바꾸는 필드와 기본값
+CATEGORICAL_DEFAULTS = {
+    "eyebrow_shape": "arc",        # "arc", "angry"
+    "color": (180, 180, 180),      # Main Eye Color
+}
+
+# 보간 가능한 숫자형 필드 이름 목록과, 이름 → 버퍼 인덱스 매핑
+NUMERIC_FIELDS = tuple(NUMERIC_DEFAULTS)
+FIELD_INDEX = {name: index for index, name in enumerate(NUMERIC_FIELDS)}
+CATEGORICAL_FIELDS = tuple(CATEGORICAL_DEFAULTS)
+
+def _numeric_property(index: int) -> property:
+    """ NoonState의 숫자형 속성을 values 버퍼의 한 칸으로 연결하는 property를 만듭니다. """
+    def fget(self):
+        return self.values[index]
+    def fset(self, value):
+        self.values[index] = value
+    return property(fget, fset)
+
+class NoonState:
+    """
+    로봇의 표정과 동작을 결정하는 상태 데이터 모델.
+    숫자형 필드는 하나의 연속된 float64 버퍼(values)에 FIELD_INDEX 순서로 저장되며,
+    같은 메모리를 NumPy 배열(vector)로도 볼 수 있습니다. 각 필드는 일반 속성처럼 읽고 쓸 수 있습니다.
+    """
+    __slots__ = ("values", "eyebrow_shape", "color")
+
+    def __init__(self, **fields):
+        self.values = array("d", NUMERIC_DEFAULTS.values())
+        self.eyebrow_shape = CATEGORICAL_DEFAULTS["eyebrow_shape"]
+        self.color = CATEGORICAL_DEFAULTS["color"]
+        for name, value in fields.items():
+            if name not in FIELD_INDEX and name not in CATEGORICAL_DEFAULTS:
+                raise TypeError(f"NoonState got an unexpected field '{name}'")
+            setattr(self, name, value)
+
+    @property
+    def vector(self) -> np.ndarray:
+        """ values 버퍼와 메모리를 공유하는 NumPy 뷰 (복사 없음). """
+        return np.frombuffer(self.values, dtype=np.float64)
+
+    def __repr__(self):
+        fields = [f"{name}={value!r}" for name, value in zip(NUMERIC_FIELDS, self.values)]
+        fields += [f"{name}={getattr(self, name)!r}" for name in CATEGORICAL_FIELDS]
+        return f"NoonState({', '.join(fields)})"
+
+    def __eq__(self, other):
+        if not isinstance(other, NoonState):
+            return NotImplemented
+        return self.snapshot() == other.snapshot()
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return (NoonState.from_snapshot, (self.snapshot(),))
+
+    def snapshot(self) -> tuple:
+        """ 현재 값들을 비교 가능한 튜플로 반환합니다. (화면 변경 감지용) """
+        return (self.values.tobytes(), self.eyebrow_shape, self.color)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: tuple) -> "NoonState":
+        """ snapshot()으로 만든 튜플에서 상태를 복원합니다. """
+        state = cls()
+        values, state.eyebrow_shape, state.color = snapshot
+        state.vector[:] = np.frombuffer(values, dtype=np.float64)
+        return state
+
+    def copy(self) -> "NoonState":
+        """ 버퍼를 공유하지 않는 복사본을 만듭니다. """
+        return NoonState.from_snapshot(self.snapshot())
+
+for _index, _name in enumerate(NUMERIC_FIELDS):
+    setattr(NoonState, _name, _numeric_property(_index))
+del _index, _name
+
+# values 버퍼와 같은 메모리 배치의 구조화 dtype (여러 상태를 한 배열로 다룰 때 사용)
+STATE_DTYPE = np.dtype([(name, np.float64) for name in NUMERIC_FIELDS])
+
+def stack_states(states) -> np.ndarray:
+    """ NoonState 목록의 숫자형 값을 (N, len(NUMERIC_FIELDS)) 배열 하나로 모읍니다. """
+    return np.array([state.values for state in states], dtype=np.float64).reshape(-1, len(NUMERIC_FIELDS))
@@ -0,0 +1,172 @@
+# noon/panels.py
+import threading
+import time
+import traceback
+import pygame
+from .engine import NoonEngine
+from .face import NoonFaceRenderer
+from .model import NoonState
+
+PANEL_PAN_X = 0.25 # 시선 ±1일 때 눈 중심이 움직이는 거리 (패널 너비 대비)
+PANEL_PAN_Y = 0.2  # 시선 ±1일 때 눈 중심이 움직이는 거리 (패널 높이 대비, NoonEngine과 같음)
+
+class PanelEngine(NoonEngine):
+    """
+    눈 하나만 표시하는 패널용 좌표 엔진.
+    눈은 패널 가운데에 놓이고, 시선은 패널 크기에 비례한 거리만큼 옮깁니다.
+    양쪽 패널이 같은 정규화 시선 값으로 계산하므로 패널 크기가 달라도 두 눈이 패널 안의 같은 상대 위치를 봅니다.
+    """
+    def __init__(self, width: int, height: int, pan_x_ratio: float = PANEL_PAN_X, pan_y_ratio: float = PANEL_PAN_Y):
+        super().__init__(width, height)
+        self.pan_x_ratio = pan_x_ratio
+        self.pan_y_ratio = pan_y_ratio
+
+    def _eye_center(self, is_right_eye: bool, gaze_x, gaze_y):
+        """ 패널마다 눈이 하나이므로 눈 간격 없이 패널 가운데를 기준으로 합니다. """
+        cx = (self.width / 2) + (gaze_x * self.width * self.pan_x_ratio)
+        cy = (self.height / 2) + (gaze_y * self.height * self.pan_y_ratio)
+        return cx, cy
+
+class PanelOutput:
+    """
+    한 패널의 프레임을 출력 대상(sink)에 보내는 전용 작업 스레드.
+    submit()은 전송을 맡기고 바로 반환하므로 여러 패널의 전송(SPI, 프레임버퍼 쓰기 등)이 겹쳐 진행됩니다.
+    전송 중인 Surface에 다음 프레임을 그리지 않도록, 그리기 전에 wait()로 직전 전송이 끝나기를 기다립니다.
+    sink에서 난 예외는 출력만 하고 다음 프레임을 계속 보냅니다.
+    """
+    def __init__(self, name: str = "noon-panel"):
+        self.name = name
+        self.sinks = []
+        self._cond = threading.Condition()
+        self._pending = None # 보낼 (surface, rects)
+        self._busy = False   # 맡은 프레임을 아직 다 보내지 못했는지 여부
+        self._stop = False
+        self._thread = None
+        self.frames = 0
+        self.last_transfer = 0.0 # 마지막 프레임 전송 시간(초)
+
+    def submit(self, surface: pygame.Surface, rects: list[pygame.Rect]):
+        """ 프레임 전송을 작업 스레드에 맡깁니다. 직전 전송이 끝나지 않았으면 끝날 때까지 기다립니다. """
+        if not self.sinks:
+            return
+        self.wait()
+        with self._cond:
+            if self._thread is None:
+                self._stop = False
+                self._thread = threading.Thread(target=self._loop, name=self.name, daemon=True)
+                self._thread.start()
+            self._pending = (surface, rects)
+            self._busy = True
+            self._cond.notify_all()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """ 맡은 프레임의 전송이 끝날 때까지 기다립니다. timeout 안에 끝나면 True. """
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._busy, timeout)
+
+    def close(self, timeout: float | None = None):
+        """ 진행 중인 전송을 마친 뒤 작업 스레드를 멈춥니다. """
+        self.wait(timeout)
+        with self._cond:
+            thread, self._thread = self._thread, None
+            self._stop = True
+            self._cond.notify_all()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending is not None or self._stop)
+                if self._stop:
+                    return
+                (surface, rects), self._pending = self._pending, None
+            start = time.perf_counter()
+            for sink in self.sinks:
+                try:
+                    sink.present(surface, rects)
+                except Exception:
+                    traceback.print_exc()
+            with self._cond:
+                self.last_transfer = time.perf_counter() - start
+                self.frames += 1
+                self._busy = False
+                self._cond.notify_all()
+
+class EyePanel:
+    """
+    눈 하나를 그리는 패널: 패널 크기의 Surface, 그 크기에 맞춘 PanelEngine, 한 쪽 눈만 그리는 렌더러,
+    그리고 전용 출력 스레드(PanelOutput)를 가집니다.
+    """
+    def __init__(self, width: int, height: int, is_right_eye: bool, bg_color: tuple = (0, 0, 0),
+                 dirty_rects: bool = False, sprite_cache_bytes: int = 0):
+        self.is_right_eye = is_right_eye
+        self.surface = pygame.Surface((width, height), 0, 32)
+        self.engine = PanelEngine(width, height)
+        self.renderer = NoonFaceRenderer(self.surface, self.engine, dirty_rects=dirty_rects,
+                                         sprite_cache_bytes=sprite_cache_bytes, eyes=(is_right_eye,))
+        self.renderer.bg_color = bg_color
+        self.output = PanelOutput("noon-panel-right" if is_right_eye else "noon-panel-left")
+        self.rects = [] # 마지막으로 그린 프레임에서 갱신된 영역
+
+    def add_sink(self, sink):
+        """ 이 패널의 프레임을 받아갈 출력 대상을 등록합니다. sink는 present(surface, rects) 메소드를 가져야 합니다. """
+        self.output.sinks.append(sink)
+
+class PanelSet:
+    """
+    눈마다 패널이 따로 있는 로봇을 위한 분할 출력.
+    draw()는 같은 상태로 모든 패널을 그리고, present()는 각 패널의 전송을 패널별 출력 스레드에 한꺼번에 맡깁니다.
+    다음 draw()는 패널마다 직전 전송이 끝나기를 기다린 뒤 그리므로, 한 쪽 눈만 앞서거나 뒤처지는 프레임이 없습니다.
+    """
+    def __init__(self, panels: list[EyePanel]):
+        self.panels = panels
+
+    @property
+    def left(self) -> EyePanel | None:
+        return next((p for p in self.panels if not p.is_right_eye), None)
+
+    @property
+    def right(self) -> EyePanel | None:
+        return next((p for p in self.panels if p.is_right_eye), None)
+
+    def draw(self, state: NoonState) -> list[list[pygame.Rect]]:
+        """ 모든 패널에 눈을 그리고, 패널별 갱신 영역 목록을 반환합니다. """
+        for panel in self.panels:
+            panel.output.wait()
+            panel.rects = panel.renderer.draw(state)
+        return [panel.rects for panel in self.panels]
+
+    def present(self):
+        """ 마지막으로 그린 프레임의 전송을 모든 패널에서 동시에 시작합니다. 직전과 같은 패널은 보내지 않습니다. """
+        for panel in self.panels:
+            if panel.rects:
+                panel.output.submit(panel.surface, panel.rects)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """ 모든 패널의 전송이 끝날 때까지 기다립니다. """
+        return all([panel.output.wait(timeout) for panel in self.panels])
+
+    def invalidate(self):
+        for panel in self.panels:
+            panel.renderer.invalidate()
+
+    def preview(self, screen: pygame.Surface) -> list[pygame.Rect]:
+        """
+        패널들을 screen에 나란히(왼쪽 눈은 왼쪽 절반, 오른쪽 눈은 오른쪽 절반 가운데) 옮겨 그립니다. (개발용 창 미리보기)
+        전송 중에는 패널 Surface가 잠길 수 있으므로 present() 전에 호출해야 합니다.
+        """
+        width, height = screen.get_size()
+        rects = []
+        for panel in self.panels:
+            panel_w, panel_h = panel.surface.get_size()
+            half = width // 2 if panel.is_right_eye else 0
+            x, y = half + (width // 2 - panel_w) // 2, (height - panel_h) // 2
+            for rect in panel.rects:
+                rects.append(screen.blit(panel.surface, (x + rect.x, y + rect.y), rect))
+        return rects
+
+    def close(self, timeout: float | None = None):
+        """ 진행 중인 전송을 마치고 출력 스레드를 멈춥니다. """
+        for panel in self.panels:
+            panel.output.close(timeout)
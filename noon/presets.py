@@ -32,4 +32,34 @@ EMOTION_PRESETS = {
             {"type": "shake", "intensity": 2.0}
         ]
     },
-}
\ No newline at end of file
+}
+
+# 키프레임 애니메이션 클립 프리셋. (Noon.play_clip으로 재생)
+# 'tracks'는 필드별 [시간(초), 값, 이징] 키프레임 목록이며, 이징은 직전 키프레임에서 이 키프레임으로 가는 구간에 쓰입니다.
+# 'mode'가 "additive"이면 현재 감정 상태 위에 값을 더하고, "absolute"이면 값을 그대로 덮어씁니다.
+
+CLIP_PRESETS = {
+    "blink": {
+        "duration": 0.24,
+        "mode": "additive",
+        "tracks": {
+            "eyelid_top": [[0.0, 0.0], [0.08, 1.0, "ease_in"], [0.24, 0.0, "ease_out"]],
+        },
+    },
+    "glance": {
+        "duration": 0.9,
+        "mode": "additive",
+        "tracks": {
+            "gaze_x": [[0.0, 0.0], [0.12, 0.6, "ease_out"], [0.7, 0.6], [0.9, 0.0, "ease_in_out"]],
+        },
+    },
+    "double_take": {
+        "duration": 1.0,
+        "mode": "additive",
+        "tracks": {
+            "gaze_x": [[0.0, 0.0], [0.15, 0.4, "ease_out"], [0.35, 0.0, "ease_in_out"],
+                       [0.5, 0.7, "ease_out_back"], [0.8, 0.7], [1.0, 0.0, "ease_in_out"]],
+            "eye_scale": [[0.0, 0.0], [0.35, 0.0], [0.5, 0.15, "ease_out_back"], [0.8, 0.15], [1.0, 0.0, "ease_in_out"]],
+        },
+    },
+}
@@ -0,0 +1,217 @@
+# noon/profiler.py
+"""
+렌더 루프의 단계별 소요 시간을 재는 프레임 프로파일러와, 그 결과를 화면에 그리는 오버레이.
+
+현장에서 프레임이 끊길 때 이벤트 처리, 사용자 콜백, update(), draw(), 화면 반영(flip), 대기(clock.tick) 중
+어디에서 시간이 쓰였는지 알 수 있도록, 단계마다 단조 시계(time.perf_counter)로 잰 시간을 고정 크기 링 버퍼에 기록합니다.
+기록은 미리 할당한 array에 값을 쓰는 것뿐이라 할당이 없고, 꺼져 있으면 컨트롤러가 호출 자체를 건너뜁니다.
+
+사용법:
+    profiler = eyes.enable_profiler(overlay=True)
+    ...
+    print(profiler.summary())          # 단계별 p50/p95/p99 (ms)
+    profiler.dump("trace.json")        # chrome://tracing, Perfetto에서 열 수 있는 트레이스
+"""
+import csv
+import json
+import time
+from array import array
+
+# Noon 렌더 루프의 단계 (기록 순서)
+STAGES = ("events", "callbacks", "update", "draw", "present", "wait")
+# 프레임 예산의 이 배수를 넘긴 프레임을 놓친 프레임으로 셉니다.
+DROP_TOLERANCE = 1.5
+
+class FrameProfiler:
+    """
+    프레임마다 begin_frame() → mark(단계)... → end_frame() 순서로 호출하여 단계별 시간을 기록합니다.
+    mark()는 직전 mark(또는 begin_frame) 이후 흐른 시간을 그 단계에 더하며, 최근 capacity 프레임만 보관합니다.
+    """
+    def __init__(self, capacity: int = 600, fps: float = 60, stages: tuple = STAGES):
+        self.stages = tuple(stages)
+        self.capacity = capacity
+        self.budget = 1.0 / fps # 프레임 예산(초)
+        self._stage_index = {stage: i for i, stage in enumerate(self.stages)}
+        self._stage_times = [array("d", bytes(8 * capacity)) for _ in self.stages]
+        self._starts = array("d", bytes(8 * capacity))
+        self._totals = array("d", bytes(8 * capacity))
+        self._idle = bytearray(capacity)
+        self._slot = 0
+        self._last = None
+        self.frames = 0         # 지금까지 기록한 프레임 수
+        self.dropped_frames = 0 # 유휴가 아닌데 예산 x DROP_TOLERANCE를 넘긴 프레임 수
+
+    def begin_frame(self):
+        """ 새 프레임의 기록을 시작합니다. """
+        slot = self._slot
+        for times in self._stage_times:
+            times[slot] = 0.0
+        self._last = self._starts[slot] = time.perf_counter()
+
+    def mark(self, stage: str):
+        """ 직전 표시 이후 흐른 시간을 stage에 기록합니다. """
+        now = time.perf_counter()
+        self._stage_times[self._stage_index[stage]][self._slot] += now - self._last
+        self._last = now
+
+    def end_frame(self, idle: bool = False):
+        """
+        프레임 기록을 마칩니다. idle=True이면 화면에 바뀐 것이 없어 일부러 오래 기다린 프레임이므로
+        놓친 프레임으로 세지 않습니다.
+        """
+        if self._last is None:
+            return
+        slot = self._slot
+        total = self._totals[slot] = time.perf_counter() - self._starts[slot]
+        self._idle[slot] = idle
+        if not idle and total > self.budget * DROP_TOLERANCE:
+            self.dropped_frames += 1
+        self._slot = (slot + 1) % self.capacity
+        self.frames += 1
+        self._last = None
+
+    def reset(self):
+        """ 기록을 모두 지웁니다. """
+        self._slot = self.frames = self.dropped_frames = 0
+        self._last = None
+
+    def _order(self, count: int | None = None) -> list[int]:
+        """ 보관 중인 프레임 중 최근 count개의 슬롯 번호 (오래된 것부터). """
+        kept = min(self.frames, self.capacity)
+        count = kept if count is None else min(count, kept)
+        start = (self._slot - count) % self.capacity
+        return [(start + i) % self.capacity for i in range(count)]
+
+    def recent(self, stage: str = "frame", count: int | None = None) -> list[float]:
+        """ stage(또는 전체 "frame")의 최근 count 프레임 시간(초) 목록 (오래된 것부터). """
+        times = self._totals if stage == "frame" else self._stage_times[self._stage_index[stage]]
+        return [times[slot] for slot in self._order(count)]
+
+    def percentile(self, stage: str = "frame", q: float = 50) -> float:
+        """ 보관 중인 프레임에서 stage 시간(초)의 q 백분위수. 기록이 없으면 0.0. """
+        values = sorted(self.recent(stage))
+        if not values:
+            return 0.0
+        return values[int((len(values) - 1) * q / 100)]
+
+    def summary(self, qs: tuple = (50, 95, 99)) -> dict:
+        """ {단계: {"p50": ms, ...}} 형태의 요약. "frame"은 프레임 전체, 마지막에 dropped/frames를 덧붙입니다. """
+        result = {}
+        for stage in (*self.stages, "frame"):
+            values = sorted(self.recent(stage))
+            last = len(values) - 1
+            result[stage] = {f"p{q}": values[int(last * q / 100)] * 1000 if values else 0.0 for q in qs}
+        result["dropped_frames"] = self.dropped_frames
+        result["frames"] = self.frames
+        return result
+
+    def dump(self, path: str):
+        """
+        보관 중인 프레임 기록을 파일로 저장합니다.
+        .json이면 Chrome 트레이스 이벤트 형식(chrome://tracing, Perfetto), 그 외에는 프레임당 한 줄의 CSV(초 단위)입니다.
+        """
+        order = self._order()
+        if path.endswith(".json"):
+            events = []
+            for slot in order:
+                ts = self._starts[slot] * 1e6
+                events.append({"name": "frame", "ph": "X", "ts": ts, "dur": self._totals[slot] * 1e6,
+                               "pid": 0, "tid": 0, "args": {"idle": bool(self._idle[slot])}})
+                for stage, times in zip(self.stages, self._stage_times):
+                    events.append({"name": stage, "ph": "X", "ts": ts, "dur": times[slot] * 1e6, "pid": 0, "tid": 1})
+                    ts += times[slot] * 1e6
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        else:
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["start", *self.stages, "frame", "idle"])
+                for slot in order:
+                    writer.writerow([self._starts[slot], *(times[slot] for times in self._stage_times),
+                                     self._totals[slot], self._idle[slot]])
+
+class ProfilerOverlay:
+    """
+    FrameProfiler의 최근 프레임 시간을 작은 그래프와 글자로 화면 구석에 그립니다.
+    - 노란 선: 프레임 전체 시간, 하늘색 선: 대기를 뺀 작업 시간, 빨간 선: 프레임 예산
+    - 그래프는 별도 Surface를 새 프레임 수만큼 왼쪽으로 밀고 새 구간만 그려, 매번 전체를 다시 그리지 않습니다.
+    - 글자(백분위수, 놓친 프레임 수)는 정렬 비용을 줄이기 위해 text_interval 프레임마다 갱신합니다.
+    """
+    BACKGROUND = (16, 16, 16)
+
+    def __init__(self, position: tuple = (8, 8), size: tuple = (240, 80), text_interval: int = 30):
+        self.position = position
+        self.size = size
+        self.text_interval = text_interval
+        self._font = None
+        self._text = None
+        self._text_frame = None
+        self._graph = None
+        self._graph_frame = None
+
+    def draw(self, surface, profiler: FrameProfiler):
+        """ surface에 오버레이를 그리고, 그린 영역(Rect)을 반환합니다. """
+        import pygame
+        x, y = self.position
+        width, height = self.size
+        if self._graph is None:
+            self._graph = pygame.Surface((width, height))
+        self._update_graph(profiler)
+        rect = pygame.Rect(x, y, width, height + 30)
+        surface.fill(self.BACKGROUND, rect)
+        surface.blit(self._graph, (x, y))
+
+        if self._text is None or not 0 <= profiler.frames - self._text_frame < self.text_interval:
+            self._render_text(profiler)
+        for i, line in enumerate(self._text):
+            surface.blit(line, (x + 4, y + height + 2 + i * 14))
+        return rect
+
+    def _update_graph(self, profiler: FrameProfiler):
+        """ 마지막으로 그린 뒤 기록된 프레임만큼 그래프를 밀고 새 구간을 그립니다. """
+        import pygame
+        graph = self._graph
+        width, height = self.size
+        new = width if self._graph_frame is None else profiler.frames - self._graph_frame
+        if not 0 <= new < width:
+            new = width
+            graph.fill(self.BACKGROUND)
+        elif new:
+            graph.scroll(-new, 0)
+            graph.fill(self.BACKGROUND, (width - new, 0, new, height))
+        self._graph_frame = profiler.frames
+        if not new:
+            return
+
+        scale = (height - 1) / (2 * profiler.budget) # 예산의 두 배까지 표시
+        bottom = height - 1
+        budget_y = bottom - profiler.budget * scale
+        pygame.draw.line(graph, (200, 60, 60), (width - new, budget_y), (width - 1, budget_y))
+        # 새 구간의 첫 선분이 이어지도록 직전 프레임 하나를 더 가져옵니다.
+        totals = profiler.recent("frame", new + 1)
+        waits = profiler.recent("wait", new + 1) if "wait" in profiler.stages else [0.0] * len(totals)
+        column = width - len(totals)
+        prev_total = prev_work = None
+        for total, wait in zip(totals, waits):
+            total_y = bottom - min(total * scale, bottom)
+            work_y = bottom - min((total - wait) * scale, bottom)
+            if prev_total is not None:
+                pygame.draw.line(graph, (230, 200, 60), (column - 1, prev_total), (column, total_y))
+                pygame.draw.line(graph, (80, 180, 230), (column - 1, prev_work), (column, work_y))
+            prev_total, prev_work = total_y, work_y
+            column += 1
+
+    def _render_text(self, profiler: FrameProfiler):
+        import pygame
+        if self._font is None:
+            pygame.font.init()
+            self._font = pygame.font.SysFont("Arial", 12)
+        stats = profiler.summary((50, 95))
+        frame = stats["frame"]
+        slowest = max(profiler.stages, key=lambda stage: stats[stage]["p95"])
+        lines = [
+            f"frame p50 {frame['p50']:.1f} p95 {frame['p95']:.1f} ms  dropped {stats['dropped_frames']}",
+            f"slowest: {slowest} p95 {stats[slowest]['p95']:.1f} ms",
+        ]
+        self._text = [self._font.render(line, True, (220, 220, 220)) for line in lines]
+        self._text_frame = profiler.frames
@@ -0,0 +1,221 @@
+# noon/recording.py
+"""
+화면에 표시된 NoonState를 프레임마다 고정 크기 레코드로 이어 쓰는 이진 기록과, 기록을 메모리 매핑하여 재생하는 도구.
+현장에서 눈이 실제로 무엇을 보여줬는지 그대로 다시 볼 수 있습니다.
+
+파일 배치 (리틀 엔디언):
+- 헤더 HEADER_SIZE바이트: 매직 b"NOONLOG1" + u32 길이 + JSON(필드 목록, 눈썹 모양 표, 시작 시각, seed, 화면 크기), 나머지는 0
+- 레코드 RECORD.size(64)바이트 x 프레임 수: 기록 시작 후 시각 f64(초), 숫자형 필드 f32 x len(NUMERIC_FIELDS),
+  눈썹 모양 번호 u8, 색 R, G, B u8
+레코드 크기가 고정이라 n번째 프레임은 HEADER_SIZE + n * RECORD.size에 있어 O(1)로 찾습니다.
+화면을 다시 그린 프레임만 기록하므로(유휴 프레임 제외) 60fps로 계속 움직여도 한 시간에 약 14MB입니다.
+
+사용법:
+    eyes = Noon(seed=1234)
+    eyes.start_recording("field.noonlog")
+    ...
+    python -m noon.recording field.noonlog --frame 3600   # 창을 열어 3600번째 프레임부터 재생
+"""
+import argparse
+import json
+from array import array
+import mmap
+import struct
+import time
+import numpy as np
+from .model import NoonState, NUMERIC_FIELDS, CATEGORICAL_DEFAULTS
+from .presets import EMOTION_PRESETS
+
+MAGIC = b"NOONLOG1"
+HEADER_SIZE = 4096
+RECORD = struct.Struct(f"<d{len(NUMERIC_FIELDS)}f4B")
+# 레코드와 같은 배치의 구조화 dtype (기록 전체를 복사 없이 NumPy로 분석할 때)
+RECORD_DTYPE = np.dtype([("time", "<f8"), *((name, "<f4") for name in NUMERIC_FIELDS),
+                         ("eyebrow_shape", "u1"), ("color", "u1", (3,))])
+_HEADER_PREFIX = struct.Struct("<8sI")
+_TIME = struct.Struct("<d")
+
+class StateRecorder:
+    """
+    NoonState를 프레임마다 파일 끝에 덧붙입니다. record()는 struct 하나를 버퍼에 쓰는 것뿐이며,
+    flush_interval초마다 디스크로 내보내 갑자기 꺼져도 그 이전 기록은 남습니다.
+    """
+    def __init__(self, path: str, metadata: dict | None = None, flush_interval: float = 1.0):
+        self.path = path
+        self.flush_interval = flush_interval
+        shapes = [CATEGORICAL_DEFAULTS["eyebrow_shape"]]
+        for preset in EMOTION_PRESETS.values():
+            shape = preset["values"].get("eyebrow_shape")
+            if shape is not None and shape not in shapes:
+                shapes.append(shape)
+        self._shapes = {shape: index for index, shape in enumerate(shapes)}
+        self._header = {"version": 1, "fields": list(NUMERIC_FIELDS), "shapes": shapes,
+                        "start_time": time.time(), **(metadata or {})}
+        self._file = open(path, "wb")
+        self._write_header()
+        self._file.seek(HEADER_SIZE)
+        self._color = self._color_bytes = None
+        self._start = time.perf_counter()
+        self._next_flush = self._start + flush_interval
+        self.frames = 0
+
+    def record(self, state: NoonState, timestamp: float | None = None):
+        """ state를 레코드 하나로 기록합니다. timestamp(perf_counter 기준 초)를 생략하면 현재 시각입니다. """
+        now = time.perf_counter() if timestamp is None else timestamp
+        shape = self._shapes.get(state.eyebrow_shape)
+        if shape is None:
+            shape = self._add_shape(state.eyebrow_shape)
+        if state.color is not self._color:
+            self._color = state.color
+            self._color_bytes = tuple(int(channel) for channel in state.color)
+        self._file.write(RECORD.pack(now - self._start, *state.values, shape, *self._color_bytes))
+        self.frames += 1
+        if now >= self._next_flush:
+            self._next_flush = now + self.flush_interval
+            self._file.flush()
+
+    def _add_shape(self, shape: str) -> int:
+        """ 처음 보는 눈썹 모양을 표에 추가하고 헤더를 다시 씁니다. """
+        if len(self._shapes) >= 256:
+            raise ValueError("Too many distinct eyebrow shapes to record")
+        index = self._shapes[shape] = len(self._shapes)
+        self._header["shapes"].append(shape)
+        position = self._file.tell()
+        self._write_header()
+        self._file.seek(position)
+        return index
+
+    def _write_header(self):
+        body = json.dumps(self._header).encode()
+        if _HEADER_PREFIX.size + len(body) > HEADER_SIZE:
+            raise ValueError("Recording metadata does not fit in the header")
+        self._file.seek(0)
+        self._file.write(_HEADER_PREFIX.pack(MAGIC, len(body)) + body)
+        self._file.write(bytes(HEADER_SIZE - _HEADER_PREFIX.size - len(body)))
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+class StateLog:
+    """
+    StateRecorder가 쓴 기록을 메모리 매핑하여 읽습니다. 파일 전체를 읽지 않으므로 몇 시간짜리 기록도 바로 열리며,
+    어느 프레임이든 O(1)로, 시각으로는 이진 탐색으로 찾습니다. 기록 중에 열면 연 시점까지의 프레임만 보입니다.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, length = _HEADER_PREFIX.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise ValueError(f"'{path}' is not a noon_noon state log")
+        self.header = json.loads(self._mmap[_HEADER_PREFIX.size:_HEADER_PREFIX.size + length])
+        if tuple(self.header["fields"]) != NUMERIC_FIELDS:
+            raise ValueError(f"'{path}' was recorded with different state fields: {self.header['fields']}")
+        self.shapes = self.header["shapes"]
+        # 마지막 레코드가 쓰다 만 것이면(전원 차단 등) 무시합니다.
+        self._count = max(len(self._mmap) - HEADER_SIZE, 0) // RECORD.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def duration(self) -> float:
+        """ 첫 프레임부터 마지막 프레임까지의 시간(초). """
+        return self.time(self._count - 1) - self.time(0) if self._count else 0.0
+
+    def _offset(self, index: int) -> int:
+        if not 0 <= index < self._count:
+            raise IndexError(f"frame {index} out of range (0..{self._count - 1})")
+        return HEADER_SIZE + index * RECORD.size
+
+    def time(self, index: int) -> float:
+        """ index번째 프레임의 기록 시각(기록 시작 후 초). """
+        return _TIME.unpack_from(self._mmap, self._offset(index))[0]
+
+    def state(self, index: int, into: NoonState | None = None) -> NoonState:
+        """ index번째 프레임의 상태. into를 주면 새로 만들지 않고 그 상태에 덮어씁니다. """
+        _, *values, shape, r, g, b = RECORD.unpack_from(self._mmap, self._offset(index))
+        state = into if into is not None else NoonState()
+        state.values[:] = array("d", values)
+        state.eyebrow_shape = self.shapes[shape]
+        color = (r, g, b)
+        if color != state.color:
+            state.color = color
+        return state
+
+    def index_at(self, t: float, lo: int = 0) -> int:
+        """ 기록 시각이 t 이하인 마지막 프레임 번호 (lo부터 이진 탐색). t가 첫 프레임보다 앞이면 lo. """
+        hi = self._count
+        while lo + 1 < hi:
+            mid = (lo + hi) // 2
+            if self.time(mid) <= t:
+                lo = mid
+            else:
+                hi = mid
+        return lo
+
+    def records(self) -> np.ndarray:
+        """ 모든 레코드를 RECORD_DTYPE 구조화 배열로 봅니다. (복사 없음, close() 전에 배열 참조를 지워야 합니다) """
+        return np.frombuffer(self._mmap, dtype=RECORD_DTYPE, count=self._count, offset=HEADER_SIZE)
+
+    def close(self):
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class StateReplay:
+    """ StateLog를 기록된 시간 간격대로(speed배) 재생하며 상태를 채우는 커서. seek()로 아무 프레임으로나 바로 옮깁니다. """
+    def __init__(self, log: StateLog, frame: int = 0, speed: float = 1.0, loop: bool = False):
+        if not len(log):
+            raise ValueError(f"'{log.path}' has no frames")
+        self.log = log
+        self.speed = speed
+        self.loop = loop
+        self.seek(frame)
+
+    def seek(self, frame: int):
+        """ frame번째 프레임으로 옮깁니다. """
+        self.index = min(max(frame, 0), len(self.log) - 1)
+        self._time = self.log.time(self.index)
+
+    def advance(self, dt: float, state: NoonState) -> bool:
+        """ dt초만큼 재생 위치를 옮기고 그 시점의 상태를 state에 씁니다. 끝에 도달했으면 True를 반환합니다. """
+        log = self.log
+        self._time += dt * self.speed
+        self.index = log.index_at(self._time, self.index)
+        log.state(self.index, state)
+        if self.index < len(log) - 1 or self._time <= log.time(self.index):
+            return False
+        if self.loop:
+            self.seek(0)
+            return False
+        return True
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a noon_noon state log")
+    parser.add_argument("log", help="StateRecorder로 기록한 파일")
+    parser.add_argument("--frame", type=int, default=0, help="재생을 시작할 프레임")
+    parser.add_argument("--speed", type=float, default=1.0, help="재생 속도 배율")
+    parser.add_argument("--info", action="store_true", help="재생하지 않고 기록 정보만 출력")
+    args = parser.parse_args(argv)
+
+    log = StateLog(args.log)
+    header = log.header
+    print(f"{len(log)} frames, {log.duration:.1f} s, seed {header.get('seed')}, "
+          f"started {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(header['start_time']))}")
+    if args.info:
+        return
+    from .controller import Noon
+    eyes = Noon(header.get("width", 800), header.get("height", 400), tuple(header.get("bg_color", (0, 0, 0))))
+    eyes.replay(log, args.frame, args.speed)
+    eyes.run()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+# noon/server.py
+"""
+다른 프로세스(비전 노드, 대화 관리자 등)에서 눈을 제어하기 위한 로컬 소켓 제어 서버와 클라이언트.
+Unix 도메인 데이터그램 소켓 또는 localhost UDP로 작은 바이너리 메시지를 받습니다.
+
+메시지 형식 (리틀 엔디언). 데이터그램 하나에 여러 메시지를 이어 붙일 수 있습니다.
+- 0x01 EMOTION: [길이 u8][이름 UTF-8]          → set_emotion
+- 0x02 GAZE:    [x f32][y f32]  (NaN은 해당 축 해제) → set_gaze
+- 0x03 FIELD:   [필드 인덱스 u8][값 f32]  (NaN은 해제) → set_field (model.FIELD_INDEX)
+- 0x04 CLIP:    [길이 u8][이름 UTF-8]          → play_clip
+"""
+import math
+import os
+import socket
+import struct
+import threading
+from .model import NUMERIC_FIELDS, FIELD_INDEX
+
+OP_EMOTION = 0x01
+OP_GAZE = 0x02
+OP_FIELD = 0x03
+OP_CLIP = 0x04
+
+DEFAULT_ADDRESS = ("127.0.0.1", 5700)
+MAX_DATAGRAM = 4096
+
+_GAZE = struct.Struct("<ff")
+_FIELD = struct.Struct("<Bf")
+
+def encode_emotion(name: str) -> bytes:
+    data = name.encode("utf-8")
+    return bytes((OP_EMOTION, len(data))) + data
+
+def encode_gaze(x: float | None, y: float | None = None) -> bytes:
+    return bytes((OP_GAZE,)) + _GAZE.pack(math.nan if x is None else x, math.nan if y is None else y)
+
+def encode_field(name: str, value: float | None) -> bytes:
+    return bytes((OP_FIELD,)) + _FIELD.pack(FIELD_INDEX[name], math.nan if value is None else value)
+
+def encode_clip(name: str) -> bytes:
+    data = name.encode("utf-8")
+    return bytes((OP_CLIP, len(data))) + data
+
+def decode(datagram: bytes) -> list[tuple]:
+    """
+    데이터그램을 (opcode, 인자...) 메시지 목록으로 해석합니다.
+    형식이 잘못된 부분을 만나면 ValueError를 냅니다.
+    """
+    messages = []
+    view = memoryview(datagram)
+    offset = 0
+    while offset < len(view):
+        op = view[offset]
+        offset += 1
+        if op in (OP_EMOTION, OP_CLIP):
+            if offset >= len(view):
+                raise ValueError("truncated name length")
+            length = view[offset]
+            name = bytes(view[offset + 1:offset + 1 + length])
+            if len(name) != length:
+                raise ValueError("truncated name")
+            messages.append((op, name.decode("utf-8")))
+            offset += 1 + length
+        elif op == OP_GAZE:
+            x, y = _GAZE.unpack_from(view, offset)
+            messages.append((op, None if math.isnan(x) else x, None if math.isnan(y) else y))
+            offset += _GAZE.size
+        elif op == OP_FIELD:
+            index, value = _FIELD.unpack_from(view, offset)
+            if index >= len(NUMERIC_FIELDS):
+                raise ValueError(f"unknown field index {index}")
+            messages.append((op, index, None if math.isnan(value) else value))
+            offset += _FIELD.size
+        else:
+            raise ValueError(f"unknown opcode {op:#x}")
+    return messages
+
+def _open_socket(address, bind: bool) -> socket.socket:
+    """ address가 문자열이면 Unix 도메인 데이터그램 소켓, (host, port)이면 UDP 소켓을 엽니다. """
+    family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_DGRAM)
+    if bind:
+        if family == socket.AF_UNIX and os.path.exists(address):
+            os.unlink(address) # 이전 실행이 남긴 소켓 파일
+        sock.bind(address)
+    return sock
+
+class ControlServer:
+    """
+    제어 메시지를 받아 Noon의 명령 큐에 넣는 서버. 수신은 별도 스레드에서 하고,
+    실제 적용은 렌더 루프가 프레임마다 한 번 합니다. 같은 필드(또는 감정, 시선)에 대한 연속 갱신은
+    명령 큐에서 합쳐지므로 프레임마다 가장 마지막 값만 적용됩니다.
+
+    사용법:
+        server = ControlServer(eyes, "/tmp/noon.sock")  # 또는 ("127.0.0.1", 5700)
+        server.start()
+        ...
+        server.stop()
+    """
+    def __init__(self, noon, address=DEFAULT_ADDRESS):
+        self.noon = noon
+        self.address = address
+        self._sock = None
+        self._thread = None
+        self._stop_event = threading.Event()
+        self.datagrams = 0
+        self.messages = 0
+        self.errors = 0 # 형식이 잘못되어 버린 데이터그램 수
+
+    def start(self):
+        """ 소켓을 열고 수신 스레드를 시작합니다. """
+        if self._thread is not None:
+            raise RuntimeError("제어 서버가 이미 실행 중입니다.")
+        self._sock = _open_socket(self.address, bind=True)
+        self._sock.settimeout(0.1) # stop() 요청을 확인하는 주기
+        if not isinstance(self.address, str):
+            self.address = self._sock.getsockname() # 포트 0을 주면 실제 할당된 포트
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._loop, name="noon-control", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None):
+        """ 수신 스레드를 멈추고 소켓을 닫습니다. """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+            if isinstance(self.address, str) and os.path.exists(self.address):
+                os.unlink(self.address)
+
+    def _loop(self):
+        while not self._stop_event.is_set():
+            try:
+                datagram = self._sock.recv(MAX_DATAGRAM)
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            self.datagrams += 1
+            try:
+                messages = decode(datagram)
+            except (ValueError, struct.error, UnicodeDecodeError):
+                self.errors += 1
+                continue
+            for message in messages:
+                self._post(message)
+            self.messages += len(messages)
+
+    def _post(self, message: tuple):
+        """ 메시지를 Noon 명령으로 바꿔 큐에 넣습니다. key가 같으면 마지막 명령만 실행됩니다. """
+        noon = self.noon
+        op = message[0]
+        if op == OP_EMOTION:
+            noon.post_command("set_emotion", noon.set_emotion, message[1])
+        elif op == OP_GAZE:
+            noon.post_command("set_gaze", noon.set_gaze, message[1], message[2])
+        elif op == OP_FIELD:
+            noon.post_command(("set_field", message[1]), noon.set_field, NUMERIC_FIELDS[message[1]], message[2])
+        elif op == OP_CLIP:
+            noon.post_command(("play_clip", message[1]), noon.play_clip, message[1])
+
+class ControlClient:
+    """ ControlServer에 제어 메시지를 보내는 클라이언트. """
+    def __init__(self, address=DEFAULT_ADDRESS):
+        self.address = address
+        self._sock = _open_socket(address, bind=False)
+
+    def send(self, *messages: bytes):
+        """ encode_* 함수로 만든 메시지들을 데이터그램 하나로 보냅니다. """
+        self._sock.sendto(b"".join(messages), self.address)
+
+    def set_emotion(self, name: str):
+        self.send(encode_emotion(name))
+
+    def set_gaze(self, x: float | None, y: float | None = None):
+        self.send(encode_gaze(x, y))
+
+    def set_field(self, name: str, value: float | None):
+        self.send(encode_field(name, value))
+
+    def play_clip(self, name: str):
+        self.send(encode_clip(name))
+
+    def close(self):
+        self._sock.close()
@@ -0,0 +1,124 @@
+# noon/shm.py
+"""
+같은 기기의 다른 프로세스(얼굴 추적기 등)가 복사 없이 목표 상태를 넘겨주기 위한 공유 메모리 채널.
+
+블록 배치 (리틀 엔디언, 8바이트 정렬):
+- seq   u64: 시퀀스 카운터. 쓰는 중에는 홀수, 다 쓰면 짝수 (seqlock)
+- mask  u64: 값이 지정된 필드의 비트 (비트 i = model.NUMERIC_FIELDS[i])
+- values f64 x len(NUMERIC_FIELDS): 필드별 목표값 (NoonState.values와 같은 순서)
+
+읽는 쪽은 쓰기 전후의 seq가 같고 짝수일 때만 값을 받아들이므로, 쓰는 도중의 값(torn read)을 보지 않습니다.
+"""
+import multiprocessing
+import struct
+import sys
+from multiprocessing import shared_memory, resource_tracker
+from .model import NUMERIC_FIELDS, FIELD_INDEX
+
+SHARED_TARGET_LAYOUT = struct.Struct(f"<QQ{len(NUMERIC_FIELDS)}d")
+_U64 = struct.Struct("<Q")
+_F64 = struct.Struct("<d")
+_SEQ_OFFSET, _MASK_OFFSET, _VALUES_OFFSET = 0, 8, 16
+_created = set() # 이 프로세스에서 만든 블록 이름 (_attach 참고)
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """ 다른 프로세스가 만든 블록을 엽니다. 이 프로세스가 종료될 때 블록이 삭제되지 않도록 추적하지 않습니다. """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # Python 3.12 이하에는 track 인자가 없으므로, 열면서 등록된 추적을 바로 해제합니다.
+    # 추적 프로세스는 이름을 한 번만 기억하므로, 만든 쪽과 추적 프로세스를 같이 쓰는 경우(같은 프로세스,
+    # multiprocessing 자식)에는 해제하면 만든 쪽의 등록까지 지워집니다. 이때는 등록이 중복될 뿐이므로 그대로 둡니다.
+    shm = shared_memory.SharedMemory(name=name)
+    if shm._name not in _created and multiprocessing.parent_process() is None:
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+class SharedTargetWriter:
+    """
+    목표값을 공유 메모리 블록에 쓰는 쪽(인식 프로세스)의 도우미.
+    name을 생략하면 새 블록을 만들고, 만든 블록의 이름(name)을 읽는 쪽에 전달하면 됩니다.
+    쓰는 프로세스는 블록당 하나여야 합니다.
+
+    사용법:
+        writer = SharedTargetWriter()
+        eyes.attach_shared_target(writer.name)   # 렌더링 프로세스
+        writer.write(gaze_x=0.3, gaze_y=-0.1)    # 추적 프로세스, 매 검출마다
+    """
+    def __init__(self, name: str | None = None):
+        self._owner = name is None
+        if self._owner:
+            self._shm = shared_memory.SharedMemory(create=True, size=SHARED_TARGET_LAYOUT.size)
+            self._shm.buf[:SHARED_TARGET_LAYOUT.size] = bytes(SHARED_TARGET_LAYOUT.size)
+            _created.add(self._shm._name)
+        else:
+            self._shm = _attach(name)
+        self.name = self._shm.name
+        self._buf = self._shm.buf
+        self._seq, self._mask = SHARED_TARGET_LAYOUT.unpack_from(self._buf)[:2]
+        self._seq += self._seq & 1 # 이전 쓰기 도중 멈춘 블록이면 다음 짝수부터
+
+    def write(self, fields: dict | None = None, **kwargs):
+        """ 주어진 필드의 목표값을 씁니다. 이전에 쓴 다른 필드의 값은 유지됩니다. """
+        buf = self._buf
+        self._begin()
+        for name, value in {**(fields or {}), **kwargs}.items():
+            index = FIELD_INDEX[name]
+            _F64.pack_into(buf, _VALUES_OFFSET + 8 * index, value)
+            self._mask |= 1 << index
+        self._end()
+
+    def clear(self, *names: str):
+        """ 필드 지정을 해제합니다. 이름을 생략하면 모든 필드를 해제합니다. """
+        self._begin()
+        if names:
+            for name in names:
+                self._mask &= ~(1 << FIELD_INDEX[name])
+        else:
+            self._mask = 0
+        self._end()
+
+    def _begin(self):
+        self._seq += 1 # 홀수: 쓰는 중
+        _U64.pack_into(self._buf, _SEQ_OFFSET, self._seq)
+
+    def _end(self):
+        _U64.pack_into(self._buf, _MASK_OFFSET, self._mask)
+        self._seq += 1 # 짝수: 완료
+        _U64.pack_into(self._buf, _SEQ_OFFSET, self._seq)
+
+    def close(self):
+        """ 블록을 닫습니다. 블록을 만든 쪽이면 블록을 삭제합니다. """
+        self._buf = None
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+class SharedTargetReader:
+    """ 공유 메모리 블록에서 목표값을 읽는 쪽. 렌더 루프가 프레임마다 한 번 read()를 호출합니다. """
+    def __init__(self, name: str, max_retries: int = 100):
+        self._shm = _attach(name)
+        self._buf = self._shm.buf
+        self.max_retries = max_retries
+        self.last_seq = 0
+        self.torn_reads = 0 # 쓰는 도중이라 다시 읽은 횟수
+
+    def read(self) -> dict | None:
+        """
+        마지막으로 읽은 뒤 값이 바뀌었으면 {필드 이름: 값} dict를, 바뀌지 않았으면 None을 반환합니다.
+        쓰는 중인 블록을 만나면 일관된 값을 얻을 때까지 다시 읽고, max_retries번 실패하면 이번 프레임은 건너뜁니다.
+        """
+        buf = self._buf
+        for _ in range(self.max_retries):
+            if _U64.unpack_from(buf, _SEQ_OFFSET)[0] == self.last_seq:
+                return None # 대부분의 프레임은 여기서 끝납니다.
+            seq, mask, *values = SHARED_TARGET_LAYOUT.unpack_from(buf)
+            if seq & 1 or _U64.unpack_from(buf, _SEQ_OFFSET)[0] != seq:
+                self.torn_reads += 1
+                continue
+            self.last_seq = seq
+            return {name: values[i] for i, name in enumerate(NUMERIC_FIELDS) if mask >> i & 1}
+        return None
+
+    def close(self):
+        self._buf = None
+        self._shm.close()
@@ -0,0 +1,109 @@
+# noon/sinks.py
+import mmap
+import os
+import stat
+import numpy as np
+import pygame
+
+# 지원하는 프레임버퍼 픽셀 형식과 픽셀당 바이트 수
+PIXEL_FORMATS = {
+    "RGB565": 2,
+    "BGR888": 3,
+}
+
+class FramebufferSink:
+    """
+    렌더링된 프레임을 메모리 매핑된 리눅스 프레임버퍼(/dev/fb0 등)에 SDL을 거치지 않고 직접 쓰는 출력 대상.
+    RGB Surface를 NumPy로 한 번에 RGB565/BGR888로 변환하며, 직전 프레임과 달라진 영역만 씁니다.
+    일반 파일을 경로로 주면 필요한 크기로 늘려 /dev/fb0 대용으로 쓸 수 있습니다. (하드웨어 없는 테스트용)
+    """
+    def __init__(self, path: str, width: int, height: int, pixel_format: str = "RGB565",
+                 line_length: int | None = None):
+        if pixel_format not in PIXEL_FORMATS:
+            raise ValueError(f"Unsupported pixel format '{pixel_format}'. Use one of {list(PIXEL_FORMATS)}")
+        self.width, self.height = width, height
+        self.pixel_format = pixel_format
+        self.bytes_per_pixel = PIXEL_FORMATS[pixel_format]
+        # 한 줄의 바이트 수 (실제 패널은 패딩이 있을 수 있음: /sys/class/graphics/fb0/stride)
+        self.line_length = line_length or width * self.bytes_per_pixel
+        size = self.line_length * height
+
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        if stat.S_ISREG(os.fstat(self._fd).st_mode) and os.fstat(self._fd).st_size < size:
+            os.ftruncate(self._fd, size)
+        self._mmap = mmap.mmap(self._fd, size, mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE)
+
+        # 매핑된 메모리를 (height, width[, 3]) 픽셀 배열로 보는 뷰와, 마지막으로 쓴 픽셀의 사본
+        raw = np.frombuffer(self._mmap, dtype=np.uint8).reshape(height, self.line_length)
+        if pixel_format == "RGB565":
+            self._pixels = raw.view(np.uint16)[:, :width]
+        else:
+            self._pixels = raw[:, :width * 3].reshape(height, width, 3)
+        self._shadow = self._pixels.copy()
+        self._force_full = True
+
+        self.last_bytes_written = 0
+        self.total_bytes_written = 0
+        self.frames = 0
+
+    def present(self, surface: pygame.Surface, rects: list[pygame.Rect]):
+        """ surface의 rects 영역 중 직전 프레임과 달라진 부분만 변환하여 프레임버퍼에 씁니다. """
+        force = self._force_full
+        if force:
+            rects = [pygame.Rect(0, 0, self.width, self.height)]
+            self._force_full = False
+
+        bounds = pygame.Rect(0, 0, self.width, self.height)
+        source = pygame.surfarray.pixels3d(surface).transpose(1, 0, 2) # (h, w, 3) 뷰, 복사 없음
+        written = 0
+        for rect in rects:
+            rect = bounds.clip(rect)
+            if not rect.w or not rect.h:
+                continue
+            ys, xs = slice(rect.top, rect.bottom), slice(rect.left, rect.right)
+            converted = self._convert(source[ys, xs])
+            changed = converted != self._shadow[ys, xs]
+            if changed.ndim == 3:
+                changed = changed.any(axis=2)
+            if force:
+                changed[:] = True
+            rows = np.flatnonzero(changed.any(axis=1))
+            if rows.size == 0:
+                continue
+            cols = np.flatnonzero(changed.any(axis=0))
+            r0, r1, c0, c1 = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+            patch = converted[r0:r1, c0:c1]
+            y0, x0 = rect.top + r0, rect.left + c0
+            self._pixels[y0:y0 + patch.shape[0], x0:x0 + patch.shape[1]] = patch
+            self._shadow[y0:y0 + patch.shape[0], x0:x0 + patch.shape[1]] = patch
+            written += patch.shape[0] * patch.shape[1] * self.bytes_per_pixel
+            self._flush_rows(y0, y0 + patch.shape[0])
+        del source # Surface 잠금 해제
+
+        self.last_bytes_written = written
+        self.total_bytes_written += written
+        self.frames += 1
+
+    def invalidate(self):
+        """ 다음 프레임은 변경 여부와 상관없이 전체를 씁니다. (다른 프로그램이 화면을 덮어쓴 경우) """
+        self._force_full = True
+
+    def close(self):
+        self._pixels = self._shadow = None
+        self._mmap.close()
+        os.close(self._fd)
+
+    def _convert(self, rgb: np.ndarray) -> np.ndarray:
+        """ (h, w, 3) uint8 RGB 배열을 프레임버퍼 픽셀 형식으로 변환합니다. """
+        if self.pixel_format == "RGB565":
+            r = rgb[..., 0].astype(np.uint16)
+            g = rgb[..., 1].astype(np.uint16)
+            b = rgb[..., 2].astype(np.uint16)
+            return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+        return rgb[..., ::-1]
+
+    def _flush_rows(self, y0: int, y1: int):
+        """ 변경된 줄 범위를 페이지 경계에 맞춰 동기화합니다. """
+        start = y0 * self.line_length // mmap.PAGESIZE * mmap.PAGESIZE
+        end = min(y1 * self.line_length, len(self._mmap))
+        self._mmap.flush(start, end - start)
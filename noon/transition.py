@@ -1,20 +1,118 @@
 # noon/transition.py
+from array import array
+import numpy as np
+from .model import NUMERIC_FIELDS, FIELD_INDEX
+
+# 목표값과의 차이가 이 값 이하이면 목표값으로 고정(snap)합니다.
+SETTLE_EPSILON = 1e-3
+
+# 목표까지 남은 거리가 절반으로 줄어드는 시간(초).
+# 60fps에서 프레임당 0.1씩 보간하던 기존 속도와 같습니다.
+DEFAULT_HALF_LIFE = 0.11
 
 def lerp(start, end, t):
     """ 선형 보간(Linear Interpolation) 함수. """
     return start + t * (end - start)
 
-def transition_state(current_state, target_dict, speed):
+def smoothing_factor(dt: float, half_life: float) -> float:
+    """ dt초 동안 반감기 half_life로 지수 감쇠할 때의 보간 비율(0~1)을 계산합니다. """
+    if half_life <= 0:
+        return 1.0
+    return 1.0 - 0.5 ** (dt / half_life)
+
+class CompiledTarget:
+    """
+    'values' 형식의 목표 dict를 NoonState.values 버퍼 인덱스 기준으로 컴파일한 것.
+    - items: 전환할 숫자형 필드의 (버퍼 인덱스, 목표값) 목록
+    - values/mask: 같은 내용을 버퍼 순서의 목표 벡터와 마스크로 표현 (벡터 연산용)
+    - categorical: 보간하지 않고 즉시 적용할 비숫자 값
+    """
+    __slots__ = ("items", "values", "mask", "categorical")
+
+    def __init__(self, target_dict: dict):
+        self.values = np.zeros(len(NUMERIC_FIELDS))
+        self.mask = np.zeros(len(NUMERIC_FIELDS), dtype=bool)
+        self.categorical = {}
+        for key, value in target_dict.items():
+            index = FIELD_INDEX.get(key)
+            if index is None:
+                self.categorical[key] = value
+            else:
+                self.values[index] = value
+                self.mask[index] = True
+        self.items = tuple((int(index), float(self.values[index])) for index in np.flatnonzero(self.mask))
+
+class PresetMatrix:
+    """
+    감정 프리셋 전체를 한 번 컴파일한 목표 행렬. 여러 감정을 섞은 목표를 가중합 한 번으로 계산합니다.
+    - names/index: 프리셋 이름 순서와 이름 → 행 번호
+    - values/mask: (프리셋 수, 필드 수) 목표값 행렬(지정하지 않은 필드는 0)과 지정 여부 행렬
+    - categorical/effects: 프리셋별 비숫자 값과 'effects' 목록
+    """
+    __slots__ = ("names", "index", "values", "mask", "categorical", "effects")
+
+    def __init__(self, presets: dict):
+        self.names = tuple(presets)
+        self.index = {name: row for row, name in enumerate(self.names)}
+        targets = [CompiledTarget(preset["values"]) for preset in presets.values()]
+        self.values = np.array([target.values for target in targets]).reshape(len(targets), len(NUMERIC_FIELDS))
+        self.mask = np.array([target.mask for target in targets], dtype=np.float64).reshape(self.values.shape)
+        self.categorical = [target.categorical for target in targets]
+        self.effects = [preset.get("effects", []) for preset in presets.values()]
+
+    def weights(self, mix: dict) -> np.ndarray:
+        """ {이름: 가중치} dict를 합이 1인 프리셋 순서의 가중치 벡터로 바꿉니다. 음수는 0으로 셉니다. """
+        weights = np.zeros(len(self.names))
+        for name, weight in mix.items():
+            weights[self.index[name]] = max(float(weight), 0.0)
+        total = weights.sum()
+        if total <= 0:
+            raise ValueError("Emotion mix needs at least one positive weight")
+        return weights / total
+
+    def blend(self, weights: np.ndarray) -> tuple[dict, str]:
+        """
+        가중치 벡터로 섞은 목표 dict와, 가중치가 가장 큰(지배적인) 감정 이름을 반환합니다.
+        숫자형 필드는 그 필드를 지정한 프리셋끼리 가중 평균하고, 비숫자 값(eyebrow_shape 등)은 지배적인 감정을 따릅니다.
+        """
+        total = weights @ self.mask
+        values = (weights @ self.values) / np.where(total > 0, total, 1.0)
+        dominant = int(np.argmax(weights))
+        target = {NUMERIC_FIELDS[i]: float(values[i]) for i in np.flatnonzero(total > 0)}
+        target.update(self.categorical[dominant])
+        return target, self.names[dominant]
+
+def speed_vector(speeds: dict, default: float = 0.0) -> array:
+    """ 필드 이름별 보간 비율 dict를 values 버퍼와 같은 순서의 벡터로 변환합니다. """
+    return array("d", (speeds.get(key, default) for key in NUMERIC_FIELDS))
+
+def transition_state(current_state, target, speed, epsilon: float = SETTLE_EPSILON) -> bool:
     """
-    current_state를 target_dict의 값으로 부드럽게 전환합니다.
-    숫자형 데이터는 보간하고, 다른 타입은 즉시 변경합니다.
+    current_state를 target의 값으로 부드럽게 전환합니다.
+    숫자형 데이터는 values 버퍼를 인덱스로 직접 보간하고, 다른 타입은 즉시 변경합니다.
+    target은 CompiledTarget 또는 'values' 형식의 dict이며,
+    speed는 모든 값에 쓰는 보간 비율, speed_vector로 만든 필드별 벡터, 또는 필드 이름별 dict입니다.
+    목표값과의 차이가 epsilon 이하인 값은 목표값으로 고정하며,
+    모든 값이 목표에 도달(수렴)했으면 True를 반환합니다.
     """
-    for key, target_value in target_dict.items():
-        current_value = getattr(current_state, key)
-        
-        if isinstance(current_value, (int, float)):
-            new_value = lerp(current_value, target_value, speed)
-            setattr(current_state, key, new_value)
+    if isinstance(target, dict):
+        target = CompiledTarget(target)
+    if isinstance(speed, dict):
+        speed = speed_vector(speed)
+    uniform = isinstance(speed, (int, float))
+
+    values = current_state.values
+    settled = True
+    for index, target_value in target.items:
+        delta = target_value - values[index]
+        if -epsilon <= delta <= epsilon:
+            # 수렴한 값은 오차 없이 목표값 그대로 고정합니다.
+            values[index] = target_value
         else:
-            # For non-numeric types (like strings), apply immediately
-            setattr(current_state, key, target_value)
+            values[index] += delta * (speed if uniform else speed[index])
+            settled = False
+
+    # For non-numeric types (like strings), apply immediately
+    for key, value in target.categorical.items():
+        setattr(current_state, key, value)
+    return settled
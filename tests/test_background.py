@@ -0,0 +1,105 @@
+import asyncio
+import threading
+import time
+import unittest
+from noon import Noon
+from noon.commands import CommandQueue
+
+class TestCommandQueue(unittest.TestCase):
+    """
+    Tests the coalescing, thread-safe command queue.
+    """
+
+    def test_coalesces_by_key(self):
+        """Only the latest command per key runs; distinct keys run in submission order."""
+        queue = CommandQueue()
+        calls = []
+        queue.put("gaze", calls.append, 1)
+        queue.put("emotion", calls.append, "angry")
+        queue.put("gaze", calls.append, 2)
+        self.assertEqual(queue.drain(), 2)
+        self.assertEqual(calls, ["angry", 2])
+        self.assertEqual(queue.coalesced, 1)
+        self.assertEqual(queue.drain(), 0)
+
+    def test_wait_wakes_on_put(self):
+        """A waiting consumer wakes up as soon as a command arrives."""
+        queue = CommandQueue()
+        threading.Timer(0.01, queue.put, ("key", print)).start()
+        start = time.perf_counter()
+        self.assertTrue(queue.wait(5.0))
+        self.assertLess(time.perf_counter() - start, 1.0)
+
+class TestBackgroundNoon(unittest.TestCase):
+    """
+    Tests running the render loop on a thread or as an asyncio task.
+    """
+
+    def setUp(self):
+        self.eyes = Noon(width=200, height=100, headless=True)
+        self.addCleanup(self.eyes.stop, 2.0)
+
+    def _wait_for(self, condition, timeout=2.0):
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            if condition():
+                return True
+            time.sleep(0.005)
+        return False
+
+    def test_start_applies_commands_and_stops_cleanly(self):
+        """Commands from the caller thread are applied by the render thread; stop() joins it."""
+        self.eyes.start()
+        self.assertTrue(self.eyes.is_running)
+        self.eyes.set_emotion("angry")
+        self.eyes.set_gaze(0.5)
+        self.assertTrue(self._wait_for(lambda: self.eyes.state.gaze_x > 0.4))
+        self.assertEqual(self.eyes.current_emotion, "angry")
+        self.eyes.stop(timeout=2.0)
+        self.assertFalse(self.eyes.is_running)
+        self.assertFalse(any(t.name.startswith("noon-") for t in threading.enumerate()))
+
+    def test_slow_callback_does_not_block_frames(self):
+        """A slow every-frame callback runs off the render thread, so the simulation keeps advancing."""
+        self.eyes.on_every_frame(lambda: time.sleep(0.6))
+        self.eyes.start()
+        self.eyes.set_gaze(1.0)
+        self.assertTrue(self._wait_for(lambda: self.eyes.state.gaze_x > 0.5, timeout=0.4))
+
+    def test_changing_callback_keeps_full_rate(self):
+        """A settled loop whose every-frame callback keeps changing the state runs at fps, not idle_fps."""
+        calls = []
+        def animate():
+            calls.append(None)
+            self.eyes.state.gaze_x = (len(calls) % 2) * 0.1
+        self.eyes.on_every_frame(animate)
+        self.eyes.start()
+        time.sleep(0.5)
+        self.eyes.stop(2.0)
+        self.assertGreater(len(calls), 0.5 * self.eyes.idle_fps * 3)
+
+    def test_stop_from_callback(self):
+        """stop() called from a callback on the worker thread ends the loop instead of deadlocking."""
+        self.eyes.on_settled(lambda: self.eyes.stop())
+        self.eyes.start()
+        self.eyes.set_gaze(0.3)
+        self.assertTrue(self._wait_for(lambda: not self.eyes.is_running, timeout=3.0))
+        self.assertTrue(self._wait_for(
+            lambda: not any(t.name.startswith("noon-") for t in threading.enumerate())))
+
+    def test_run_async(self):
+        """The render loop runs as an asyncio task alongside other coroutines."""
+        async def scenario():
+            task = asyncio.create_task(self.eyes.run_async())
+            await asyncio.sleep(0)
+            self.eyes.play_clip("glance")
+            await asyncio.sleep(0.3)
+            moved = self.eyes.state.gaze_x
+            self.eyes.stop()
+            await asyncio.wait_for(task, 2.0)
+            return moved
+        self.assertGreater(asyncio.run(scenario()), 0.3)
+        self.assertFalse(self.eyes.is_running)
+
+if __name__ == '__main__':
+    unittest.main()
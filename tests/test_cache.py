@@ -0,0 +1,45 @@
+import unittest
+from noon.cache import LRUCache
+
+class TestLRUCache(unittest.TestCase):
+    """
+    Tests the byte-capped LRU cache used for rendered eye sprites.
+    """
+
+    def setUp(self):
+        self.cache = LRUCache(max_bytes=10, sizeof=len)
+
+    def test_hit_and_miss_counters(self):
+        """A stored value is returned and counted as a hit; unknown keys count as misses."""
+        self.assertIsNone(self.cache.get("a"))
+        self.cache.put("a", "xxx")
+        self.assertEqual(self.cache.get("a"), "xxx")
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_evicts_least_recently_used_over_cap(self):
+        """Going over max_bytes evicts the entry that was used longest ago."""
+        self.cache.put("a", "xxxx")
+        self.cache.put("b", "xxxx")
+        self.cache.get("a")            # 'b' is now the least recently used
+        self.cache.put("c", "xxxx")
+        self.assertIsNone(self.cache.get("b"))
+        self.assertIsNotNone(self.cache.get("a"))
+        self.assertEqual(self.cache.evictions, 1)
+        self.assertLessEqual(self.cache.bytes_used, 10)
+
+    def test_replacing_key_updates_memory_usage(self):
+        """Re-inserting a key replaces the old value without double counting its size."""
+        self.cache.put("a", "xxxx")
+        self.cache.put("a", "xx")
+        self.assertEqual(self.cache.bytes_used, 2)
+        self.assertEqual(len(self.cache), 1)
+
+    def test_oversized_value_is_not_cached(self):
+        """Values larger than the whole cap are returned but never stored."""
+        value = self.cache.put("big", "x" * 11)
+        self.assertEqual(value, "x" * 11)
+        self.assertEqual(len(self.cache), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import json
+import os
+import tempfile
+import unittest
+from noon.clips import BakedClip, ClipPlayer, load_clips, CLIP_LIBRARY
+from noon.controller import Noon
+from noon.model import NoonState
+
+class TestBakedClip(unittest.TestCase):
+    """
+    Tests baking keyframes into sample tables and sampling them.
+    """
+
+    def test_linear_sampling_matches_keyframes(self):
+        """Linear tracks reproduce keyframe values and interpolate between them."""
+        clip = BakedClip("test", {"duration": 1.0, "tracks": {"gaze_x": [[0.0, 0.0], [1.0, 1.0]]}})
+        self.assertAlmostEqual(clip.sample(0.0)[0], 0.0)
+        self.assertAlmostEqual(clip.sample(0.25)[0], 0.25)
+        self.assertAlmostEqual(clip.sample(1.0)[0], 1.0)
+        self.assertAlmostEqual(clip.sample(5.0)[0], 1.0)
+
+    def test_easing_shapes_segment(self):
+        """An ease_in segment lags behind linear progress at its midpoint."""
+        clip = BakedClip("test", {"tracks": {"gaze_x": [[0.0, 0.0], [1.0, 1.0, "ease_in"]]}})
+        self.assertAlmostEqual(clip.sample(0.5)[0], 0.25, places=3)
+
+    def test_looping_wraps_time(self):
+        """Looping clips wrap time around their duration."""
+        clip = BakedClip("test", {"loop": True, "tracks": {"gaze_x": [[0.0, 0.0], [1.0, 1.0]]}})
+        self.assertAlmostEqual(clip.sample(1.25)[0], 0.25)
+
+    def test_rejects_invalid_specs(self):
+        """Unknown fields, easings and modes are reported when baking."""
+        with self.assertRaises(ValueError):
+            BakedClip("bad", {"tracks": {"color": [[0.0, 1.0]]}})
+        with self.assertRaises(ValueError):
+            BakedClip("bad", {"tracks": {"gaze_x": [[0.0, 0.0], [1.0, 1.0, "wobble"]]}})
+        with self.assertRaises(ValueError):
+            BakedClip("bad", {"mode": "multiply", "tracks": {"gaze_x": [[0.0, 0.0]]}})
+
+    def test_load_clips_from_file(self):
+        """Clips are loaded and baked from a JSON file."""
+        spec = {"nod": {"duration": 0.5, "tracks": {"gaze_y": [[0.0, 0.0], [0.25, 0.3], [0.5, 0.0]]}}}
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+            json.dump(spec, f)
+        try:
+            clips = load_clips(f.name)
+        finally:
+            os.unlink(f.name)
+        self.assertAlmostEqual(clips["nod"].sample(0.25)[0], 0.3)
+
+class TestClipPlayer(unittest.TestCase):
+    """
+    Tests layering clips over the state buffer.
+    """
+
+    def test_additive_layer_is_removed_after_clip(self):
+        """Additive clips offset the base value and leave it untouched once finished."""
+        state = NoonState(gaze_x=0.2)
+        player = ClipPlayer()
+        player.play(BakedClip("test", {"tracks": {"gaze_x": [[0.0, 0.5], [0.1, 0.5]]}}))
+        self.assertFalse(player.advance(state.values, 0.05))
+        self.assertAlmostEqual(state.gaze_x, 0.7)
+        for _ in range(5):
+            player.restore(state.values)
+            idle = player.advance(state.values, 0.05)
+        self.assertTrue(idle)
+        self.assertAlmostEqual(state.gaze_x, 0.2)
+
+    def test_absolute_layer_overrides(self):
+        """Absolute clips replace the base value while they play."""
+        state = NoonState(eyelid_top=0.3)
+        player = ClipPlayer()
+        player.play(BakedClip("test", {"mode": "absolute", "tracks": {"eyelid_top": [[0.0, 1.0]]}}))
+        player.advance(state.values, 0.01)
+        self.assertEqual(state.eyelid_top, 1.0)
+        player.restore(state.values)
+        self.assertEqual(state.eyelid_top, 0.3)
+
+class TestNoonPlayClip(unittest.TestCase):
+    """
+    Tests the controller's clip API.
+    """
+
+    def test_play_clip_runs_and_settles(self):
+        """A built-in clip animates the state, keeps it unsettled and then returns to the emotion target."""
+        eyes = Noon(width=200, height=100, headless=True)
+        eyes.play_clip("glance")
+        self.assertFalse(eyes.update(0.3))
+        self.assertGreater(eyes.state.gaze_x, 0.5)
+        for _ in range(20):
+            settled = eyes.update(0.1)
+        self.assertTrue(settled)
+        self.assertEqual(eyes.state.gaze_x, 0.0)
+
+    def test_builtin_clips_are_baked(self):
+        """Built-in clip presets are available by name."""
+        self.assertTrue({"blink", "glance", "double_take"} <= set(CLIP_LIBRARY))
+
+if __name__ == '__main__':
+    unittest.main()
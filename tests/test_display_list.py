@@ -0,0 +1,87 @@
+import os
+import subprocess
+import sys
+import unittest
+import xml.etree.ElementTree as ET
+import pygame
+from noon import Noon
+from noon.display_list import build_display_list, NumpyRasterizer, to_svg
+from noon.engine import NoonEngine
+from noon.face import NoonFaceRenderer
+from noon.model import NoonState
+from noon.presets import EMOTION_PRESETS
+
+def pygame_pixels(state, size=(200, 100)):
+    screen = pygame.Surface(size, 0, 32)
+    NoonFaceRenderer(screen, NoonEngine(*size)).draw(state)
+    return pygame.surfarray.array3d(screen).transpose(1, 0, 2)
+
+class TestDisplayList(unittest.TestCase):
+    """
+    Tests the backend-neutral display list and its NumPy and SVG backends.
+    """
+
+    STATES = [
+        NoonState(**EMOTION_PRESETS["neutral"]["values"]),
+        NoonState(**EMOTION_PRESETS["angry"]["values"], gaze_x=0.3),
+        NoonState(eyelid_top=0.4, eyelid_btm=0.2, gaze_y=0.2),
+    ]
+
+    def test_module_does_not_import_pygame(self):
+        """Building and rasterizing display lists works without pygame."""
+        code = ("import sys; import noon.display_list, noon.engine; "
+                "print('pygame' in sys.modules)")
+        env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+        self.assertEqual(out.stdout.strip(), "False")
+
+    def test_same_state_gives_equal_list(self):
+        """Lists compare equal for equal states and differ as soon as the geometry changes."""
+        engine = NoonEngine(200, 100)
+        first = build_display_list(engine, NoonState())
+        self.assertEqual(first, build_display_list(engine, NoonState()))
+        self.assertNotEqual(first, build_display_list(engine, NoonState(gaze_x=0.01)))
+        self.assertEqual(len(first.eyes), 2)
+
+    def test_numpy_rasterizer_matches_pygame(self):
+        """The NumPy backend draws nearly the same pixels as pygame; an unchanged list is skipped."""
+        engine = NoonEngine(200, 100)
+        rasterizer = NumpyRasterizer(200, 100)
+        for state in self.STATES:
+            self.assertTrue(rasterizer.render(build_display_list(engine, state)))
+            same = (rasterizer.pixels == pygame_pixels(state)).all(axis=2).mean()
+            self.assertGreater(same, 0.97)  # shape edges may differ by a pixel
+        self.assertFalse(rasterizer.render(build_display_list(engine, self.STATES[-1])))
+        self.assertEqual(rasterizer.skipped_frames, 1)
+
+    def test_svg_output(self):
+        """The SVG backend writes one element per primitive plus the background."""
+        svg = to_svg(build_display_list(NoonEngine(200, 100), self.STATES[2]))
+        root = ET.fromstring(svg)
+        tags = [child.tag.split("}")[1] for child in root]
+        self.assertEqual(root.get("width"), "200")
+        self.assertEqual(tags.count("ellipse"), 4)
+        self.assertEqual(tags.count("polygon"), 4)
+        self.assertEqual(tags.count("path"), 2)
+
+class TestFrameSkipping(unittest.TestCase):
+    """
+    Tests that identical frames skip rasterization and presentation.
+    """
+
+    def test_unchanged_frame_is_not_redrawn_or_presented(self):
+        presented = []
+        class Sink:
+            def present(self, surface, rects):
+                presented.append(rects)
+        eyes = Noon(64, 32, headless=True)
+        eyes.add_sink(Sink())
+        self.assertTrue(eyes.step(0.0))
+        self.assertEqual(eyes.step(0.0), [])
+        self.assertEqual(eyes.renderer.skipped_frames, 1)
+        eyes.state.gaze_x = 0.5
+        self.assertTrue(eyes.step(0.0))
+        self.assertEqual(len(presented), 2)
+
+if __name__ == '__main__':
+    unittest.main()
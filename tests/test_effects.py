@@ -0,0 +1,168 @@
+import random
+import unittest
+from noon import Noon
+from noon.effects import EffectPlan, blend_effects, smooth_noise
+from noon.model import NoonState
+
+class TestEffectPlan(unittest.TestCase):
+    """
+    Tests the compiled per-emotion effect plan.
+    """
+
+    def setUp(self):
+        self.calls = []
+        self.registry = {
+            "wiggle": {
+                "apply": lambda state, amount: self.calls.append(("wiggle", amount)),
+                "clear": lambda state: self.calls.append("clear_wiggle") or True,
+            },
+            "glow": {
+                "apply": lambda state: self.calls.append("glow"),
+            },
+        }
+
+    def test_binds_params_once(self):
+        """Active effects are called with their preset params; unknown types are ignored."""
+        plan = EffectPlan([{"type": "wiggle", "amount": 3}, {"type": "missing"}], self.registry)
+        self.assertFalse(plan.run(NoonState()))
+        self.assertEqual(self.calls, [("wiggle", 3)])
+
+    def test_finished_clears_are_dropped(self):
+        """A clear handler that reports completion is not called again on later frames."""
+        plan = EffectPlan([], self.registry)
+        self.assertTrue(plan.run(NoonState()))
+        plan.run(NoonState())
+        self.assertEqual(self.calls, ["clear_wiggle"])
+
+    def test_pending_clear_keeps_plan_busy(self):
+        """A clear handler that is still fading keeps the plan from reporting idle."""
+        remaining = [2]
+        def fading_clear(state):
+            remaining[0] -= 1
+            return remaining[0] <= 0
+        plan = EffectPlan([], {"fade": {"apply": lambda state: None, "clear": fading_clear}})
+        self.assertFalse(plan.run(NoonState()))
+        self.assertTrue(plan.run(NoonState()))
+
+class TestProceduralEffects(unittest.TestCase):
+    """
+    Tests the table-driven blink, saccade, breathing and shake effects.
+    """
+
+    STACK = [{"type": "shake", "intensity": 2.0}, {"type": "blink", "interval": 1.0},
+             {"type": "saccade"}, {"type": "breathing"}]
+
+    def test_noise_is_smooth_and_seeded(self):
+        """Noise tables are reproducible per seed, bounded, and change gradually between samples."""
+        table = smooth_noise(random.Random(1), frequency=12.0)
+        self.assertEqual(table, smooth_noise(random.Random(1), frequency=12.0))
+        self.assertNotEqual(table, smooth_noise(random.Random(2), frequency=12.0))
+        self.assertLessEqual(max(abs(v) for v in table), 1.0)
+        self.assertLess(max(abs(a - b) for a, b in zip(table, table[1:])), 0.75)
+
+    def test_stacked_layers_restore_base(self):
+        """Stacked effects offset the state each step and restore() removes exactly those offsets."""
+        plan = EffectPlan(self.STACK, rng=random.Random(0))
+        state = NoonState(eyelid_top=0.1)
+        base = list(state.values)
+        closed = moved = False
+        for _ in range(180):
+            plan.restore(state.values)
+            for name in ("eyelid_top", "eye_scale", "gaze_x"):
+                self.assertAlmostEqual(getattr(state, name), getattr(NoonState(eyelid_top=0.1), name))
+            self.assertFalse(plan.run(state))
+            closed = closed or state.eyelid_top >= 1.0
+            moved = moved or state.gaze_x != 0.0
+        self.assertTrue(closed and moved)
+        plan.restore(state.values)
+        state.shake_x = state.shake_y = 0.0
+        for got, want in zip(state.values, base):
+            self.assertAlmostEqual(got, want)
+
+    def test_switching_plans_removes_old_layer(self):
+        """A new plan built with previous= takes back the offsets the old plan left in the state."""
+        eyes = Noon(64, 32, headless=True, seed=0)
+        eyes._effect_plan = EffectPlan([{"type": "breathing", "amplitude": 0.2, "period": 0.5}],
+                                       rng=eyes.rng, previous=eyes._effect_plan)
+        for _ in range(10):
+            eyes.step(1 / 60)
+        self.assertNotAlmostEqual(eyes.state.eye_scale, 1.0)
+        eyes._effect_plan = EffectPlan([], rng=eyes.rng, previous=eyes._effect_plan)
+        eyes.step(1 / 60)
+        self.assertAlmostEqual(eyes.state.eye_scale, 1.0)
+        self.assertTrue(eyes.is_settled)
+
+class TestEffectBlending(unittest.TestCase):
+    """
+    Tests weighting effect intensities for mixed emotions.
+    """
+
+    def test_intensities_scale_with_weight(self):
+        """Scaled params are weighted sums; presets without the effect count as zero."""
+        effects = blend_effects([[], [{"type": "shake", "intensity": 2.0}],
+                                 [{"type": "blink", "interval": 2.0}]], [0.5, 0.3, 0.2])
+        shake, blink = effects
+        self.assertAlmostEqual(shake["intensity"], 0.6)
+        self.assertEqual(blink["interval"], 2.0)
+        self.assertAlmostEqual(blink["depth"], 0.2)  # handler default depth 1.0
+
+    def test_omitted_intensity_uses_declared_default(self):
+        """A scaled param without a constructor default falls back to the registry default."""
+        effects = blend_effects([[{"type": "shake", "frequency": 8.0}], [{"type": "shake", "intensity": 2.0}]],
+                                [0.75, 0.25])
+        self.assertEqual(effects, [{"type": "shake", "frequency": 8.0, "intensity": 0.5}])
+
+    def test_rescale_keeps_the_running_plan(self):
+        """Changing only intensities updates the plan in place; other changes need a new plan."""
+        plan = EffectPlan([{"type": "shake", "intensity": 2.0}], rng=random.Random(0))
+        state = NoonState()
+        plan.run(state)
+        self.assertTrue(plan.rescale([{"type": "shake", "intensity": 0.0}]))
+        for _ in range(5):
+            plan.restore(state.values)
+            plan.run(state)
+        self.assertEqual((state.shake_x, state.shake_y), (0.0, 0.0))
+        self.assertFalse(plan.rescale([{"type": "shake", "intensity": 1.0, "frequency": 3.0}]))
+        self.assertFalse(plan.rescale([]))
+
+class TestNoonEmotionMix(unittest.TestCase):
+    """
+    Tests set_emotion_mix on the controller.
+    """
+
+    def setUp(self):
+        self.eyes = Noon(200, 100, headless=True, seed=0)
+
+    def test_mix_sets_blended_target_and_dominant_emotion(self):
+        self.eyes.set_emotion_mix({"angry": 0.3, "neutral": 0.7})
+        self.eyes.step(0.0)
+        self.assertEqual(self.eyes.current_emotion, "neutral")
+        self.assertAlmostEqual(self.eyes.target_values["eye_scale"], 0.7 * 1.0 + 0.3 * 1.15)
+        self.assertEqual(self.eyes.target_values["eyebrow_shape"], "arc")
+        self.assertAlmostEqual(self.eyes._effect_plan.appliers[0].intensity, 0.6)
+
+    def test_repeated_mixes_reuse_the_effect_plan(self):
+        """Only the shake intensity changes between mixes, so the plan is not rebuilt."""
+        self.eyes.set_emotion_mix({"angry": 0.6, "neutral": 0.4})
+        self.eyes.step(0.0)
+        plan = self.eyes._effect_plan
+        self.eyes.set_emotion_mix({"angry": 0.9, "neutral": 0.1})
+        self.eyes.step(0.0)
+        self.assertIs(self.eyes._effect_plan, plan)
+        self.assertAlmostEqual(plan.appliers[0].intensity, 1.8)
+
+    def test_set_emotion_after_mix_restores_preset(self):
+        self.eyes.set_emotion_mix({"angry": 0.4, "neutral": 0.6})
+        self.eyes.set_emotion("neutral")
+        self.eyes.step(0.0)
+        self.assertIsNone(self.eyes.emotion_mix)
+        self.assertAlmostEqual(self.eyes.target_values["eye_scale"], 1.0)
+
+    def test_invalid_mix_raises(self):
+        with self.assertRaises(ValueError):
+            self.eyes.set_emotion_mix({"sleepy": 1.0})
+        with self.assertRaises(ValueError):
+            self.eyes.set_emotion_mix({"angry": 0.0})
+
+if __name__ == '__main__':
+    unittest.main()
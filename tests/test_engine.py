@@ -1,7 +1,8 @@
 import unittest
 import math
+import numpy as np
 from noon.engine import NoonEngine
-from noon.model import NoonState
+from noon.model import NoonState, STATE_DTYPE, stack_states
 
 class TestNoonEngine(unittest.TestCase):
     """
@@ -93,5 +94,44 @@ class TestNoonEngine(unittest.TestCase):
         except Exception as e:
             self.fail(f"Engine calculations failed with extreme inputs: {e}")
 
+class TestNoonEngineBatch(unittest.TestCase):
+    """
+    Tests that the NumPy batch geometry API matches the scalar methods exactly.
+    """
+
+    def setUp(self):
+        self.engine = NoonEngine(800, 600)
+        rng = np.random.default_rng(7)
+        self.states = [
+            NoonState(gaze_x=gx, gaze_y=gy, eye_scale=sc, eye_eccentricity=ec, shake_x=sx, shake_y=sy)
+            for gx, gy, sc, ec, sx, sy in rng.uniform(-2.0, 2.0, size=(50, 6))
+        ]
+
+    def test_centers_match_scalar(self):
+        """Batch centers equal get_eye_center for every face and both eyes, bit for bit."""
+        gaze_x = [s.gaze_x for s in self.states]
+        gaze_y = [s.gaze_y for s in self.states]
+        centers = self.engine.get_eye_centers_batch(gaze_x, gaze_y)
+        self.assertEqual(centers.shape, (len(self.states), 2, 2))
+        for i, state in enumerate(self.states):
+            self.assertEqual(tuple(centers[i, 0]), self.engine.get_eye_center(False, state))
+            self.assertEqual(tuple(centers[i, 1]), self.engine.get_eye_center(True, state))
+
+    def test_dimensions_match_scalar(self):
+        """Batch dimensions equal get_eye_dimensions for every face, bit for bit."""
+        dims = self.engine.get_eye_dimensions_batch([s.eye_scale for s in self.states],
+                                                    [s.eye_eccentricity for s in self.states])
+        for i, state in enumerate(self.states):
+            self.assertEqual(tuple(dims[i]), self.engine.get_eye_dimensions(state))
+
+    def test_geometry_from_structured_array_includes_shake(self):
+        """A structured array of states gives the scalar centers plus the shake offset."""
+        structured = stack_states(self.states).view(STATE_DTYPE).reshape(-1)
+        centers, dims = self.engine.get_geometry_batch(structured)
+        for i, state in enumerate(self.states):
+            cx, cy = self.engine.get_eye_center(True, state)
+            self.assertEqual(tuple(centers[i, 1]), (cx + state.shake_x, cy + state.shake_y))
+            self.assertEqual(tuple(dims[i]), self.engine.get_eye_dimensions(state))
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,117 @@
+import random
+import time
+import unittest
+from noon import Noon
+from noon.gaze import GazeFilter
+from noon.shm import SharedTargetWriter
+
+class TestGazeFilter(unittest.TestCase):
+    """
+    Tests smoothing, prediction and saccades of the gaze input filter.
+    """
+
+    def test_smooths_noise_when_still(self):
+        """Noise around a fixed point is strongly attenuated."""
+        rng = random.Random(0)
+        gaze_filter = GazeFilter()
+        raw, outputs = [], []
+        for i in range(240):
+            t = i / 120
+            raw.append(0.2 + rng.gauss(0, 0.05))
+            gaze_filter.push(raw[-1], 0.0, t)
+            if i % 2:
+                outputs.append(gaze_filter.update(t + 1 / 60)[0])
+        tail = outputs[60:]
+        self.assertLess(max(tail) - min(tail), (max(raw) - min(raw)) / 2)
+        self.assertAlmostEqual(sum(tail) / len(tail), 0.2, delta=0.03)
+
+    def test_predicts_ahead_on_ramp(self):
+        """On a steady ramp the prediction for the display time is closer than the last raw sample."""
+        gaze_filter = GazeFilter()
+        samples = [(i / 120, -0.8 + i / 120, 0.0) for i in range(120)]
+        gaze_filter.push_many(samples)
+        display_time = samples[-1][0] + 1 / 60
+        x, _, _ = gaze_filter.update(display_time)
+        truth = -0.8 + display_time
+        self.assertLess(abs(x - truth), abs(samples[-1][1] - truth))
+
+    def test_saccade_jumps(self):
+        """A change larger than the saccade threshold resets the filter onto the new sample."""
+        gaze_filter = GazeFilter(saccade_threshold=0.3)
+        gaze_filter.push_many([(i / 120, -0.5, 0.0) for i in range(60)])
+        self.assertFalse(gaze_filter.update(0.5)[2])
+        gaze_filter.push(0.6, 0.1, 0.51)
+        x, y, saccade = gaze_filter.update(0.52)
+        self.assertTrue(saccade)
+        self.assertEqual((x, y), (0.6, 0.1))
+
+    def test_times_out(self):
+        """Without fresh samples the filter stops reporting a target."""
+        gaze_filter = GazeFilter(timeout=0.2)
+        gaze_filter.push(0.1, 0.1, 1.0)
+        self.assertIsNotNone(gaze_filter.update(1.1))
+        self.assertIsNone(gaze_filter.update(1.5))
+
+class TestNoonGazeInput(unittest.TestCase):
+    """
+    Tests feeding tracker samples into the controller.
+    """
+
+    def test_push_gaze_drives_and_releases_target(self):
+        """Pushed samples move the eyes directly; after the timeout the preset gaze takes over again."""
+        eyes = Noon(width=200, height=100, headless=True)
+        eyes.gaze_filter.timeout = 0.05
+        now = time.perf_counter()
+        for i in range(12):
+            eyes.push_gaze(0.5, -0.25, now - 0.01 + i / 1200)
+        eyes.update(1 / 60)
+        self.assertAlmostEqual(eyes.state.gaze_x, 0.5, places=2)
+        self.assertAlmostEqual(eyes.state.gaze_y, -0.25, places=2)
+
+        time.sleep(0.1)
+        for _ in range(20):
+            eyes.update(0.1)
+        self.assertEqual(eyes.state.gaze_y, 0.0)
+
+    def test_saccade_lands_under_playing_clip(self):
+        """A tracker saccade moves the base gaze at once even while a clip layer is offsetting it."""
+        eyes = Noon(width=200, height=100, headless=True)
+        eyes.gaze_filter = GazeFilter(saccade_threshold=0.3)
+        eyes.gaze_follow_half_life = 0.5
+        now = time.perf_counter()
+        for i in range(12):
+            eyes.push_gaze(0.0, 0.0, now - 0.02 + i / 1200)
+        eyes.update(1 / 60)
+        eyes.play_clip("glance")
+        eyes.update(1 / 60)
+        eyes.push_gaze(0.8, 0.0)
+        eyes.update(1 / 60)
+        eyes._clip_player.restore(eyes.state.values)
+        self.assertAlmostEqual(eyes.state.gaze_x, 0.8, places=3)
+
+    def test_attach_shared_target_keeps_tracking_settings(self):
+        """Attaching a shared target mid-tracking keeps the filter and restores preset speeds afterwards."""
+        eyes = Noon(width=200, height=100, headless=True)
+        gaze_filter = GazeFilter(timeout=0.05)
+        eyes.gaze_filter = gaze_filter
+        eyes.gaze_follow_half_life = 0.05
+        preset_speeds = list(eyes._step_speeds)
+        now = time.perf_counter()
+        for i in range(12):
+            eyes.push_gaze(0.5, -0.25, now - 0.01 + i / 1200)
+        eyes.update(1 / 60)
+        self.assertNotEqual(list(eyes._step_speeds), preset_speeds)
+
+        writer = SharedTargetWriter()
+        self.addCleanup(writer.close)
+        eyes.attach_shared_target(writer.name)
+        self.addCleanup(eyes.detach_shared_target)
+        self.assertIs(eyes.gaze_filter, gaze_filter)
+        self.assertEqual(eyes.gaze_follow_half_life, 0.05)
+
+        time.sleep(0.1)
+        eyes.update(0.1)
+        self.assertEqual(list(eyes._step_speeds), preset_speeds)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+import unittest
+import pygame
+from noon import Noon
+from noon.engine import NoonEngine
+from noon.face import NoonFaceRenderer, SPRITE_MIN_REPEATS
+from noon.model import NoonState
+
+class TestHeadlessNoon(unittest.TestCase):
+    """
+    Renders frames without a window and checks pixels at known eye positions.
+    """
+
+    def setUp(self):
+        self.eyes = Noon(width=400, height=200, headless=True)
+
+    def _pixel(self, x, y):
+        return tuple(self.eyes.screen.get_at((int(x), int(y))))[:3]
+
+    def test_golden_pixels_neutral(self):
+        """The ring shows the eye color, the inner hole shows the background."""
+        self.eyes.step(0.0)
+        state = self.eyes.state
+        cx, cy = self.eyes.engine.get_eye_center(False, state)
+        w, h = self.eyes.engine.get_eye_dimensions(state)
+        ring_x = cx + w / 2 * (1 + state.ring_inner_ratio) / 2 # 링 두께의 가운데
+        self.assertEqual(self._pixel(ring_x, cy), state.color)
+        self.assertEqual(self._pixel(cx, cy + h * 0.25), self.eyes.bg_color)
+
+    def test_frame_views_share_surface_memory(self):
+        """frame_array and frame_buffer expose the surface pixels without copying."""
+        self.eyes.step(0.0)
+        view = self.eyes.frame_array()
+        self.assertEqual(view.shape, (400, 200, 3))
+        view[0, 0] = (10, 20, 30)
+        del view
+        self.assertEqual(self._pixel(0, 0), (10, 20, 30))
+
+        buffer = self.eyes.frame_buffer()
+        self.assertEqual(buffer.nbytes, self.eyes.screen.get_pitch() * 200)
+        with self.assertRaises(RuntimeError):
+            self.eyes.step(0.0)  # surface is locked while the view is alive
+        buffer.release()
+        self.eyes.step(0.0)
+
+    def test_step_advances_by_dt(self):
+        """step(dt) advances the simulation by the given time, independent of wall clock."""
+        self.eyes.set_emotion("angry")
+        self.eyes.step(0.0)
+        self.assertEqual(self.eyes.state.eye_scale, 1.0)
+        self.eyes.step(1.0)
+        self.assertGreater(self.eyes.state.eye_scale, 1.0)
+
+class TestEyelidRendering(unittest.TestCase):
+    """
+    Checks that eyelids occlude the ring and that their masks are cached.
+    """
+
+    def setUp(self):
+        self.eyes = Noon(width=400, height=200, headless=True)
+
+    def _ring_pixel(self, dy_ratio):
+        """Pixel on the ring's left edge, dy_ratio of the half height above (-) or below (+) center."""
+        state = self.eyes.state
+        cx, cy = self.eyes.engine.get_eye_center(False, state)
+        w, h = self.eyes.engine.get_eye_dimensions(state)
+        x = cx - w / 2 * (1 + state.ring_inner_ratio) / 2 * 0.8
+        return tuple(self.eyes.screen.get_at((int(x), int(cy + dy_ratio * h / 2))))[:3]
+
+    def test_closed_lids_hide_the_ring(self):
+        """Fully closed lids cover the ring; half-closed top lids cover only its upper part."""
+        self.eyes.state.eyelid_top = 0.5
+        self.eyes.step(0.0)
+        self.assertEqual(self._ring_pixel(-0.5), self.eyes.bg_color)
+        self.assertEqual(self._ring_pixel(0.5), self.eyes.state.color)
+
+        self.eyes.state.eyelid_top = 1.0
+        self.eyes.step(0.0)
+        self.assertEqual(self._ring_pixel(0.5), self.eyes.bg_color)
+
+    def test_masks_are_reused(self):
+        """Redrawing the same lid depth hits the mask cache instead of rebuilding."""
+        self.eyes.state.eyelid_btm = 0.3
+        self.eyes.step(0.0)
+        built = len(self.eyes.renderer.lid_masks)
+        self.eyes.renderer.invalidate()  # an unchanged frame would otherwise be skipped
+        self.eyes.step(0.0)
+        self.assertEqual(len(self.eyes.renderer.lid_masks), built)
+        self.assertGreaterEqual(self.eyes.renderer.lid_masks.hits, 2)
+
+    def test_masks_survive_small_size_changes(self):
+        """Eye sizes a pixel or two apart (e.g. breathing) share one mask, built wide enough for both."""
+        renderer = self.eyes.renderer
+        mask = renderer._lid_mask(101, 61, 10, False, (0, 0, 0))
+        self.assertIs(renderer._lid_mask(103, 63, 10, False, (0, 0, 0)), mask)
+        self.assertGreaterEqual(mask.get_width(), 103)
+
+class TestDirtyRects(unittest.TestCase):
+    """
+    Checks that redrawing only the damaged areas leaves no trails.
+    """
+
+    def test_matches_full_redraw(self):
+        """A moving, shaking, blinking sequence looks the same with and without dirty rects."""
+        full = Noon(width=320, height=160, headless=True, seed=7)
+        dirty = Noon(width=320, height=160, headless=True, seed=7, dirty_rects=True)
+        presented = []
+        dirty.add_sink(type("Sink", (), {"present": lambda self, surface, rects: presented.append(rects)})())
+        previous = None
+        for eyes in (full, dirty):
+            eyes.set_emotion("angry")
+        for i in range(90):
+            for eyes in (full, dirty):
+                if i % 30 == 0:
+                    eyes.play_clip("blink")
+                eyes.set_gaze(((i % 40) - 20) / 20, ((i % 25) - 12) / 24)
+                eyes.step(1 / 60)
+            self.assertEqual(pygame.image.tobytes(dirty.screen, "RGB"), pygame.image.tobytes(full.screen, "RGB"),
+                             f"frame {i}")
+            current = dirty.renderer._last_bounds
+            if previous is not None and presented:
+                screen_rect = dirty.screen.get_rect()
+                for rect, old, new in zip(presented[-1], previous, current):
+                    self.assertTrue(rect.contains(old.clip(screen_rect)), f"frame {i}")
+                    self.assertTrue(rect.contains(new.clip(screen_rect)), f"frame {i}")
+            previous = current
+            presented.clear()
+
+class TestSpriteCache(unittest.TestCase):
+    """
+    Checks when eye sprites are built and that blitting them matches drawing directly.
+    """
+
+    def setUp(self):
+        self.engine = NoonEngine(200, 100)
+        self.cached = NoonFaceRenderer(pygame.Surface((200, 100), 0, 32), self.engine, sprite_cache_bytes=1 << 20)
+
+    def _draw(self, renderer, state):
+        renderer.invalidate()
+        renderer.draw(state)
+
+    def test_sprite_needs_consecutive_repeats(self):
+        """Alternating shapes never build sprites; the same shape drawn in a row does."""
+        open_eye, half_closed = NoonState(), NoonState(eyelid_top=0.5)
+        for i in range(2 * SPRITE_MIN_REPEATS):
+            self._draw(self.cached, open_eye if i % 2 else half_closed)
+        self.assertEqual(len(self.cached.sprite_cache), 0)
+        for _ in range(SPRITE_MIN_REPEATS):
+            self._draw(self.cached, open_eye)
+        self.assertEqual(len(self.cached.sprite_cache), 1)  # both eyes share one shape
+
+    def test_sprite_matches_direct_drawing(self):
+        """Background-colored parts of the eye (the ring's hole, lids) are drawn, not made transparent."""
+        state = NoonState(eyelid_top=0.3)
+        for _ in range(SPRITE_MIN_REPEATS + 1):
+            self._draw(self.cached, state)
+        self.assertEqual(len(self.cached.sprite_cache), 1)
+        # a fresh cached renderer draws the same quantized shapes directly on its first frame
+        reference = NoonFaceRenderer(pygame.Surface((200, 100), 0, 32), self.engine, sprite_cache_bytes=1 << 20)
+        reference.draw(state)
+        self.assertEqual(len(reference.sprite_cache), 0)
+        self.assertEqual(pygame.image.tobytes(self.cached.screen, "RGB"), pygame.image.tobytes(reference.screen, "RGB"))
+
+        # over a non-background frame the hole still shows the background color, as when drawing directly
+        self.cached.screen.fill((0, 255, 0))
+        cx, cy = self.engine.get_eye_center(False, state)
+        self.cached._draw_eye(0, round(cx), round(cy), self.cached._last_list.eyes[0][2])
+        self.assertEqual(tuple(self.cached.screen.get_at((round(cx), round(cy))))[:3], (0, 0, 0))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+import pickle
+from noon.model import NoonState, FIELD_INDEX, NUMERIC_FIELDS
+
+class TestNoonState(unittest.TestCase):
+    """
+    Tests the compact, buffer-backed NoonState.
+    """
+
+    def test_attributes_share_the_buffer(self):
+        """Attribute writes land in the float buffer and buffer writes show up as attributes."""
+        state = NoonState(eye_scale=1.2)
+        self.assertEqual(state.values[FIELD_INDEX["eye_scale"]], 1.2)
+        state.vector[FIELD_INDEX["gaze_x"]] = -0.5
+        self.assertEqual(state.gaze_x, -0.5)
+        self.assertEqual(len(state.values), len(NUMERIC_FIELDS))
+
+    def test_unknown_field_is_rejected(self):
+        """Like the dataclass it replaces, unknown keyword fields raise TypeError."""
+        with self.assertRaises(TypeError):
+            NoonState(eye_size=1.0)
+
+    def test_copy_and_pickle_do_not_share_memory(self):
+        """Copies (including pickled ones) are equal but independent of the original."""
+        state = NoonState(gaze_y=0.3, eyebrow_shape="angry")
+        for clone in (state.copy(), pickle.loads(pickle.dumps(state))):
+            self.assertEqual(clone, state)
+            clone.gaze_y = 0.0
+            self.assertEqual(state.gaze_y, 0.3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import threading
+import time
+import unittest
+import numpy as np
+import pygame
+from noon import Noon
+from noon.model import NoonState
+from noon.panels import PanelEngine, PanelOutput, EyePanel, PanelSet
+
+class RecordingSink:
+    """Copies every presented frame and optionally simulates a slow transfer."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.frames = []
+        self.active = []
+
+    def present(self, surface, rects):
+        self.active.append(threading.current_thread().name)
+        time.sleep(self.delay)
+        self.frames.append(pygame.surfarray.array3d(surface))
+
+def eye_center(surface):
+    """Centroid of the lit pixels of a panel."""
+    lit = pygame.surfarray.array3d(surface).any(axis=2)
+    xs, ys = np.nonzero(lit)
+    return xs.mean(), ys.mean()
+
+class TestPanelEngine(unittest.TestCase):
+    """
+    Tests the single-eye geometry used by each panel.
+    """
+
+    def test_eye_is_centered_and_gaze_scales_with_panel(self):
+        """Both eyes sit in the middle of their panel and move by the same fraction of it."""
+        small, large = PanelEngine(120, 120), PanelEngine(240, 200)
+        state = NoonState(gaze_x=0.5, gaze_y=-0.5)
+        for engine in (small, large):
+            self.assertEqual(engine._eye_center(False, 0.0, 0.0), (engine.width / 2, engine.height / 2))
+            self.assertEqual(engine.get_eye_center(False, state), engine.get_eye_center(True, state))
+        sx, sy = small.get_eye_center(True, state)
+        lx, ly = large.get_eye_center(True, state)
+        self.assertAlmostEqual(sx / 120, lx / 240)
+        self.assertAlmostEqual(sy / 120, ly / 200)
+
+class TestPanelSet(unittest.TestCase):
+    """
+    Tests split rendering into per-eye surfaces and the per-panel output threads.
+    """
+
+    def test_each_panel_draws_one_eye(self):
+        """A panel shows only its own eye, centered, with the same gaze offset on both panels."""
+        panels = PanelSet([EyePanel(160, 160, False), EyePanel(160, 160, True)])
+        panels.draw(NoonState(gaze_x=0.4))
+        (lx, ly), (rx, ry) = (eye_center(p.surface) for p in panels.panels)
+        self.assertAlmostEqual(lx, 80 + 0.4 * 160 * 0.25, delta=2)
+        self.assertAlmostEqual(lx, rx, delta=1)
+        self.assertAlmostEqual(ly, ry, delta=1)
+
+    def test_transfers_overlap(self):
+        """Both panels are sent on their own threads at the same time, not one after the other."""
+        panels = PanelSet([EyePanel(32, 32, False), EyePanel(32, 32, True)])
+        sinks = [RecordingSink(0.1), RecordingSink(0.1)]
+        for panel, sink in zip(panels.panels, sinks):
+            panel.add_sink(sink)
+        panels.draw(NoonState())
+        start = time.perf_counter()
+        panels.present()
+        self.assertTrue(panels.wait(5.0))
+        self.assertLess(time.perf_counter() - start, 0.18)
+        self.assertEqual([s.active for s in sinks], [["noon-panel-left"], ["noon-panel-right"]])
+        panels.close()
+
+    def test_draw_waits_for_previous_transfer(self):
+        """A slow panel is never drawn over while it is being sent, so every sent frame is complete."""
+        output = PanelOutput()
+        sink = RecordingSink(0.05)
+        output.sinks.append(sink)
+        surface = pygame.Surface((4, 4), 0, 32)
+        for value in (10, 20, 30):
+            output.wait()
+            surface.fill((value, value, value))
+            output.submit(surface, [surface.get_rect()])
+        output.close()
+        self.assertEqual([int(frame[0, 0, 0]) for frame in sink.frames], [10, 20, 30])
+        self.assertEqual(output.frames, 3)
+
+class TestNoonPanels(unittest.TestCase):
+    """
+    Tests the split-output mode of the controller.
+    """
+
+    def test_step_pushes_both_panels(self):
+        """Every changed frame is sent to both panels; preview copies them onto the screen."""
+        eyes = Noon(320, 160, headless=True, seed=0)
+        panels = eyes.enable_panels((120, 120), preview=True)
+        sinks = [RecordingSink(), RecordingSink()]
+        panels.left.add_sink(sinks[0])
+        panels.right.add_sink(sinks[1])
+        for i in range(3):
+            eyes.state.gaze_x = i / 10
+            eyes.step(0.0)
+        eyes.step(0.0)  # unchanged frame: nothing is sent
+        panels.wait()
+        self.assertEqual([len(s.frames) for s in sinks], [3, 3])
+        self.assertEqual(sinks[0].frames[0].shape, (120, 120, 3))
+        # the left half of the preview shows the left panel
+        screen = pygame.surfarray.array3d(eyes.screen)
+        self.assertTrue(np.array_equal(screen[20:140, 20:140], sinks[0].frames[-1]))
+        eyes.disable_panels()
+        self.assertIsNone(eyes.panels)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import csv
+import json
+import os
+import tempfile
+import time
+import unittest
+import pygame
+from noon import Noon
+from noon.profiler import FrameProfiler, ProfilerOverlay, STAGES
+
+def record(profiler, durations, idle=False):
+    """Records one frame whose stages take roughly the given durations (seconds)."""
+    profiler.begin_frame()
+    for stage, duration in zip(profiler.stages, durations):
+        if duration:
+            time.sleep(duration)
+        profiler.mark(stage)
+    profiler.end_frame(idle)
+
+class TestFrameProfiler(unittest.TestCase):
+    """
+    Tests the ring buffers, percentiles, dropped-frame counting and trace dumps.
+    """
+
+    def test_ring_buffer_keeps_latest_frames(self):
+        """Only the last `capacity` frames are kept, oldest first."""
+        profiler = FrameProfiler(capacity=4, stages=("work",))
+        for _ in range(6):
+            record(profiler, [0.0])
+        self.assertEqual(profiler.frames, 6)
+        self.assertEqual(len(profiler.recent()), 4)
+        starts = [profiler._starts[slot] for slot in profiler._order()]
+        self.assertEqual(starts, sorted(starts))
+
+    def test_stage_times_and_dropped_frames(self):
+        """Stage times add up to the frame, and only busy frames over budget count as dropped."""
+        profiler = FrameProfiler(fps=100, stages=("a", "b"))
+        record(profiler, [0.0, 0.02])
+        record(profiler, [0.0, 0.02], idle=True)
+        record(profiler, [0.0, 0.0])
+        self.assertEqual(profiler.dropped_frames, 1)
+        self.assertGreaterEqual(profiler.recent("b")[0], 0.02)
+        self.assertLess(profiler.recent("a")[0], 0.01)
+        self.assertGreaterEqual(profiler.recent("frame")[0], profiler.recent("b")[0])
+        summary = profiler.summary()
+        self.assertGreaterEqual(summary["b"]["p99"], 20.0)
+        self.assertEqual(summary["frames"], 3)
+        self.assertEqual(profiler.percentile("b", 0), profiler.recent("b")[2])
+
+    def test_dump_csv_and_trace(self):
+        """Traces are written as CSV rows or Chrome trace events."""
+        profiler = FrameProfiler(stages=("a", "b"))
+        for _ in range(3):
+            record(profiler, [0.0, 0.0])
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = os.path.join(directory, "trace.csv")
+            json_path = os.path.join(directory, "trace.json")
+            profiler.dump(csv_path)
+            profiler.dump(json_path)
+            with open(csv_path, newline="") as f:
+                rows = list(csv.reader(f))
+            with open(json_path) as f:
+                events = json.load(f)["traceEvents"]
+        self.assertEqual(rows[0], ["start", "a", "b", "frame", "idle"])
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(len(events), 3 * 3)
+        self.assertEqual({event["name"] for event in events}, {"frame", "a", "b"})
+
+class TestNoonProfiling(unittest.TestCase):
+    """
+    Tests profiling the controller's render loop.
+    """
+
+    def test_render_loop_records_stages(self):
+        """Frames of the background render loop are recorded per stage and the overlay is drawn."""
+        eyes = Noon(width=320, height=200, headless=True)
+        self.addCleanup(eyes.stop, 2.0)
+        profiler = eyes.enable_profiler(overlay=True)
+        eyes.start()
+        eyes.set_emotion("angry")
+        time.sleep(0.3)
+        eyes.stop(2.0)
+        self.assertGreater(profiler.frames, 0)
+        self.assertEqual(set(profiler.summary()) - {"frames", "dropped_frames"}, {*STAGES, "frame"})
+        self.assertGreater(max(profiler.recent("draw")), 0.0)
+        self.assertGreater(eyes.profiler_overlay._graph_frame, 0)
+
+    def test_overlay_is_cleared_when_disabled(self):
+        """Turning the overlay off in dirty-rect mode erases it and reports the whole screen as changed."""
+        eyes = Noon(width=320, height=200, headless=True, dirty_rects=True)
+        presented = []
+        eyes.add_sink(type("Sink", (), {"present": lambda self, surface, rects: presented.append(rects)})())
+        eyes.enable_profiler(overlay=True)
+        eyes._frame()
+        self.assertNotEqual(tuple(eyes.screen.get_at((10, 10)))[:3], eyes.bg_color)
+        eyes.disable_profiler()
+        eyes._frame()
+        self.assertEqual(tuple(eyes.screen.get_at((10, 10)))[:3], eyes.bg_color)
+        self.assertEqual(presented[-1], [eyes.screen.get_rect()])
+
+    def test_overlay_without_frames(self):
+        """The overlay can be drawn before any frame was recorded."""
+        surface = pygame.Surface((300, 150), 0, 32)
+        rect = ProfilerOverlay().draw(surface, FrameProfiler())
+        self.assertTrue(surface.get_rect().contains(rect))
+
+if __name__ == '__main__':
+    unittest.main()
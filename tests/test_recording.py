@@ -0,0 +1,120 @@
+import os
+import tempfile
+import unittest
+from noon import Noon
+from noon.model import NUMERIC_FIELDS
+from noon.effects import EffectPlan
+from noon.recording import StateRecorder, StateLog, StateReplay, HEADER_SIZE, RECORD
+
+def run(eyes, frames):
+    """Steps a headless controller and returns the snapshots that were presented."""
+    snapshots = []
+    for _ in range(frames):
+        eyes.step(1 / 60)
+        snapshots.append(eyes.state.copy())
+    return snapshots
+
+class TestSeededEffects(unittest.TestCase):
+    """
+    Tests that the per-controller RNG makes dynamic effects reproducible.
+    """
+
+    def test_same_seed_same_shake(self):
+        """Two controllers with the same seed shake identically; the global random module is not used."""
+        a, b = Noon(64, 32, headless=True, seed=5), Noon(64, 32, headless=True, seed=5)
+        for eyes in (a, b):
+            eyes.set_emotion("angry")
+        self.assertEqual(run(a, 20), run(b, 20))
+        self.assertNotEqual(a.state.shake_x, 0.0)
+
+class TestRecording(unittest.TestCase):
+    """
+    Tests the fixed-record state log, memory-mapped reading and replay.
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "run.noonlog")
+
+    def test_record_and_seek(self):
+        """Every presented frame is stored as one fixed-size record and can be read back by index."""
+        eyes = Noon(120, 60, headless=True, seed=1)
+        eyes.start_recording(self.path)
+        eyes.set_emotion("angry")
+        shown = run(eyes, 30)
+        eyes.stop_recording()
+        self.assertEqual(os.path.getsize(self.path), HEADER_SIZE + 30 * RECORD.size)
+
+        with StateLog(self.path) as log:
+            self.assertEqual(len(log), 30)
+            self.assertEqual(log.header["seed"], 1)
+            self.assertEqual((log.header["width"], log.header["height"]), (120, 60))
+            for index in (0, 17, 29):
+                state = log.state(index)
+                self.assertEqual(state.eyebrow_shape, shown[index].eyebrow_shape)
+                self.assertEqual(state.color, tuple(shown[index].color))
+                for name in NUMERIC_FIELDS:
+                    self.assertAlmostEqual(getattr(state, name), getattr(shown[index], name), places=5)
+            records = log.records()
+            self.assertEqual(len(records), 30)
+            self.assertAlmostEqual(float(records["shake_x"][17]), shown[17].shake_x, places=5)
+            del records  # the log cannot be closed while a view is alive
+            self.assertEqual(log.index_at(log.time(12)), 12)
+            with self.assertRaises(IndexError):
+                log.state(30)
+
+    def test_truncated_record_is_ignored(self):
+        """A partially written last record (e.g. after a power cut) is not exposed."""
+        recorder = StateRecorder(self.path)
+        eyes = Noon(64, 32, headless=True)
+        for i in range(3):
+            recorder.record(eyes.state, timestamp=i / 60)
+        recorder.close()
+        with open(self.path, "ab") as f:
+            f.write(b"\x00" * (RECORD.size // 2))
+        with StateLog(self.path) as log:
+            self.assertEqual(len(log), 3)
+
+    def test_replay_drives_state(self):
+        """Replay overrides the simulation with recorded states, supports seeking and ends back in live mode."""
+        source = Noon(64, 32, headless=True, seed=2)
+        source.start_recording(self.path)
+        source.set_emotion("angry")
+        shown = run(source, 20)
+        source.stop_recording()
+
+        eyes = Noon(64, 32, headless=True)
+        replay = eyes.replay(self.path, frame=10)
+        self.assertAlmostEqual(eyes.state.shake_x, shown[10].shake_x, places=5)
+        replay.seek(3)
+        eyes.update(0.0)
+        self.assertAlmostEqual(eyes.state.eye_scale, shown[3].eye_scale, places=5)
+        self.assertIsInstance(eyes._replay, StateReplay)
+        eyes.update(10.0)
+        self.assertIsNone(eyes._replay)
+        self.assertAlmostEqual(eyes.state.shake_x, shown[-1].shake_x, places=5)
+
+    def test_live_layers_do_not_leak_into_replay(self):
+        """Layer offsets recorded before replay are not subtracted from the replayed state afterwards."""
+        source = Noon(64, 32, headless=True, seed=2)
+        source.start_recording(self.path)
+        run(source, 2)
+        source.stop_recording()
+
+        eyes = Noon(64, 32, headless=True, seed=3)
+        eyes._effect_plan = EffectPlan([{"type": "breathing", "amplitude": 0.2, "period": 0.4}],
+                                       rate=1.0 / eyes.sim_step)
+        eyes.play_clip("glance")
+        eyes.update(0.1)
+        self.assertNotAlmostEqual(eyes.state.eye_scale, 1.0, places=2)
+        eyes.replay(self.path)
+        eyes.stop_replay()
+        eyes._step()
+        eyes._clip_player.restore(eyes.state.values)
+        eyes._effect_plan.restore(eyes.state.values)
+        self.assertAlmostEqual(eyes.state.eye_scale, 1.0, places=5)
+        self.assertAlmostEqual(eyes.state.gaze_x, 0.0, places=5)
+
+if __name__ == '__main__':
+    unittest.main()
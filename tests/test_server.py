@@ -0,0 +1,93 @@
+import os
+import tempfile
+import time
+import unittest
+from noon import Noon
+from noon.server import (ControlServer, ControlClient, decode, encode_emotion, encode_gaze,
+                         encode_field, encode_clip, OP_EMOTION, OP_GAZE, OP_FIELD, OP_CLIP)
+from noon.model import FIELD_INDEX
+
+class TestProtocol(unittest.TestCase):
+    """
+    Tests the binary control message format.
+    """
+
+    def test_round_trip(self):
+        """Several messages packed into one datagram decode back in order."""
+        datagram = encode_emotion("angry") + encode_gaze(0.5, None) + encode_field("eyelid_top", 0.25) + encode_clip("blink")
+        self.assertEqual(decode(datagram), [
+            (OP_EMOTION, "angry"),
+            (OP_GAZE, 0.5, None),
+            (OP_FIELD, FIELD_INDEX["eyelid_top"], 0.25),
+            (OP_CLIP, "blink"),
+        ])
+
+    def test_malformed(self):
+        """Unknown opcodes, truncated payloads and bad field indices are rejected."""
+        for datagram in (b"\xff", encode_emotion("angry")[:-1], b"\x03\xfe\x00\x00\x00\x00"):
+            with self.assertRaises(Exception):
+                decode(datagram)
+
+class TestControlServer(unittest.TestCase):
+    """
+    Tests delivering commands over loopback sockets into the render loop.
+    """
+
+    def setUp(self):
+        self.eyes = Noon(width=200, height=100, headless=True)
+
+    def _serve(self, address):
+        server = ControlServer(self.eyes, address)
+        server.start()
+        self.addCleanup(server.stop)
+        client = ControlClient(server.address)
+        self.addCleanup(client.close)
+        return server, client
+
+    def _wait_for_messages(self, server, count):
+        deadline = time.perf_counter() + 2.0
+        while server.messages < count and time.perf_counter() < deadline:
+            time.sleep(0.005)
+
+    def test_udp_burst_is_coalesced(self):
+        """A burst of writes to one field is applied once per frame with the latest value."""
+        server, client = self._serve(("127.0.0.1", 0))
+        for i in range(50):
+            client.set_field("eyelid_btm", i / 100)
+        client.set_emotion("angry")
+        self._wait_for_messages(server, 51)
+        self.assertEqual(len(self.eyes.commands), 2)
+        self.eyes.update(0.0)
+        self.assertEqual(self.eyes.current_emotion, "angry")
+        self.assertAlmostEqual(self.eyes._target_overrides["eyelid_btm"], 0.49, places=6)
+
+    def test_field_write_persists(self):
+        """A remote field write becomes a target: it is reached and then held, not eased back to the preset."""
+        server, client = self._serve(("127.0.0.1", 0))
+        client.set_field("eye_scale", 1.4)
+        self._wait_for_messages(server, 1)
+        for _ in range(30):
+            self.eyes.update(0.1)
+        self.assertAlmostEqual(self.eyes.state.eye_scale, 1.4, places=3)
+        self.eyes.set_emotion("angry")
+        self.eyes.play_clip("double_take")  # additive eye_scale layer on top
+        for _ in range(30):
+            self.eyes.update(0.1)
+        self.assertAlmostEqual(self.eyes.state.eye_scale, 1.4, places=3)
+
+    def test_unix_socket(self):
+        """The server also listens on a Unix datagram socket and drops malformed datagrams."""
+        path = os.path.join(tempfile.mkdtemp(), "noon.sock")
+        server, client = self._serve(path)
+        client.send(b"\xff")
+        client.set_gaze(0.4)
+        self._wait_for_messages(server, 1)
+        for _ in range(10):
+            self.eyes.update(0.1)
+        self.assertEqual(server.errors, 1)
+        self.assertGreater(self.eyes.state.gaze_x, 0.3)
+        server.stop()
+        self.assertFalse(os.path.exists(path))
+
+if __name__ == '__main__':
+    unittest.main()
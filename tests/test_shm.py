@@ -0,0 +1,82 @@
+import multiprocessing
+import os
+import subprocess
+import sys
+import unittest
+from noon import Noon
+from noon.shm import SharedTargetWriter, SharedTargetReader
+
+def _write_gaze(name, value):
+    writer = SharedTargetWriter(name)
+    writer.write(gaze_x=value)
+    writer.close()
+
+class TestSharedTarget(unittest.TestCase):
+    """
+    Tests the seqlock-protected shared-memory target block.
+    """
+
+    def setUp(self):
+        self.writer = SharedTargetWriter()
+        self.addCleanup(self.writer.close)
+        self.reader = SharedTargetReader(self.writer.name)
+        self.addCleanup(self.reader.close)
+
+    def test_read_only_when_changed(self):
+        """Written fields are returned once; unchanged blocks read as None."""
+        self.assertIsNone(self.reader.read())
+        self.writer.write(gaze_x=0.25, eyelid_top=0.5)
+        self.assertEqual(self.reader.read(), {"gaze_x": 0.25, "eyelid_top": 0.5})
+        self.assertIsNone(self.reader.read())
+        self.writer.clear("eyelid_top")
+        self.assertEqual(self.reader.read(), {"gaze_x": 0.25})
+
+    def test_skips_block_being_written(self):
+        """A block with an odd sequence number (write in progress) is not read."""
+        self.writer.write(gaze_x=0.25)
+        self.writer._begin()
+        self.assertIsNone(self.reader.read())
+        self.assertEqual(self.reader.torn_reads, self.reader.max_retries)
+        self.writer._end()
+        self.assertEqual(self.reader.read(), {"gaze_x": 0.25})
+
+    def test_cross_process_write(self):
+        """A writer in another process is visible to the reader without copying through a pipe."""
+        process = multiprocessing.get_context("spawn").Process(target=_write_gaze, args=(self.writer.name, -0.75))
+        process.start()
+        process.join(10)
+        self.assertEqual(self.reader.read(), {"gaze_x": -0.75})
+
+    def test_unrelated_process_leaves_block_alive(self):
+        """A writer started outside multiprocessing does not unlink the block when it exits."""
+        code = "import sys; from noon.shm import SharedTargetWriter; SharedTargetWriter(sys.argv[1]).write(gaze_x=0.5)"
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run([sys.executable, "-c", code, self.writer.name], cwd=root,
+                                capture_output=True, text=True, timeout=30)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertNotIn("leaked", result.stderr)
+        reader = SharedTargetReader(self.writer.name)
+        self.addCleanup(reader.close)
+        self.assertEqual(reader.read(), {"gaze_x": 0.5})
+
+    def test_noon_overlay_and_replace(self):
+        """Noon overlays shared targets on the emotion preset, or replaces its numeric targets."""
+        eyes = Noon(width=200, height=100, headless=True)
+        eyes.set_emotion("angry")
+        eyes.attach_shared_target(self.writer.name)
+        self.writer.write(gaze_x=0.5)
+        for _ in range(20):
+            eyes.update(0.1)
+        self.assertAlmostEqual(eyes.state.gaze_x, 0.5)
+        self.assertAlmostEqual(eyes.state.eye_scale, 1.15)
+
+        eyes.attach_shared_target(self.writer.name, replace=True)
+        self.writer.write(eye_scale=0.8)
+        for _ in range(20):
+            eyes.update(0.1)
+        self.assertAlmostEqual(eyes.state.eye_scale, 0.8)
+        self.assertEqual(eyes.state.eyebrow_shape, "angry")
+        eyes.detach_shared_target()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import pygame
+from noon import Noon
+from noon.sinks import FramebufferSink
+
+class TestFramebufferSink(unittest.TestCase):
+    """
+    Uses a regular file as a stand-in for /dev/fb0.
+    """
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+        self.surface = pygame.Surface((8, 4), 0, 32)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def _read(self, dtype):
+        return np.fromfile(self.path, dtype=dtype)
+
+    def test_rgb565_conversion(self):
+        """Pixels are packed as 5-6-5 bits in native 16-bit words."""
+        sink = FramebufferSink(self.path, 8, 4, "RGB565")
+        self.surface.fill((255, 0, 0))
+        self.surface.set_at((1, 0), (0, 255, 0))
+        self.surface.set_at((2, 0), (0, 0, 255))
+        sink.present(self.surface, [self.surface.get_rect()])
+        sink.close()
+        pixels = self._read(np.uint16).reshape(4, 8)
+        self.assertEqual(list(pixels[0, :3]), [0xF800, 0x07E0, 0x001F])
+        self.assertEqual(pixels[3, 7], 0xF800)
+
+    def test_bgr888_with_padded_lines(self):
+        """BGR888 writes blue first and respects a line length wider than the panel."""
+        sink = FramebufferSink(self.path, 8, 4, "BGR888", line_length=32)
+        self.surface.fill((1, 2, 3))
+        sink.present(self.surface, [self.surface.get_rect()])
+        sink.close()
+        raw = self._read(np.uint8).reshape(4, 32)
+        self.assertEqual(list(raw[2, :3]), [3, 2, 1])
+        self.assertEqual(list(raw[2, 24:]), [0] * 8)
+
+    def test_only_changed_region_is_written(self):
+        """After the first full frame, only the changed pixels count as written bytes."""
+        sink = FramebufferSink(self.path, 8, 4, "RGB565")
+        sink.present(self.surface, [self.surface.get_rect()])
+        self.assertEqual(sink.last_bytes_written, 8 * 4 * 2)
+
+        sink.present(self.surface, [self.surface.get_rect()])
+        self.assertEqual(sink.last_bytes_written, 0)
+
+        self.surface.fill((255, 255, 255), pygame.Rect(2, 1, 3, 2))
+        sink.present(self.surface, [self.surface.get_rect()])
+        self.assertEqual(sink.last_bytes_written, 3 * 2 * 2)
+        sink.close()
+        self.assertEqual(self._read(np.uint16).reshape(4, 8)[2, 4], 0xFFFF)
+
+    def test_noon_pushes_frames_to_sinks(self):
+        """A headless Noon forwards each presented frame to its registered sinks."""
+        eyes = Noon(width=80, height=40, headless=True)
+        sink = FramebufferSink(self.path, 80, 40, "RGB565")
+        eyes.add_sink(sink)
+        eyes.step(0.0)
+        self.assertEqual(sink.frames, 1)
+        self.assertGreater(sink.last_bytes_written, 0)
+        sink.close()
+
+if __name__ == '__main__':
+    unittest.main()
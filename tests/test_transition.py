@@ -0,0 +1,114 @@
+import unittest
+from noon.model import NoonState
+import numpy as np
+from noon.transition import transition_state, smoothing_factor, PresetMatrix, SETTLE_EPSILON
+from noon.effects import clear_shake
+
+class TestTransitionState(unittest.TestCase):
+    """
+    Tests convergence detection and epsilon snapping of transition_state.
+    """
+
+    def test_reports_not_settled_while_moving(self):
+        """A value far from its target is lerped and the call reports it has not settled."""
+        state = NoonState(eye_scale=1.0)
+        settled = transition_state(state, {"eye_scale": 2.0}, 0.1)
+        self.assertFalse(settled)
+        self.assertAlmostEqual(state.eye_scale, 1.1)
+
+    def test_snaps_to_target_within_epsilon(self):
+        """Once within epsilon, the value is set exactly to the target and reported as settled."""
+        state = NoonState(eye_scale=1.0 + SETTLE_EPSILON / 2)
+        self.assertTrue(transition_state(state, {"eye_scale": 1.0}, 0.1))
+        self.assertEqual(state.eye_scale, 1.0)
+
+    def test_converges_in_finite_steps(self):
+        """Repeated transitions eventually report settled instead of approaching forever."""
+        state = NoonState()
+        target = {"eye_scale": 1.15, "gaze_y": -0.15, "eyebrow_shape": "angry"}
+        for _ in range(200):
+            if transition_state(state, target, 0.1):
+                break
+        else:
+            self.fail("transition_state never reported convergence")
+        self.assertEqual(state.eye_scale, 1.15)
+        self.assertEqual(state.eyebrow_shape, "angry")
+
+    def test_clear_shake_reports_when_finished(self):
+        """clear_shake decays the shake offset and returns True once it has snapped to zero."""
+        state = NoonState(shake_x=2.0, shake_y=-2.0)
+        self.assertFalse(clear_shake(state))
+        for _ in range(100):
+            if clear_shake(state):
+                break
+        self.assertEqual((state.shake_x, state.shake_y), (0.0, 0.0))
+
+class TestSmoothingFactor(unittest.TestCase):
+    """
+    Tests the time-based exponential smoothing used by the fixed-timestep simulation.
+    """
+
+    def test_half_life_halves_the_distance(self):
+        """After exactly one half-life, half of the remaining distance is covered."""
+        self.assertAlmostEqual(smoothing_factor(0.2, 0.2), 0.5)
+
+    def test_frame_rate_independent(self):
+        """Two steps of dt cover the same distance as one step of 2*dt."""
+        a = smoothing_factor(1 / 60, 0.11)
+        b = smoothing_factor(2 / 60, 0.11)
+        self.assertAlmostEqual(1 - (1 - a) ** 2, b)
+
+    def test_per_field_speeds(self):
+        """A speed dict applies a different factor to each field."""
+        state = NoonState(eye_scale=0.0, gaze_x=0.0)
+        transition_state(state, {"eye_scale": 1.0, "gaze_x": 1.0}, {"eye_scale": 0.5, "gaze_x": 0.25})
+        self.assertAlmostEqual(state.eye_scale, 0.5)
+        self.assertAlmostEqual(state.gaze_x, 0.25)
+
+    def test_non_positive_half_life_jumps(self):
+        """A half-life of zero means the value jumps straight to its target."""
+        self.assertEqual(smoothing_factor(1 / 60, 0.0), 1.0)
+
+class TestPresetMatrix(unittest.TestCase):
+    """
+    Tests blending emotion presets compiled into one target matrix.
+    """
+
+    PRESETS = {
+        "calm": {"values": {"eye_scale": 1.0, "eyelid_top": 0.0, "eyebrow_shape": "arc"}},
+        "angry": {"values": {"eye_scale": 1.2, "eyelid_top": 0.4, "eyebrow_shape": "angry"}},
+        "wide": {"values": {"eye_scale": 1.6}},
+    }
+
+    def setUp(self):
+        self.matrix = PresetMatrix(self.PRESETS)
+
+    def test_one_hot_mix_is_the_preset(self):
+        """A mix with a single emotion reproduces that preset exactly."""
+        target, dominant = self.matrix.blend(self.matrix.weights({"angry": 1.0}))
+        self.assertEqual(dominant, "angry")
+        self.assertEqual(target, self.PRESETS["angry"]["values"])
+
+    def test_numeric_fields_are_weighted_means(self):
+        """Weights are normalized; a field only averages over presets that set it."""
+        weights = self.matrix.weights({"calm": 1.5, "angry": 0.5, "wide": 2.0})
+        self.assertTrue(np.allclose(weights, [0.375, 0.125, 0.5]))
+        target, _ = self.matrix.blend(weights)
+        self.assertAlmostEqual(target["eye_scale"], 0.375 * 1.0 + 0.125 * 1.2 + 0.5 * 1.6)
+        self.assertAlmostEqual(target["eyelid_top"], 0.75 * 0.0 + 0.25 * 0.4)
+
+    def test_categorical_fields_follow_dominant_weight(self):
+        """eyebrow_shape comes from the heaviest emotion, not from a blend."""
+        target, dominant = self.matrix.blend(self.matrix.weights({"calm": 0.4, "angry": 0.6}))
+        self.assertEqual((dominant, target["eyebrow_shape"]), ("angry", "angry"))
+        target, dominant = self.matrix.blend(self.matrix.weights({"calm": 0.6, "angry": 0.4}))
+        self.assertEqual((dominant, target["eyebrow_shape"]), ("calm", "arc"))
+
+    def test_invalid_mixes_are_rejected(self):
+        with self.assertRaises(KeyError):
+            self.matrix.weights({"sleepy": 1.0})
+        with self.assertRaises(ValueError):
+            self.matrix.weights({"calm": 0.0, "angry": -1.0})
+
+if __name__ == '__main__':
+    unittest.main()
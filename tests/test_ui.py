@@ -0,0 +1,64 @@
+import unittest
+import pygame
+from noon.model import NoonState
+from noon.profiler import FrameProfiler
+from utils.ui import UIManager, TextCache
+
+class TestUIManagerCaching(unittest.TestCase):
+    """
+    Tests the cached static layer and text surfaces of the debug overlay.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+
+    def setUp(self):
+        self.screen = pygame.Surface((800, 400), 0, 32)
+        self.state = NoonState()
+        self.ui = UIManager(self.state, 800)
+
+    def test_text_cache_reuses_surfaces(self):
+        """The same string is rendered once; a changed string is rendered again."""
+        cache = TextCache()
+        first = cache.render(self.ui.font, "Eye Scale: 1.00", (200, 200, 200))
+        self.assertIs(cache.render(self.ui.font, "Eye Scale: 1.00", (200, 200, 200)), first)
+        self.assertIsNot(cache.render(self.ui.font, "Eye Scale: 1.01", (200, 200, 200)), first)
+        self.assertEqual(cache.surfaces.hits, 1)
+
+    def test_static_layer_rebuilt_only_on_change(self):
+        """The layer survives frames and value changes, and is rebuilt on press-state or size changes."""
+        self.ui.draw(self.screen, self.state)
+        layer = self.ui._static_layer
+        self.state.eye_scale = 1.2
+        self.ui.draw(self.screen, self.state)
+        self.assertIs(self.ui._static_layer, layer)
+        self.ui.buttons[0].is_pressed = True
+        self.ui.draw(self.screen, self.state)
+        self.assertIsNot(self.ui._static_layer, layer)
+        layer = self.ui._static_layer
+        self.ui.draw(pygame.Surface((640, 400), 0, 32), self.state)
+        self.assertIsNot(self.ui._static_layer, layer)
+
+    def test_buttons_match_direct_drawing(self):
+        """Buttons drawn from the cached layer look the same as buttons drawn directly."""
+        direct = pygame.Surface((800, 400), 0, 32)
+        for btn in self.ui.buttons:
+            btn.draw(direct)
+        self.ui.draw(self.screen, self.state)
+        for btn in self.ui.buttons:
+            self.assertEqual(pygame.image.tobytes(direct.subsurface(btn.rect), "RGB"),
+                             pygame.image.tobytes(self.screen.subsurface(btn.rect), "RGB"))
+
+    def test_overlay_rect_reported_after_toggle_off(self):
+        """The frame-time graph's area is returned once more after it is switched off."""
+        self.ui.profiler = FrameProfiler()
+        rects = self.ui.draw(self.screen, self.state)
+        overlay = rects[-1]
+        self.assertEqual(overlay.topleft, self.ui.profiler_overlay.position)
+        self.ui.profiler = None
+        self.assertIn(overlay, self.ui.draw(self.screen, self.state))
+        self.assertNotIn(overlay, self.ui.draw(self.screen, self.state))
+
+if __name__ == '__main__':
+    unittest.main()
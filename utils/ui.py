@@ -1,4 +1,24 @@
 import pygame
+from noon.cache import LRUCache
+from noon.profiler import ProfilerOverlay
+
+TEXT_CACHE_BYTES = 2 * 1024 * 1024 # 렌더링된 글자 Surface 캐시 상한
+STATIC_COLORKEY = (255, 0, 255)    # 정적 레이어의 투명 영역을 나타내는 색
+
+class TextCache:
+    """
+    (폰트, 문자열, 색) → font.render 결과 Surface 캐시.
+    슬라이더 값처럼 매 프레임 그리지만 거의 바뀌지 않는 글자는, 형식화한 문자열이 달라질 때만 다시 렌더링합니다.
+    """
+    def __init__(self, max_bytes: int = TEXT_CACHE_BYTES):
+        self.surfaces = LRUCache(max_bytes, lambda surface: surface.get_pitch() * surface.get_height())
+
+    def render(self, font, text: str, color) -> pygame.Surface:
+        key = (font, text, color)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = self.surfaces.put(key, font.render(text, True, color))
+        return surface
 
 class Button:
     """ 클릭 가능한 UI 버튼 """
@@ -49,19 +69,30 @@ class SimpleSlider:
             new_val = self.min_val + (ratio * (self.max_val - self.min_val))
             setattr(state_obj, self.attr_name, new_val)
 
-    def draw(self, screen, state_obj):
+    def draw(self, screen, state_obj, text_cache: TextCache | None = None):
+        self.draw_frame(screen)
+        self.draw_value(screen, state_obj, text_cache)
+
+    def draw_frame(self, screen):
+        """ 값과 무관한 배경과 테두리를 그립니다. (UIManager는 정적 레이어에 한 번만 그립니다) """
+        pygame.draw.rect(screen, (50, 50, 50), self.rect)
+        pygame.draw.rect(screen, (150, 150, 150), self.rect, 1)
+
+    def draw_value(self, screen, state_obj, text_cache: TextCache | None = None):
+        """ 현재 값의 채움 막대와 글자를 그리고, 그린 영역을 반환합니다. 막대는 테두리 안쪽에만 그려 테두리를 덮지 않습니다. """
         val = getattr(state_obj, self.attr_name)
         ratio = (val - self.min_val) / (self.max_val - self.min_val)
-        
-        # Style
-        pygame.draw.rect(screen, (50, 50, 50), self.rect)
-        fill_rect = pygame.Rect(self.rect.x, self.rect.y, self.rect.w * ratio, self.rect.height)
+        inner = self.rect.inflate(-2, -2)
+        fill_rect = pygame.Rect(inner.x, inner.y, inner.w * max(0.0, min(1.0, ratio)), inner.height)
         pygame.draw.rect(screen, (100, 180, 255), fill_rect)
-        pygame.draw.rect(screen, (150, 150, 150), self.rect, 1)
-        
+
         # Text
         text = f"{self.label}: {val:.2f}"
-        screen.blit(self.font.render(text, True, (200,200,200)), (self.rect.x, self.rect.y-18))
+        if text_cache is None:
+            text_surf = self.font.render(text, True, (200,200,200))
+        else:
+            text_surf = text_cache.render(self.font, text, (200,200,200))
+        return self.rect.union(screen.blit(text_surf, (self.rect.x, self.rect.y-18)))
 
 class UIManager:
     """UI 컴포넌트들을 종합적으로 관리하는 클래스"""
@@ -82,6 +113,15 @@ class UIManager:
             SimpleSlider(20, 220, 150, 15, 0.5, 2.0, "Highlight Size", "highlight_scale"),
         ]
         self.font = pygame.font.SysFont("Arial", 12)
+        # 버튼과 슬라이더 틀은 하나의 정적 레이어에 미리 그려두고, 화면 크기나 버튼 눌림 상태가 바뀔 때만 다시 만듭니다.
+        self.text_cache = TextCache()
+        self._static_layer = None
+        self._static_key = None
+        self._static_bounds = None
+        # 프레임 시간 그래프 (profiler에 noon.profiler.FrameProfiler를 지정하면 표시)
+        self.profiler = None
+        self.profiler_overlay = ProfilerOverlay(position=(width - 248, 100))
+        self._overlay_rect = None # 마지막으로 그래프를 그린 영역 (끈 뒤 한 번 더 반환하여 지워진 화면이 반영되게 함)
 
     def handle_event(self, event, state):
         for btn in self.buttons:
@@ -108,11 +148,43 @@ class UIManager:
         for s in self.sliders:
             s.is_modified = False
 
-    def draw(self, screen, state):
+    def _update_static_layer(self, screen):
+        """ 화면 크기나 버튼 눌림 상태가 바뀌었으면 정적 레이어를 다시 그립니다. """
+        key = (screen.get_size(), tuple(btn.is_pressed for btn in self.buttons))
+        if key == self._static_key:
+            return
+        # 화면과 같은 픽셀 형식으로 만들어 블릿할 때 변환이 없게 합니다.
+        layer = pygame.Surface(screen.get_size(), 0, screen)
+        layer.fill(STATIC_COLORKEY)
         for btn in self.buttons:
-            btn.draw(screen)
+            btn.draw(layer)
         for s in self.sliders:
-            s.draw(screen, state)
-        
+            s.draw_frame(layer)
+        # 그리기를 마친 뒤 colorkey를 지정해야 RLE 가속이 유지됩니다.
+        layer.set_colorkey(STATIC_COLORKEY, pygame.RLEACCEL)
+        rects = [btn.rect for btn in self.buttons] + [s.rect for s in self.sliders]
+        self._static_bounds = rects[0].unionall(rects[1:]).clip(layer.get_rect()) if rects else pygame.Rect(0, 0, 0, 0)
+        self._static_layer = layer
+        self._static_key = key
+
+    def draw(self, screen, state) -> list[pygame.Rect]:
+        """
+        버튼, 슬라이더, 디버그 글자와 프레임 시간 그래프를 screen에 그리고, 그린 영역 목록을 반환합니다.
+        그래프를 끈(profiler = None) 뒤 첫 프레임에는 그래프가 있던 영역도 포함하므로,
+        변경된 영역만 화면에 반영하는 호출자도 그 자리를 다시 그린 화면으로 갱신할 수 있습니다.
+        """
+        self._update_static_layer(screen)
+        screen.blit(self._static_layer, self._static_bounds, self._static_bounds)
+        rects = [self._static_bounds.copy()]
+        for s in self.sliders:
+            rects.append(s.draw_value(screen, state, self.text_cache))
+
         debug_text = f"Gaze(x,y): ({state.gaze_x:.2f}, {state.gaze_y:.2f})"
-        screen.blit(self.font.render(debug_text, True, (150,150,150)), (20, screen.get_height() - 20))
\ No newline at end of file
+        rects.append(screen.blit(self.text_cache.render(self.font, debug_text, (150,150,150)), (20, screen.get_height() - 20)))
+        if self.profiler is not None:
+            self._overlay_rect = self.profiler_overlay.draw(screen, self.profiler)
+            rects.append(self._overlay_rect)
+        elif self._overlay_rect is not None:
+            rects.append(self._overlay_rect)
+            self._overlay_rect = None
+        return rects